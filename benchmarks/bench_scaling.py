@@ -0,0 +1,246 @@
+"""
+Benchmark de montée en charge : temps et pic mémoire par phase.
+
+Génère des rapports synthétiques (`pbir_tools.synthetic`) de taille croissante
+le long d'un axe (pages, visuels, groupes ou bookmarks), les autres paramètres
+restant à leur valeur de base, et mesure chaque phase :
+
+- generate : construction des fichiers en mémoire
+- write : écriture dans le stockage (dossier temporaire ou mémoire)
+- load : chargement du rapport (`PbirProject`, index des chemins)
+- visuals : `duplicate_visuals` de la page source vers toutes les pages
+- bookmarks : `duplicate_bookmark` (copies, orphelins, liens)
+- save : plan et application des changements
+- resync : deuxième passe complète (rapport déjà synchronisé)
+
+Les résultats sont enregistrés en JSON pour comparer deux versions :
+
+    python benchmarks/bench_scaling.py --output base.json
+    python benchmarks/bench_scaling.py --compare base.json --threshold 1.25
+
+La comparaison retourne le code 1 si une phase est plus lente que la
+référence d'un facteur supérieur au seuil.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pbir_tools  # noqa: E402
+from pbir_tools import codec  # noqa: E402
+from pbir_tools.bookmarks import duplicate_bookmark  # noqa: E402
+from pbir_tools.events import make_emitter  # noqa: E402
+from pbir_tools.project import PbirProject  # noqa: E402
+from pbir_tools.storage import DirectoryStorage, MemoryStorage  # noqa: E402
+from pbir_tools.synthetic import build_report  # noqa: E402
+from pbir_tools.visuals import duplicate_visuals  # noqa: E402
+
+SCHEMA = 1
+REPORT = "Synthetic.Report"
+BASE = {"pages": 20, "visuals": 20, "groups": 2, "bookmarks": 5}
+AXES = {
+    "pages": [10, 50, 100, 200],
+    "visuals": [10, 50, 100, 200],
+    "groups": [0, 5, 10, 20],
+    "bookmarks": [0, 10, 25, 50],
+}
+QUICK_AXES = {
+    "pages": [5, 20],
+    "visuals": [5, 20],
+    "groups": [0, 4],
+    "bookmarks": [0, 10],
+}
+PHASES = ("generate", "write", "load", "visuals", "bookmarks", "save", "resync")
+
+
+class Recorder:
+    """Mesure chaque phase : durée (perf_counter) ou pic mémoire (tracemalloc)."""
+
+    def __init__(self, memory):
+        self.memory = memory
+        self.results = {}
+
+    def measure(self, phase, func, *args):
+        if self.memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            result = func(*args)
+            self.results[phase] = tracemalloc.get_traced_memory()[1] - base
+        else:
+            start = time.perf_counter()
+            result = func(*args)
+            self.results[phase] = time.perf_counter() - start
+        return result
+
+
+def sync(project):
+    """Visuels puis bookmarks de la page source vers toutes les pages, puis sauvegarde."""
+    events = make_emitter(quiet=True)
+    duplicate_visuals(project, "main", events=events)
+    duplicate_bookmark(project, "main", events=events)
+    stats = project.apply(project.plan())
+    project.close()
+    return stats
+
+
+def run_once(params, storage_kind, memory):
+    """Une exécution de toutes les phases ; {phase: mesure}."""
+    recorder = Recorder(memory)
+    events = make_emitter(quiet=True)
+    folder = tempfile.mkdtemp(prefix="pbir_bench_") if storage_kind == "dir" else None
+    try:
+        files = recorder.measure("generate", lambda: build_report(**params))
+        storage = DirectoryStorage(folder) if folder else MemoryStorage()
+        recorder.measure("write", storage.commit, files, ())
+        del files
+
+        project = recorder.measure("load", PbirProject, storage, REPORT)
+        recorder.measure("visuals", lambda: duplicate_visuals(project, "main", events=events))
+        recorder.measure("bookmarks", lambda: duplicate_bookmark(project, "main", events=events))
+        recorder.measure("save", lambda: project.apply(project.plan()))
+        project.close()
+
+        recorder.measure("resync", lambda: sync(PbirProject(storage, REPORT)))
+    finally:
+        if folder:
+            shutil.rmtree(folder, ignore_errors=True)
+    return recorder.results
+
+
+def run_point(axis, value, storage_kind, repeat):
+    """Mesures d'un point de la courbe : meilleur temps sur `repeat` exécutions, pic mémoire."""
+    params = dict(BASE, **{axis: value})
+    files = build_report(**params)
+
+    timings = [run_once(params, storage_kind, memory=False) for _ in range(repeat)]
+    tracemalloc.start()
+    try:
+        peaks = run_once(params, storage_kind, memory=True)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "axis": axis,
+        "params": params,
+        "files": len(files),
+        "bytes": sum(len(content) for content in files.values()),
+        "phases": {
+            phase: {"seconds": round(min(t[phase] for t in timings), 6), "peak_bytes": peaks[phase]}
+            for phase in PHASES
+        },
+    }
+
+
+def git_commit():
+    """Commit courant du dépôt, ou None hors dépôt git."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment(args):
+    return {
+        "schema": SCHEMA,
+        "pbir_tools": pbir_tools.__version__,
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "json_backend": codec.get_backend(),
+        "storage": args.storage,
+        "repeat": args.repeat,
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def compare(results, baseline, threshold, min_seconds=0.001):
+    """
+    Compare les temps aux mesures de référence (mêmes axe et paramètres).
+
+    Les phases plus courtes que `min_seconds` dans la référence sont ignorées
+    (bruit de mesure).
+
+    Returns:
+        list: Régressions (axe, valeur, phase, ratio) au-delà du seuil
+    """
+    reference = {
+        (point["axis"], json.dumps(point["params"], sort_keys=True)): point["phases"]
+        for point in baseline["results"]
+    }
+    regressions = []
+    print(f"\n{'axe':<10} {'valeur':>6} {'phase':<10} {'réf. (s)':>10} {'actuel (s)':>10} {'ratio':>7}")
+    for point in results:
+        phases = reference.get((point["axis"], json.dumps(point["params"], sort_keys=True)))
+        if phases is None:
+            continue
+        value = point["params"][point["axis"]]
+        for phase, measure in point["phases"].items():
+            before = phases.get(phase, {}).get("seconds")
+            if not before or before < min_seconds:
+                continue
+            ratio = measure["seconds"] / before
+            flag = " ⚠️" if ratio > threshold else ""
+            print(f"{point['axis']:<10} {value:>6} {phase:<10} {before:>10.4f} {measure['seconds']:>10.4f} {ratio:>7.2f}{flag}")
+            if ratio > threshold:
+                regressions.append((point["axis"], value, phase, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de montée en charge de pbir_tools")
+    parser.add_argument("--axis", action="append", choices=sorted(AXES),
+                        help="Axe mesuré (répétable ; défaut : tous)")
+    parser.add_argument("--storage", choices=("dir", "memory"), default="dir",
+                        help="Stockage du rapport : dossier temporaire ou mémoire (défaut : dir)")
+    parser.add_argument("--repeat", type=int, default=3, help="Exécutions par point, meilleur temps retenu")
+    parser.add_argument("--quick", action="store_true", help="Petites tailles (vérification rapide)")
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    parser.add_argument("--compare", metavar="BASELINE", help="Fichier JSON de référence")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Ratio de temps au-delà duquel une phase est en régression (défaut : 1.25)")
+    args = parser.parse_args(argv)
+
+    axes = QUICK_AXES if args.quick else AXES
+    results = []
+    for axis in args.axis or list(axes):
+        for value in axes[axis]:
+            point = run_point(axis, value, args.storage, max(1, args.repeat))
+            results.append(point)
+            total = sum(measure["seconds"] for measure in point["phases"].values())
+            peak = max(measure["peak_bytes"] for measure in point["phases"].values())
+            print(f"📏 {axis}={value:<5} {point['files']:>6} fichiers  {total:8.3f} s  pic {peak / 1e6:7.1f} Mo")
+
+    report = {"environment": environment(args), "results": results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"💾 Résultats enregistrés : {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline["environment"].get("storage") != args.storage:
+            print(f"⚠️ Référence mesurée avec le stockage {baseline['environment'].get('storage')!r}")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} phase(s) en régression (seuil x{args.threshold})")
+            return 1
+        print("\n✅ Aucune régression")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,9 +5,13 @@ Ce package fournit des outils pour manipuler et automatiser des rapports Power B
 au format PBIR (Power BI Project format).
 
 Fonctionnalités principales:
-- Création de fichiers PBIR vides
+- Création de fichiers PBIR vides (un ou plusieurs centaines à la fois)
 - Duplication de visuels entre pages
 - Gestion des bookmarks
+- Sessions : plusieurs opérations sur un seul chargement du rapport
+- Surveillance : propagation continue des modifications de la page source
+- Flotte : mêmes opérations sur de nombreux rapports, en parallèle
+- Stockages : dossier, archive .zip, mémoire ou superposition lecture / écriture
 
 Example:
     >>> from pbir_tools import pbir_empty_file, pbir_duplicate_visuals
@@ -15,15 +19,77 @@ Example:
     >>> pbir_duplicate_visuals("/path/to/pbir", "Report", "main", ["page2"])
 """
 
-from .empty_file import pbir_empty_file
-from .visuals import pbir_duplicate_visuals
-from .bookmarks import pbir_duplicate_bookmark
+import importlib
+
+# Équivalent de typing.TYPE_CHECKING, sans importer typing au démarrage
+TYPE_CHECKING = False
+
+# Nom public -> module qui le définit : les modules ne sont importés qu'au
+# premier accès (`pbir_tools.pbir_duplicate_bookmark` ne charge pas empty_file)
+_EXPORTS = {
+    "pbir_empty_file": "empty_file",
+    "pbir_empty_files": "empty_file",
+    "pbir_duplicate_visuals": "visuals",
+    "pbir_duplicate_bookmark": "bookmarks",
+    "PbirProject": "project",
+    "PbirSession": "session",
+    "pbir_watch": "watch",
+    "pbir_fleet": "fleet",
+    "EventEmitter": "events",
+    "PbirEvent": "events",
+    "DirectoryStorage": "storage",
+    "MemoryStorage": "storage",
+    "OverlayStorage": "storage",
+    "ArchiveStorage": "archive",
+}
+
+if TYPE_CHECKING:  # pragma: no cover - pour les IDE et les vérificateurs de types
+    from .empty_file import pbir_empty_file, pbir_empty_files
+    from .visuals import pbir_duplicate_visuals
+    from .bookmarks import pbir_duplicate_bookmark
+    from .project import PbirProject
+    from .session import PbirSession
+    from .watch import pbir_watch
+    from .fleet import pbir_fleet
+    from .events import EventEmitter, PbirEvent
+    from .storage import DirectoryStorage, MemoryStorage, OverlayStorage
+    from .archive import ArchiveStorage
 
 __version__ = "1.0.0"
 __author__ = "DIOUET"
 
 __all__ = [
     "pbir_empty_file",
+    "pbir_empty_files",
     "pbir_duplicate_visuals",
-    "pbir_duplicate_bookmark"
+    "pbir_duplicate_bookmark",
+    "PbirProject",
+    "PbirSession",
+    "pbir_watch",
+    "pbir_fleet",
+    "EventEmitter",
+    "PbirEvent",
+    "DirectoryStorage",
+    "MemoryStorage",
+    "OverlayStorage",
+    "ArchiveStorage",
 ]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+        globals()[name] = value  # les accès suivants ne passent plus par __getattr__
+        return value
+    if not name.startswith("_"):
+        # Sous-module (ex: pbir_tools.codec)
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
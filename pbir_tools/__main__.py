@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""Exécution de la CLI avec `python -m pbir_tools`."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+Rapports PBIR dans une archive .zip (artefacts de CI, sauvegardes).
+
+Une archive se lit sans extraction : seul son répertoire central est lu à
+l'ouverture, puis chaque membre n'est décompressé qu'au premier accès.
+
+Une archive ne se modifie pas sur place : la sauvegarde écrit une nouvelle
+archive à côté de l'ancienne puis la remplace. Les membres inchangés y sont
+recopiés octet pour octet, sans être décompressés ni recompressés : seuls les
+fichiers créés ou modifiés passent par zlib.
+"""
+
+import os
+import copy
+import shutil
+import time
+import tempfile
+import zipfile
+
+from .storage import Storage
+
+# Bit 3 des drapeaux : CRC et tailles écrits après les données (descripteur)
+_DATA_DESCRIPTOR = 0x08
+_ENCRYPTED = 0x01
+_LOCAL_HEADER_SIZE = 30
+
+
+def is_archive(path):
+    """Retourne True si `path` est un fichier .zip (et non un dossier PBIR)."""
+    return os.path.isfile(path) and zipfile.is_zipfile(path)
+
+
+def archive_reports(path):
+    """
+    Rapports contenus dans une archive : chemins des dossiers `*.Report`.
+
+    Un rapport peut être à la racine de l'archive ("Report1.Report") ou dans
+    un sous-dossier ("Projet/Report1.Report").
+    """
+    reports = {}
+    with zipfile.ZipFile(path) as archive:
+        for name in archive.namelist():
+            parts = name.split("/")
+            for i, part in enumerate(parts[:-1]):
+                if part.endswith(".Report"):
+                    reports["/".join(parts[:i + 1])] = None
+                    break
+    return list(reports)
+
+
+class ArchiveStorage(Storage):
+    """
+    Archive .zip ouverte en lecture, réécrite en une fois à la sauvegarde (`commit`).
+
+    Les membres sont désignés par leur nom dans l'archive ("/" comme séparateur),
+    qui est aussi leur chemin relatif dans `PbirProject`. `write` et `delete`
+    réécrivent chacun l'archive : grouper les changements avec `commit`.
+
+    Args:
+        path: Chemin du fichier .zip
+
+    Example:
+        >>> archive = ArchiveStorage("backup.zip")
+        >>> page = archive.read("Report1.Report/definition/pages/main/page.json")
+        >>> archive.commit({"Report1.Report/definition/report.json": b"{}"}, deletes=())
+        >>> archive.close()
+    """
+
+    # Un seul `ZipFile` partagé : les lectures sont faites en série (`zipfile`
+    # ne garantit pas les lectures simultanées sur un même objet)
+    concurrent = False
+
+    def __init__(self, path):
+        self.path = path
+        self._open()
+
+    def _open(self):
+        self._zip = zipfile.ZipFile(self.path)
+        self._entries = self._zip.infolist()  # membres et entrées de dossiers, dans l'ordre
+        self.members = {info.filename: info for info in self._entries if not info.is_dir()}
+
+    def list(self, folder=""):
+        """Noms des membres sous `folder`, dans l'ordre de l'archive."""
+        prefix = folder.strip("/") + "/" if folder.strip("/") else ""
+        return [name for name in self.members if name.startswith(prefix)]
+
+    def _info(self, name):
+        try:
+            return self.members[name]
+        except KeyError:
+            raise FileNotFoundError(f"{self.path}: {name}") from None
+
+    def read(self, name):
+        """Contenu décompressé d'un membre."""
+        return self._zip.read(self._info(name))
+
+    def stat(self, name):
+        """(taille, CRC32) d'un membre, sans le décompresser : le CRC tient lieu de mtime."""
+        info = self._info(name)
+        return info.file_size, info.CRC
+
+    def write(self, name, content):
+        self.commit({name: content}, ())
+
+    def delete(self, name):
+        if name in self.members:
+            self.commit({}, (name,))
+
+    def commit(self, writes, deletes):
+        """
+        Remplace l'archive par une copie contenant les écritures et sans les suppressions.
+
+        Les membres et les entrées de dossiers conservent leur ordre ; les
+        nouveaux membres sont ajoutés à la fin.
+        L'ancienne archive n'est remplacée qu'une fois la nouvelle entièrement
+        écrite (`os.replace`).
+
+        Args:
+            writes: {nom: contenu bytes} des membres créés ou modifiés
+            deletes: Noms des membres à supprimer
+        """
+        deletes = set(deletes)
+        folder = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(suffix=".zip.tmp", dir=folder)
+        os.close(fd)
+        now = time.localtime()[:6]
+        try:
+            with open(self.path, "rb") as source, zipfile.ZipFile(temp_path, "w") as target:
+                for info in self._entries:
+                    name = info.filename
+                    if name in deletes:
+                        continue
+                    if name in writes:
+                        _write_member(target, name, writes[name], now, info.compress_type)
+                    else:
+                        _copy_member(source, info, target)
+                for name, content in writes.items():
+                    if name not in self.members:
+                        _write_member(target, name, content, now, zipfile.ZIP_DEFLATED)
+            # mkstemp crée le fichier en 0600 : l'archive garde les droits de l'original
+            shutil.copymode(self.path, temp_path)
+            # Sous Windows, un fichier ouvert ne peut pas être remplacé
+            self._zip.close()
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        finally:
+            if self._zip.fp is None:
+                self._open()
+
+    def close(self):
+        self._zip.close()
+
+    def __repr__(self):
+        return f"ArchiveStorage({self.path!r})"
+
+
+def _write_member(target, name, content, date_time, compress_type):
+    info = zipfile.ZipInfo(name, date_time)
+    info.compress_type = compress_type
+    info.external_attr = 0o644 << 16
+    target.writestr(info, content)
+
+
+def _copy_member(source, info, target):
+    """
+    Recopie un membre compressé tel quel (en-tête local réécrit, données brutes).
+
+    `zipfile` ne propose pas de copie brute : l'en-tête et les données sont
+    écrits directement dans le fichier de `target`, puis le membre est déclaré
+    à son répertoire central, comme le fait `ZipFile.writestr`.
+    """
+    if info.flag_bits & _ENCRYPTED:
+        raise ValueError(f"❌ Membre chiffré non pris en charge : {info.filename}")
+
+    source.seek(info.header_offset)
+    header = source.read(_LOCAL_HEADER_SIZE)
+    if header[:4] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"En-tête local invalide : {info.filename}")
+    name_length = int.from_bytes(header[26:28], "little")
+    extra_length = int.from_bytes(header[28:30], "little")
+    source.seek(info.header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length)
+
+    copied = copy.copy(info)
+    # CRC et tailles sont connus : écrits dans l'en-tête, sans descripteur de données
+    copied.flag_bits &= ~_DATA_DESCRIPTOR
+    copied.header_offset = target.fp.tell()
+    target.fp.write(copied.FileHeader())
+    remaining = info.compress_size
+    while remaining:
+        chunk = source.read(min(remaining, 1 << 20))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Membre tronqué : {info.filename}")
+        target.fp.write(chunk)
+        remaining -= len(chunk)
+
+    target.filelist.append(copied)
+    target.NameToInfo[copied.filename] = copied
+    target.start_dir = target.fp.tell()
+    target._didModify = True
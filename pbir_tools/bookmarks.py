@@ -1,132 +1,275 @@
 # -*- coding: utf-8 -*-
 import os
-import json
-import copy
 
-def pbir_duplicate_bookmark(
-    pbir_folder_path,
-    report_root_name,
+from . import codec
+from .project import PbirProject
+from .events import make_emitter
+
+
+def split_copy_name(fname, pages):
+    """
+    Interprète un nom de bookmark comme copie "<bookmark source>_<page>".
+
+    Args:
+        fname: Nom du fichier sans ".bookmark.json"
+        pages: Ensemble des identifiants de pages possibles
+
+    Returns:
+        list: Couples (bookmark source, page) possibles, du plus court au plus long bookmark source
+    """
+    copies = []
+    i = fname.find("_")
+    while i != -1:
+        if fname[i + 1:] in pages:
+            copies.append((fname[:i], fname[i + 1:]))
+        i = fname.find("_", i + 1)
+    return copies
+
+class BookmarkTemplate:
+    """
+    Modèle des copies d'un bookmark source.
+
+    Une copie ne diffère de la source que par `name`, `displayName`,
+    `explorationState.activeSection` et la clé de la section de la page source :
+    les copies partagent tout le reste avec la source (pas de `deepcopy`) et sont
+    sérialisées à partir d'un modèle d'octets pré-encodé, compilé une fois par
+    mise en forme.
+
+    Args:
+        b_id: Nom du bookmark source
+        b_data: Contenu JSON du bookmark source (jamais modifié)
+        source_page_id: Identifiant de la page source
+        source_format: `JsonFormat` du fichier source (repris par les copies créées)
+    """
+
+    def __init__(self, b_id, b_data, source_page_id, source_format):
+        self.b_data = b_data
+        self.source_page_id = source_page_id
+        self.source_format = source_format
+        self.display_suffix = b_data.get("displayName", b_id)
+        self.section_keys = set(b_data["explorationState"].get("sections", {}))
+        self._compiled = {}  # JsonFormat -> JsonTemplate
+
+    def build(self, p_id, new_name, display_name):
+        """Copie pour la page `p_id`, les sous-objets inchangés étant partagés avec la source."""
+        new_bk = dict(self.b_data)
+        new_bk["name"] = new_name
+        new_bk["displayName"] = display_name
+        new_bk["explorationState"] = state = dict(self.b_data["explorationState"])
+        state["activeSection"] = p_id
+        if self.source_page_id in state.get("sections", {}):
+            state["sections"] = sections = dict(state["sections"])
+            sections[p_id] = sections.pop(self.source_page_id)
+        return new_bk
+
+    def render(self, p_id, new_name, display_name, fmt):
+        """
+        Copie sérialisée dans la mise en forme `fmt`.
+
+        Retourne None si le modèle ne s'applique pas (identifiant de page non
+        textuel, ou déjà présent comme clé de section) : utiliser `build`.
+        """
+        if not isinstance(p_id, str) or p_id in self.section_keys:
+            return None
+        template = self._compiled.get(fmt)
+        if template is None:
+            slots = self.build(codec.slot("page"), codec.slot("name"), codec.slot("display"))
+            template = self._compiled[fmt] = codec.JsonTemplate(slots, fmt)
+        return template.render(page=p_id, name=new_name, display=display_name)
+
+
+def duplicate_bookmark(
+    project,
     source_page_name="main",
     target_pages=None,
-    bookmark_name=None
+    bookmark_name=None,
+    events=None
 ):
     """
-    Duplique, modifie et synchronise (avec suppression) les bookmarks.
+    Duplique, modifie et synchronise (avec suppression) les bookmarks d'un projet déjà chargé.
+    Les modifications restent en mémoire dans `project`.
     """
+    events = make_emitter(events)
 
     def safe_json_load(raw, path):
         if raw is None: return None
         try:
-            return json.loads(raw.decode("utf-8") if isinstance(raw, bytes) else raw)
+            return codec.loads(raw)
         except: return None
 
-    # --- 1. Chargement des fichiers ---
-    files_dict = {}
-    for root, _, files in os.walk(pbir_folder_path):
-        for file in files:
-            full_path = os.path.join(root, file)
-            rel_path = os.path.relpath(full_path, pbir_folder_path).replace("\\", "/")
-            with open(full_path, "rb") as f:
-                files_dict[rel_path] = f.read()
-
-    pages_root = f"{report_root_name}/definition/pages/"
-    bookmarks_root = f"{report_root_name}/definition/bookmarks/"
+    pages_root = project.pages_prefix
+    bookmarks_root = project.bookmarks_prefix
 
     # --- 2. Page source ---
     source_page_path = f"{pages_root}{source_page_name}/page.json"
-    source_page = safe_json_load(files_dict.get(source_page_path), source_page_path)
+    source_page = safe_json_load(project.get(source_page_path), source_page_path)
     source_page_id = source_page["name"]
 
+    # Lecture groupée des pages, des bookmarks et des visuels source
+    # (avec un cache de métadonnées, seuls les fichiers modifiés sont lus)
+    page_names = project.page_names()
+    if project.cache is None:
+        project.prefetch(
+            [project.page_json_path(page) for page in page_names]
+            + project.bookmark_paths()
+            + list(project.page_visuals(source_page_name).values())
+        )
+
+    def safe_metadata(path):
+        try:
+            return project.metadata(path)
+        except Exception:
+            return None
+
     # --- 3. Pages cibles ---
     pages_to_sync = []
     page_display_names = {}
-    for path, content in files_dict.items():
-        if path.startswith(pages_root) and path.endswith("page.json"):
-            p_data = safe_json_load(content, path)
-            p_id = p_data["name"]
-            if p_id != source_page_id and (target_pages is None or p_id in target_pages):
-                pages_to_sync.append(p_id)
-                page_display_names[p_id] = p_data.get("displayName", p_id)
+    for page in page_names:
+        p_meta = safe_metadata(project.page_json_path(page))
+        p_id = p_meta["name"]
+        if p_id != source_page_id and (target_pages is None or p_id in target_pages):
+            pages_to_sync.append(p_id)
+            page_display_names[p_id] = p_meta.get("displayName", p_id)
 
     # --- 4. Bookmarks source valides ---
     source_bookmarks = {}
+    source_bookmark_paths = {}
+    source_page_bookmarks = {}  # tous les bookmarks de la page source (filtre ignoré) : nom -> chemin
     
     # On normalise bookmark_name en liste pour faciliter la comparaison
     filter_names = [bookmark_name] if isinstance(bookmark_name, str) else bookmark_name
 
-    for path, content in files_dict.items():
-        if path.startswith(bookmarks_root) and path.endswith(".json"):
-            bk = safe_json_load(content, path)
-            if bk:
+    for path in project.bookmark_paths():
+        if path.endswith(".json"):
+            bk_meta = safe_metadata(path)
+            if bk_meta:
                 # Vérifie si le bookmark appartient à la page source
-                is_on_source_page = bk.get("explorationState", {}).get("activeSection") == source_page_id
-                b_id = bk.get("name")
+                is_on_source_page = bk_meta["activeSection"] == source_page_id
+                b_id = bk_meta["name"]
 
                 if is_on_source_page:
+                    source_page_bookmarks[b_id] = path
                     if bookmark_name is None or b_id in filter_names:
-                        source_bookmarks[b_id] = bk
+                        source_bookmarks[b_id] = safe_json_load(project[path], path)
+                        source_bookmark_paths[b_id] = path
                         
 
+    # Index inverse : visuel de la page source -> bookmark source vers lequel il pointe
+    vis_mapping = {}
+    for v_id, path in project.page_visuals(source_page_name).items():
+        for val in project.metadata(path)["bookmarkLinks"]:
+            val = val.strip("'")
+            if val in source_bookmarks:
+                vis_mapping[v_id] = val
+
     # --- 5. SYNCHRONISATION (MAJ + SUPPRESSION) ---
-    existing_bk_paths = [p for p in files_dict.keys() if p.startswith(bookmarks_root)]
+    # A. Nettoyage des orphelins (Suppression) : une passe sur les bookmarks existants,
+    # chaque copie "<bookmark source>_<page>" étant reconnue par ses pages possibles
+    pages_set = set(pages_to_sync)
+    source_paths_set = set(source_page_bookmarks.values())
+    for path in project.bookmark_paths():
+        if path in source_paths_set:
+            continue
+        fname = os.path.basename(path).replace(".bookmark.json", "")
+        copies = split_copy_name(fname, pages_set)
+        # Orphelin : copie d'une page synchronisée dont le bookmark source n'existe plus
+        if copies and not any(b_id in source_page_bookmarks for b_id, _ in copies):
+            events.info("bookmark_orphan_deleted", "🗑️ Orphelin supprimé : {name}", name=fname, page=copies[0][1])
+            # Suppression physique différée à la sauvegarde
+            del project[path]
 
+    templates = {
+        b_id: BookmarkTemplate(
+            b_id, b_data, source_page_id, codec.detect_format(project[source_bookmark_paths[b_id]])
+        )
+        for b_id, b_data in source_bookmarks.items()
+    }
     for p_id in pages_to_sync:
         display_name = page_display_names[p_id]
-        expected_names = [f"{b_id}_{p_id}" for b_id in source_bookmarks.keys()]
-
-        # A. Nettoyage des orphelins (Suppression)
-        for path in existing_bk_paths:
-            fname = os.path.basename(path).replace(".bookmark.json", "")
-            # Si le fichier appartient à cette page mais n'est plus dans la source
-            if fname.endswith(f"_{p_id}") and fname not in expected_names:
-                print(f"🗑️ Orphelin supprimé : {fname}")
-                del files_dict[path]
-                # Suppression physique si le fichier existe
-                full_p = os.path.join(pbir_folder_path, path)
-                if os.path.exists(full_p): os.remove(full_p)
 
         # B. Création / Modification
-        for b_id, b_data in source_bookmarks.items():
+        for b_id, template in templates.items():
             new_name = f"{b_id}_{p_id}"
             new_path = f"{bookmarks_root}{new_name}.bookmark.json"
-            
-            new_bk = copy.deepcopy(b_data)
-            new_bk["name"] = new_name
-            new_bk["displayName"] = f"{display_name}_{b_data.get('displayName', b_id)}"
-            new_bk["explorationState"]["activeSection"] = p_id
-
-            sections = new_bk["explorationState"].get("sections", {})
-            if source_page_id in sections:
-                sections[p_id] = sections.pop(source_page_id)
+            new_display = f"{display_name}_{template.display_suffix}"
 
-            files_dict[new_path] = json.dumps(new_bk, indent=2).encode("utf-8")
+            # Fichier existant : mise en forme conservée ; nouveau : celle du bookmark source
+            existing = project[new_path] if new_path in project else None
+            fmt = template.source_format if existing is None else codec.detect_format(existing)
+            content = template.render(p_id, new_name, new_display, fmt)
+            if content is None:
+                content = codec.dumps(template.build(p_id, new_name, new_display), fmt)
+            if existing is not None and content != existing:
+                # Octets différents : contenu sémantiquement identique (ordre des clés...) ?
+                content, _ = codec.dumps_like(template.build(p_id, new_name, new_display), existing, content)
+            project.set_json(new_path, None, content)
+            events.debug("bookmark_written", "Bookmark {name} -> page {page}", name=new_name, page=p_id)
 
     # --- 6. Réaffectation Visuels ---
-    vis_mapping = {}
-    source_vis_prefix = f"{pages_root}{source_page_name}/visuals/"
-    for path, content in files_dict.items():
-        if path.startswith(source_vis_prefix) and path.endswith("visual.json"):
-            v_id = path.split("/")[-2]
-            vis = safe_json_load(content, path)
-            for link in vis.get("visual", {}).get("visualContainerObjects", {}).get("visualLink", []):
-                val = link.get("properties", {}).get("bookmark", {}).get("expr", {}).get("Literal", {}).get("Value", "").strip("'")
-                if val in source_bookmarks:
-                    vis_mapping[v_id] = val
-
+    # Seuls les visuels cibles dont un lien ne pointe pas déjà vers la copie
+    # de leur page sont relus et réécrits
+    linked_targets = []
     for p_id in pages_to_sync:
+        page_visuals = project.page_visuals(p_id)
         for v_id, b_id_src in vis_mapping.items():
-            target_v_path = f"{pages_root}{p_id}/visuals/{v_id}/visual.json"
-            if target_v_path in files_dict:
-                v_json = safe_json_load(files_dict[target_v_path], target_v_path)
-                for link in v_json.get("visual", {}).get("visualContainerObjects", {}).get("visualLink", []):
-                    link["properties"]["bookmark"]["expr"]["Literal"]["Value"] = f"'{b_id_src}_{p_id}'"
-                files_dict[target_v_path] = json.dumps(v_json, indent=2).encode("utf-8")
-
-    # --- 7. Sauvegarde ---
-    for rel_path, content in files_dict.items():
-        full_path = os.path.join(pbir_folder_path, rel_path)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        with open(full_path, "wb") as f:
-            f.write(content)
-
-    print("🎉 Synchronisation des bookmarks terminée.")
\ No newline at end of file
+            target_v_path = page_visuals.get(v_id)
+            if target_v_path is not None:
+                linked_targets.append((p_id, v_id, b_id_src, target_v_path))
+    if project.cache is None:
+        project.prefetch([path for _, _, _, path in linked_targets])
+
+    for p_id, v_id, b_id_src, target_v_path in linked_targets:
+        expected = f"'{b_id_src}_{p_id}'"
+        if all(val == expected for val in project.metadata(target_v_path)["bookmarkLinks"]):
+            continue
+        v_json = safe_json_load(project[target_v_path], target_v_path)
+        for link in v_json.get("visual", {}).get("visualContainerObjects", {}).get("visualLink", []):
+            link["properties"]["bookmark"]["expr"]["Literal"]["Value"] = expected
+        project.set_json(target_v_path, v_json)
+        events.debug("visual_link_updated", "Lien {vis_id} -> {bookmark}", vis_id=v_id, page=p_id, bookmark=f"{b_id_src}_{p_id}")
+
+    return {"bookmarks": len(source_bookmarks), "pages": len(pages_to_sync)}
+
+
+def pbir_duplicate_bookmark(
+    pbir_folder_path,
+    report_root_name,
+    source_page_name="main",
+    target_pages=None,
+    bookmark_name=None,
+    quiet=False,
+    on_event=None,
+    cache=None,
+    dry_run=False
+):
+    """
+    Duplique, modifie et synchronise (avec suppression) les bookmarks.
+    `pbir_folder_path` peut être un dossier PBIR, son archive .zip ou un `Storage`.
+    `quiet=True` désactive l'affichage console ; `on_event` reçoit chaque `PbirEvent`.
+    `cache` : fichier du cache de métadonnées (voir `PbirProject`), optionnel.
+    `dry_run=True` calcule les changements sans rien écrire ni supprimer.
+    Retourne le `Changeset` des fichiers créés, modifiés et supprimés.
+    """
+    events = make_emitter(quiet=quiet, on_event=on_event)
+
+    # --- 1. Chargement des fichiers (index paresseux) ---
+    with PbirProject(pbir_folder_path, report_root_name, cache=cache) as project:
+        summary = duplicate_bookmark(project, source_page_name, target_pages, bookmark_name, events)
+        changeset = project.plan()
+        if not dry_run:
+            # --- 7. Sauvegarde ---
+            stats = project.apply(changeset)
+
+    if dry_run:
+        events.info(
+            "plan", "📝 Simulation : {create} création(s), {update} modification(s), {delete} suppression(s)",
+            **changeset.counts,
+        )
+        return changeset
+
+    events.info(
+        "done", "🎉 Synchronisation des bookmarks terminée.",
+        bookmarks=summary["bookmarks"], pages=summary["pages"],
+        written=stats["written"], skipped=stats["skipped"], deleted=stats["deleted"],
+    )
+    return changeset
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Cache persistant des métadonnées des fichiers PBIR.
+
+Pour sélectionner et filtrer les visuels ou les bookmarks, il suffit de
+quelques champs par fichier (titre, z, groupe parent, page active...). Le
+cache les conserve d'une exécution à l'autre dans un fichier SQLite placé hors
+du rapport : un fichier dont la taille et la date de modification n'ont pas
+changé n'est ni lu ni parsé, et un fichier dont seul le mtime a changé (même
+empreinte de contenu) n'est pas re-parsé.
+"""
+
+import json
+import hashlib
+import sqlite3
+
+from . import codec
+
+# Version du format des métadonnées : le cache est vidé si elle change
+CACHE_VERSION = 3
+
+_MISSING = object()
+
+
+def content_hash(content):
+    """Empreinte du contenu d'un fichier (hex)."""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def get_vis_name(vis):
+    """
+    Retourne le nom lisible du visuel pour le matching.
+    Fallback sur le name du container si absent.
+    """
+    try:
+        value = vis["visualContainerObjects"]["title"][0]["properties"]["text"]["expr"]["Literal"]["Value"]
+        return value.strip("'").strip()
+    except Exception:
+        return vis.get("name", "").strip()
+
+
+def extract_metadata(rel_path, data):
+    """
+    Extrait les champs utiles à la sélection d'un fichier JSON parsé.
+
+    `data` peut être un `codec.LazyDocument` : seuls les champs extraits sont
+    alors parsés.
+
+    Returns:
+        dict: visual.json : {"title", "z", "visualType", "bookmarkLinks"[, "parentGroupName"]}
+                (bookmarkLinks : valeurs littérales brutes des liens, ex: "'bk1'")
+              page.json : {"name"[, "displayName"]}
+              *.bookmark.json : {"name", "activeSection"}
+              autres fichiers : {}
+    """
+    if rel_path.endswith("/visual.json"):
+        meta = {
+            "title": get_vis_name(data),
+            "z": data.get("position", {}).get("z", 0),
+            "visualType": codec.lookup(data, "visual", "visualType"),
+            "bookmarkLinks": [
+                link.get("properties", {}).get("bookmark", {}).get("expr", {})
+                .get("Literal", {}).get("Value", "")
+                for link in codec.lookup(data, "visual", "visualContainerObjects", "visualLink", default=[])
+            ],
+        }
+        parent = codec.lookup(data, "parentGroupName", default=_MISSING)
+        if parent is not _MISSING:
+            meta["parentGroupName"] = parent
+        return meta
+    if rel_path.endswith("/page.json"):
+        meta = {"name": data.get("name")}
+        if "displayName" in data:
+            meta["displayName"] = data["displayName"]
+        return meta
+    if rel_path.endswith(".bookmark.json"):
+        return {
+            "name": data.get("name"),
+            "activeSection": codec.lookup(data, "explorationState", "activeSection"),
+        }
+    return {}
+
+
+class MetadataCache:
+    """
+    Cache SQLite des métadonnées, indexé par chemin relatif.
+
+    Une entrée est valide si la taille et le mtime du fichier sont inchangés,
+    ou à défaut si l'empreinte de son contenu est inchangée.
+
+    Args:
+        cache_path: Fichier SQLite (créé si absent), à placer hors du dossier du rapport
+
+    Example:
+        >>> project = PbirProject("/path/to/pbir", "Report1.Report", cache="/tmp/report1.cache")
+        >>> project.metadata("Report1.Report/definition/pages/main/visuals/v1/visual.json")
+        {'title': 'KPI', 'z': 2, 'visualType': 'card', 'bookmarkLinks': [], 'parentGroupName': 'g1'}
+    """
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        self._db = sqlite3.connect(cache_path)
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != CACHE_VERSION:
+            self._db.execute("DROP TABLE IF EXISTS metadata")
+            self._db.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, hash TEXT, data TEXT)"
+        )
+        self._entries = None  # chemin -> (size, mtime_ns, hash, data), chargé au premier accès
+        self._pending = {}    # entrées à écrire au prochain flush()
+
+    def _load(self):
+        if self._entries is None:
+            self._entries = {
+                path: (size, mtime_ns, digest, data)
+                for path, size, mtime_ns, digest, data in self._db.execute("SELECT * FROM metadata")
+            }
+        return self._entries
+
+    def get(self, rel_path, size, mtime_ns):
+        """Métadonnées si la taille et le mtime correspondent, sinon None."""
+        entry = self._load().get(rel_path)
+        if entry is not None and entry[0] == size and entry[1] == mtime_ns:
+            return json.loads(entry[3])
+        return None
+
+    def get_by_hash(self, rel_path, size, mtime_ns, digest):
+        """Métadonnées si l'empreinte correspond (le mtime est alors mis à jour), sinon None."""
+        entry = self._load().get(rel_path)
+        if entry is None or entry[2] != digest:
+            return None
+        self._put(rel_path, (size, mtime_ns, digest, entry[3]))
+        return json.loads(entry[3])
+
+    def put(self, rel_path, size, mtime_ns, digest, metadata):
+        """Enregistre les métadonnées d'un fichier (écrites au prochain `flush`)."""
+        self._put(rel_path, (size, mtime_ns, digest, json.dumps(metadata)))
+
+    def _put(self, rel_path, entry):
+        self._load()[rel_path] = entry
+        self._pending[rel_path] = entry
+
+    def flush(self):
+        """Écrit les entrées modifiées dans le fichier SQLite."""
+        if self._pending:
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?)",
+                    [(path,) + entry for path, entry in self._pending.items()],
+                )
+            self._pending = {}
+
+    def close(self):
+        """Écrit les entrées en attente et ferme le fichier."""
+        self.flush()
+        self._db.close()
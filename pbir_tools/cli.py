@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+Interface en ligne de commande `pbir-tools`.
+
+Chaque sous-commande n'importe que les modules dont elle a besoin, au moment
+de son exécution : `pbir-tools sync-bookmarks` ne charge ni le modèle de
+rapport vide ni le code de duplication des visuels.
+
+Example:
+    pbir-tools new C:/PowerBI MonRapport
+    pbir-tools new C:/PowerBI Nord Sud Est Ouest
+    pbir-tools sync-visuals C:/PowerBI/Report1 Report1.Report --source main --visual "KPI*"
+    pbir-tools sync-bookmarks C:/PowerBI/Report1 Report1.Report --dry-run
+    pbir-tools fleet "C:/PowerBI/*" --source main --workers 8
+"""
+
+import os
+import sys
+import argparse
+
+
+def _print_plan(changeset):
+    """Affiche le détail d'une simulation (un fichier par ligne)."""
+    for change in changeset:
+        print(f"{change.action:<7} {change.path}")
+
+
+def _check_report(args):
+    """Vérifie que le dossier du rapport existe (message clair au lieu d'une erreur de lecture)."""
+    report_path = os.path.join(args.pbir_folder, args.report)
+    if os.path.isfile(args.pbir_folder):
+        from .archive import archive_reports, is_archive
+
+        if is_archive(args.pbir_folder) and args.report.strip("/") in archive_reports(args.pbir_folder):
+            return
+    elif os.path.isdir(report_path):
+        return
+    raise ValueError(f"❌ Le dossier du rapport n'existe pas : {report_path}")
+
+
+def _cmd_new(args):
+    from .empty_file import pbir_empty_file, pbir_empty_files
+
+    if len(args.name) == 1:
+        pbir_empty_file(args.output_folder, args.name[0], quiet=args.quiet, template=args.template)
+    else:
+        pbir_empty_files(args.output_folder, args.name, quiet=args.quiet, template=args.template)
+    return 0
+
+
+def _cmd_sync_visuals(args):
+    _check_report(args)
+    from .visuals import pbir_duplicate_visuals
+
+    changeset = pbir_duplicate_visuals(
+        args.pbir_folder, args.report, args.source, args.target, args.visual,
+        quiet=args.quiet, max_workers=args.workers, executor=args.executor,
+        cache=args.cache, dry_run=args.dry_run,
+    )
+    if args.dry_run:
+        _print_plan(changeset)
+    return 0
+
+
+def _cmd_sync_bookmarks(args):
+    _check_report(args)
+    from .bookmarks import pbir_duplicate_bookmark
+
+    changeset = pbir_duplicate_bookmark(
+        args.pbir_folder, args.report, args.source, args.target, args.bookmark,
+        quiet=args.quiet, cache=args.cache, dry_run=args.dry_run,
+    )
+    if args.dry_run:
+        _print_plan(changeset)
+    return 0
+
+
+def _cmd_watch(args):
+    _check_report(args)
+    from .watch import pbir_watch
+
+    pbir_watch(
+        args.pbir_folder, args.report, args.source, args.target,
+        bookmarks=not args.no_bookmarks, interval=args.interval, quiet=args.quiet, cache=args.cache,
+    )
+    return 0
+
+
+def _cmd_fleet(args):
+    from .fleet import pbir_fleet
+
+    operations = []
+    if not args.no_visuals:
+        operations.append(("duplicate_visuals", {
+            "source_page_name": args.source, "target_pages": args.target, "visual_name": args.visual,
+        }))
+    if not args.no_bookmarks:
+        operations.append(("duplicate_bookmark", {
+            "source_page_name": args.source, "target_pages": args.target, "bookmark_name": args.bookmark,
+        }))
+    summary = pbir_fleet(
+        args.reports, operations, max_workers=args.workers, executor=args.executor,
+        dry_run=args.dry_run, quiet=args.quiet, cache_dir=args.cache_dir,
+    )
+    return 1 if summary["failed"] else 0
+
+
+def _add_report_arguments(parser):
+    parser.add_argument("pbir_folder", help="Dossier PBIR décompressé ou archive .zip")
+    parser.add_argument("report", help='Nom du rapport (ex: "Report1.Report")')
+
+
+def _add_page_arguments(parser):
+    parser.add_argument("--source", default="main", help='Page source (défaut: "main")')
+    parser.add_argument(
+        "--target", nargs="+", metavar="PAGE", help="Pages cibles (défaut: toutes sauf la source)"
+    )
+
+
+def build_parser():
+    """Analyseur des arguments de `pbir-tools`."""
+    parser = argparse.ArgumentParser(
+        prog="pbir-tools", description="Automatisation des rapports Power BI au format PBIR"
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {_version()}")
+    commands = parser.add_subparsers(dest="command", metavar="COMMANDE")
+    commands.required = True
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-q", "--quiet", action="store_true", help="N'affiche rien dans la console")
+
+    new = commands.add_parser("new", parents=[common], help="Crée un ou plusieurs rapports PBIR vides")
+    new.add_argument("output_folder", help="Dossier de sortie")
+    new.add_argument("name", nargs="+", help="Nom(s) des nouveaux rapports")
+    new.add_argument("--template", help="Dossier PBIR existant (ou archive .zip) servant de modèle")
+    new.set_defaults(handler=_cmd_new)
+
+    visuals = commands.add_parser(
+        "sync-visuals", parents=[common], help="Duplique les visuels de la page source"
+    )
+    _add_report_arguments(visuals)
+    _add_page_arguments(visuals)
+    visuals.add_argument(
+        "--visual", nargs="+", metavar="SELECTEUR",
+        help='Visuels à copier : titre, motif ("KPI*"), "re:...", "type:...", "group:..." ou "title:..." (titre littéral)',
+    )
+    visuals.add_argument("--workers", type=int, help="Nombre de workers pour les pages cibles")
+    visuals.add_argument("--executor", choices=["process", "thread"], default="process")
+    visuals.add_argument("--cache", help="Fichier du cache de métadonnées")
+    visuals.add_argument("--dry-run", action="store_true", help="Simule sans rien écrire")
+    visuals.set_defaults(handler=_cmd_sync_visuals)
+
+    bookmarks = commands.add_parser(
+        "sync-bookmarks", parents=[common], help="Synchronise les bookmarks de la page source"
+    )
+    _add_report_arguments(bookmarks)
+    _add_page_arguments(bookmarks)
+    bookmarks.add_argument("--bookmark", nargs="+", metavar="NOM", help="Bookmarks à synchroniser")
+    bookmarks.add_argument("--cache", help="Fichier du cache de métadonnées")
+    bookmarks.add_argument("--dry-run", action="store_true", help="Simule sans rien écrire")
+    bookmarks.set_defaults(handler=_cmd_sync_bookmarks)
+
+    watch = commands.add_parser(
+        "watch", parents=[common], help="Propage en continu les modifications de la page source"
+    )
+    _add_report_arguments(watch)
+    _add_page_arguments(watch)
+    watch.add_argument("--no-bookmarks", action="store_true", help="Ne resynchronise pas les bookmarks")
+    watch.add_argument("--interval", type=float, default=0.5, help="Délai de scrutation (s)")
+    watch.add_argument("--cache", help="Fichier du cache de métadonnées")
+    watch.set_defaults(handler=_cmd_watch)
+
+    fleet = commands.add_parser(
+        "fleet", parents=[common], help="Synchronise visuels et bookmarks sur de nombreux rapports"
+    )
+    fleet.add_argument("reports", nargs="+", help="Dossiers ou motifs glob des rapports")
+    _add_page_arguments(fleet)
+    fleet.add_argument("--visual", nargs="+", metavar="SELECTEUR", help="Visuels à copier")
+    fleet.add_argument("--bookmark", nargs="+", metavar="NOM", help="Bookmarks à synchroniser")
+    fleet.add_argument("--no-visuals", action="store_true", help="Ne duplique pas les visuels")
+    fleet.add_argument("--no-bookmarks", action="store_true", help="Ne synchronise pas les bookmarks")
+    fleet.add_argument("--workers", type=int, help="Nombre de rapports traités en parallèle")
+    fleet.add_argument("--executor", choices=["process", "thread"], default="process")
+    fleet.add_argument("--cache-dir", help="Dossier des caches de métadonnées")
+    fleet.add_argument("--dry-run", action="store_true", help="Simule sans rien écrire")
+    fleet.set_defaults(handler=_cmd_fleet)
+
+    return parser
+
+
+def _version():
+    from . import __version__
+
+    return __version__
+
+
+def main(argv=None):
+    """
+    Point d'entrée de `pbir-tools`.
+
+    Returns:
+        int: Code de sortie (0 = succès, 1 = erreur, 2 = arguments invalides)
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except (ValueError, OSError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
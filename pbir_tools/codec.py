@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+"""
+Codec JSON des fichiers PBIR.
+
+Le parsing et la sérialisation passent par ce module, qui utilise `orjson`
+s'il est installé (ou `ujson` pour le parsing seulement), sinon le module
+standard `json`. Le backend se choisit avec la variable d'environnement
+`PBIR_TOOLS_JSON` ("orjson", "ujson", "json") ou avec `set_backend()`.
+
+La sortie est identique octet pour octet à celle du module standard
+(`json.dumps(data, indent=2)` encodé en UTF-8) quel que soit le backend :
+- les caractères non ASCII produits par orjson sont ré-échappés en `\\uXXXX`
+- les documents contenant une valeur qu'orjson écrit différemment (flottants
+  en notation exponentielle, NaN/Infinity écrits `null`) ou qu'il refuse
+  (entiers de plus de 64 bits, clés non textuelles) sont sérialisés par le
+  module standard.
+
+Pour réécrire un fichier existant, `dumps_like` reprend sa mise en forme
+(fins de ligne CRLF ou LF, indentation, saut de ligne final, BOM, caractères
+non ASCII échappés ou non) et indique si le contenu a réellement changé : un
+document sémantiquement identique garde ses octets d'origine.
+
+`LazyDocument` lit quelques champs d'un document indenté (nom, z, groupe
+parent...) directement dans ses octets, sans parser le reste ; l'objet complet
+n'est parsé qu'au premier accès qui en a besoin.
+"""
+
+import os
+import re
+import json
+from collections import namedtuple
+from collections.abc import Mapping
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    ujson = None
+
+BACKENDS = ("orjson", "ujson", "json")
+
+# Octets qu'orjson laisse bruts et que `json` échappe (DEL et UTF-8 multi-octets)
+_RAW_BYTES = re.compile(rb"[\x7f-\xff]+")
+
+# Valeurs (hors chaînes) qu'orjson n'écrit pas comme `json` : exposant,
+# petits flottants (0.00001 au lieu de 1e-05) et null (NaN/Infinity).
+# Une correspondance dans une chaîne ne fait que forcer le repli sur `json`.
+_UNSAFE_VALUES = re.compile(rb"(?:^|: |\n +)(?:-?(?:[\d.]+[eE]|0\.0000)|null)")
+
+_BOM = b"\xef\xbb\xbf"
+_INDENT = re.compile(rb"\n([ \t]+)\S")
+_NON_ASCII = re.compile(rb"[\x7f-\xff]")
+
+# Mise en forme d'un fichier JSON
+JsonFormat = namedtuple("JsonFormat", ["newline", "indent", "final_newline", "ensure_ascii", "bom"])
+
+# Mise en forme de `json.dumps(data, indent=2)`
+DEFAULT_FORMAT = JsonFormat(newline="\n", indent="  ", final_newline="", ensure_ascii=True, bom=False)
+
+_backend = None
+_loads = None
+_dumps = None
+
+
+def _escape_char(char):
+    code = ord(char)
+    if code < 0x10000:
+        return "\\u%04x" % code
+    code -= 0x10000
+    return "\\u%04x\\u%04x" % (0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF))
+
+
+def _escape_raw(match):
+    return "".join(_escape_char(c) for c in match.group().decode("utf-8")).encode("ascii")
+
+
+def _dumps_stdlib(data, ensure_ascii=True):
+    return json.dumps(data, indent=2, ensure_ascii=ensure_ascii).encode("utf-8")
+
+
+def _dumps_orjson(data, ensure_ascii=True):
+    try:
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    except TypeError:
+        return _dumps_stdlib(data, ensure_ascii)
+    if _UNSAFE_VALUES.search(content):
+        return _dumps_stdlib(data, ensure_ascii)
+    return _RAW_BYTES.sub(_escape_raw, content) if ensure_ascii else content
+
+
+def _loads_stdlib(raw):
+    return json.loads(raw.decode("utf-8") if isinstance(raw, bytes) else raw)
+
+
+def _make_loads(fast_loads):
+    def loads(raw):
+        try:
+            return fast_loads(raw)
+        except ValueError:
+            # NaN, entiers hors 64 bits... : `json` tranche (et lève l'erreur)
+            return _loads_stdlib(raw)
+    return loads
+
+
+def _same_json(a, b):
+    """Égalité JSON stricte : l'ordre des clés est ignoré, mais pas true/1."""
+    if isinstance(a, dict):
+        return isinstance(b, dict) and a.keys() == b.keys() and all(_same_json(v, b[k]) for k, v in a.items())
+    if isinstance(a, list):
+        return isinstance(b, list) and len(a) == len(b) and all(map(_same_json, a, b))
+    if isinstance(a, bool) or isinstance(b, bool):
+        return a is b
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return a == b
+    return type(a) is type(b) and a == b
+
+
+def set_backend(name=None):
+    """
+    Choisit le backend JSON.
+
+    Args:
+        name: "orjson", "ujson" ou "json". Si None, utilise `PBIR_TOOLS_JSON`
+            ou, à défaut, le plus rapide disponible.
+
+    Returns:
+        str: Nom du backend retenu
+    """
+    global _backend, _loads, _dumps
+
+    if name is None:
+        name = os.environ.get("PBIR_TOOLS_JSON") or None
+    if name is not None and name not in BACKENDS:
+        raise ValueError(f"❌ Backend JSON inconnu : {name} (attendu : {', '.join(BACKENDS)})")
+    if name == "orjson" and orjson is None or name == "ujson" and ujson is None:
+        raise ValueError(f"❌ Backend JSON non installé : {name}")
+    if name is None:
+        name = "orjson" if orjson is not None else "ujson" if ujson is not None else "json"
+
+    if name == "orjson":
+        _loads, _dumps = _make_loads(orjson.loads), _dumps_orjson
+    elif name == "ujson":
+        # ujson ne garantit pas la mise en forme de `json` : parsing seulement
+        _loads, _dumps = _make_loads(ujson.loads), _dumps_stdlib
+    else:
+        _loads, _dumps = _loads_stdlib, _dumps_stdlib
+    _backend = name
+    return name
+
+
+def get_backend():
+    """Nom du backend JSON actif."""
+    return _backend
+
+
+def loads(raw):
+    """Parse un document JSON (bytes ou str, BOM UTF-8 éventuel ignoré)."""
+    if isinstance(raw, bytes):
+        if raw.startswith(_BOM):
+            raw = raw[3:]
+    elif raw.startswith("\ufeff"):
+        raw = raw[1:]
+    return _loads(raw)
+
+
+def dumps(data, fmt=None):
+    """
+    Sérialise un objet JSON en bytes (UTF-8).
+
+    Args:
+        data: Objet JSON
+        fmt: `JsonFormat` à reproduire (défaut : indentation 2, LF, sans saut
+            de ligne final, comme `json.dumps(data, indent=2)`)
+    """
+    if fmt is None or fmt == DEFAULT_FORMAT:
+        return _dumps(data)
+    if fmt.indent == "  ":
+        content = _dumps(data, fmt.ensure_ascii)
+    else:
+        content = json.dumps(data, indent=fmt.indent, ensure_ascii=fmt.ensure_ascii).encode("utf-8")
+    if fmt.newline != "\n":
+        # Les sauts de ligne des chaînes sont échappés : seuls ceux de la mise en forme sont remplacés
+        content = content.replace(b"\n", fmt.newline.encode("ascii"))
+    if fmt.final_newline:
+        content += fmt.final_newline.encode("ascii")
+    return _BOM + content if fmt.bom else content
+
+
+def detect_format(raw):
+    """
+    Détecte la mise en forme d'un fichier JSON.
+
+    Args:
+        raw: Contenu du fichier (bytes)
+
+    Returns:
+        JsonFormat: Mise en forme (valeurs par défaut pour ce qui n'est pas détectable)
+    """
+    bom = raw.startswith(_BOM)
+    if bom:
+        raw = raw[3:]
+    indent = _INDENT.search(raw)
+    body = raw.rstrip()
+    return JsonFormat(
+        newline="\r\n" if b"\r\n" in body else "\n",
+        indent=indent.group(1).decode("ascii") if indent else DEFAULT_FORMAT.indent,
+        final_newline=raw[len(body):].decode("ascii"),
+        ensure_ascii=_NON_ASCII.search(raw) is None,
+        bom=bom,
+    )
+
+
+def dumps_like(data, original, content=None):
+    """
+    Sérialise `data` pour remplacer le contenu `original`, dans la même mise en forme.
+
+    Args:
+        data: Objet JSON
+        original: Contenu actuel du fichier (bytes)
+        content: `data` déjà sérialisé dans la mise en forme de `original` (optionnel)
+
+    Returns:
+        tuple: (bytes, changed). Si `data` est sémantiquement identique à
+        `original` (ordre des clés compris ou non), `original` est retourné tel
+        quel avec changed=False.
+    """
+    if content is None:
+        content = dumps(data, detect_format(original))
+    if content == original:
+        return original, False
+    try:
+        if _same_json(loads(original), data):
+            return original, False
+    except ValueError:
+        pass
+    return content, True
+
+
+set_backend()
+
+
+def slot(name):
+    """Chaîne marquant un emplacement `name` dans un `JsonTemplate`."""
+    return f"\x00{name}\x00"
+
+
+# Emplacement sérialisé (valeur ou clé) : "\u0000name\u0000"
+_SLOT = re.compile(rb'"\\u0000(\w+)\\u0000"')
+
+
+class JsonTemplate:
+    """
+    Document JSON pré-sérialisé dont certaines chaînes (valeurs ou clés) sont des emplacements.
+
+    Le document est sérialisé une seule fois ; `render` ne fait qu'assembler les
+    morceaux d'octets avec les valeurs encodées. Le résultat est identique à
+    `dumps` du document où les emplacements sont remplacés par les valeurs.
+
+    Args:
+        data: Objet JSON contenant des chaînes `slot(nom)`
+        fmt: `JsonFormat` de sortie (défaut : celui de `dumps`)
+
+    Example:
+        >>> template = JsonTemplate({"name": slot("name"), "z": 1})
+        >>> template.render(name="v1") == dumps({"name": "v1", "z": 1})
+        True
+    """
+
+    def __init__(self, data, fmt=None):
+        self.ensure_ascii = (fmt or DEFAULT_FORMAT).ensure_ascii
+        parts = _SLOT.split(dumps(data, fmt))
+        self.pieces = parts[0::2]
+        self.slots = [name.decode("ascii") for name in parts[1::2]]
+
+    def render(self, **values):
+        """Assemble le document avec les valeurs (chaînes) des emplacements."""
+        encoded = {
+            name: json.dumps(value, ensure_ascii=self.ensure_ascii).encode("utf-8")
+            for name, value in values.items()
+        }
+        out = [self.pieces[0]]
+        for name, piece in zip(self.slots, self.pieces[1:]):
+            out.append(encoded[name])
+            out.append(piece)
+        return b"".join(out)
+
+
+# Document indenté : "{", fin de ligne, puis l'indentation du premier niveau
+_LAYOUT = re.compile(rb"\A(?:\xef\xbb\xbf)?\s*\{\r?\n([ \t]+)\"")
+_MISSING = object()
+
+
+class LazyDocument(Mapping):
+    """
+    Objet JSON en lecture seule dont les champs sont extraits des octets bruts à la demande.
+
+    Dans un document indenté, une clé de profondeur `d` est la seule à commencer
+    une ligne par exactement `d` indentations suivies d'un guillemet (une chaîne
+    JSON ne contient pas de saut de ligne brut) : `lookup` localise ainsi la
+    valeur demandée par recherche d'octets et ne parse qu'elle. Un document non
+    indenté (ou tout accès qui parcourt l'objet entier) est parsé en entier,
+    une seule fois.
+
+    Args:
+        raw: Contenu brut (bytes) du fichier
+
+    Example:
+        >>> doc = LazyDocument(dumps({"name": "v1", "position": {"z": 3}, "visual": {}}))
+        >>> doc.lookup("position", "z")
+        3
+        >>> doc.parsed is None
+        True
+    """
+
+    __slots__ = ("raw", "parsed", "_unit")
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.parsed = None  # objet complet, une fois parsé
+        match = _LAYOUT.match(raw)
+        self._unit = match.group(1) if match else None
+
+    def materialize(self):
+        """Objet JSON complet (parsé au premier appel)."""
+        if self.parsed is None:
+            self.parsed = loads(self.raw)
+        return self.parsed
+
+    def lookup(self, *keys, default=None):
+        """`data[k1][k2]...`, ou `default` si un niveau manque ; seule la valeur finale est parsée."""
+        if self.parsed is not None or self._unit is None:
+            return _walk(self.materialize(), keys, default)
+
+        raw, unit = self.raw, self._unit
+        start = 0
+        parent_end = None  # fin de ligne fermant l'objet parent ("\n" + indentation + "}")
+        for depth, key in enumerate(keys, 1):
+            i = self._find_key(key, b"\n" + unit * depth, start)
+            if i == -1 or (parent_end is not None and raw.find(parent_end, start, i) != -1):
+                return default
+            while raw[i:i + 1] in (b" ", b"\t"):
+                i += 1
+            opening = raw[i:i + 1]
+            if opening in (b"{", b"["):
+                closing = b"}" if opening == b"{" else b"]"
+                if raw[i + 1:i + 2] == closing:
+                    return _walk({} if opening == b"{" else [], keys[depth:], default)
+                if depth < len(keys) and opening == b"{":
+                    start, parent_end = i, b"\n" + unit * depth + closing
+                    continue
+                stop = raw.find(b"\n" + unit * depth + closing, i)
+                if stop == -1:
+                    return _walk(self.materialize(), keys, default)
+                return _walk(loads(raw[i:stop + len(unit) * depth + 2]), keys[depth:], default)
+            # Valeur scalaire : jusqu'à la fin de la ligne, sans la virgule
+            stop = raw.find(b"\n", i)
+            value = raw[i:stop if stop != -1 else len(raw)].rstrip()
+            if value.endswith(b","):
+                value = value[:-1]
+            return _walk(loads(value), keys[depth:], default)
+        return default
+
+    def _find_key(self, key, line_start, start):
+        """Position suivant `"key":` en début de ligne `line_start` après `start`, ou -1."""
+        raw = self.raw
+        # Clé écrite échappée (\uXXXX) ou en UTF-8 selon le fichier
+        for encoded in {json.dumps(key), json.dumps(key, ensure_ascii=False)}:
+            token = encoded.encode("utf-8") + b":"
+            i = raw.find(token, start)
+            while i != -1:
+                if i >= len(line_start) and raw.startswith(line_start, i - len(line_start)):
+                    return i + len(token)
+                i = raw.find(token, i + 1)
+        return -1
+
+    def __getitem__(self, key):
+        value = self.lookup(key, default=_MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __len__(self):
+        return len(self.materialize())
+
+    def __bool__(self):
+        # Un document indenté a au moins une clé
+        return self._unit is not None or bool(self.materialize())
+
+
+def _walk(data, keys, default):
+    """`data[k1][k2]...` sur des objets parsés, ou `default` si un niveau manque."""
+    for key in keys:
+        if not isinstance(data, dict) or key not in data:
+            return default
+        data = data[key]
+    return data
+
+
+def lookup(data, *keys, default=None):
+    """`data[k1][k2]...` ou `default` ; sur un `LazyDocument`, seule la valeur finale est parsée."""
+    if isinstance(data, LazyDocument):
+        return data.lookup(*keys, default=default)
+    return _walk(data, keys, default)
@@ -1,9 +1,34 @@
 # -*- coding: utf-8 -*-
 """
 Module pour créer des fichiers PBIR vides.
+
+Le rapport vide est livré sous forme d'archive compressée
+(`templates/empty_report.zip`), dont les chemins et les contenus texte
+contiennent le nom générique `_Name_`. Un modèle est chargé une seule fois par
+processus : ses fichiers sont classés texte / binaire et découpés autour du
+nom à remplacer dès le chargement, si bien que la création d'un rapport ne
+fait plus qu'assembler des octets.
+
+Un dossier PBIR existant (ex: le modèle de rapport de l'entreprise) peut servir
+de modèle : le nom de son dossier `<Nom>.Report` est alors le nom remplacé
+partout dans les fichiers texte. Il doit donc être assez distinctif pour ne pas
+apparaître par hasard ailleurs (ex: "ModeleEntreprise" plutôt que "Rapport").
 """
 
 import os
+import re
+
+from .events import make_emitter
+from .storage import DEFAULT_IO_WORKERS, Storage
+
+# Nom générique du modèle intégré, remplacé par le nom du nouveau rapport
+PLACEHOLDER = "_Name_"
+
+# Archive du rapport vide intégré (données du package)
+BUILTIN_TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates", "empty_report.zip")
+
+# Modèles déjà chargés dans ce processus : chemin absolu -> ReportTemplate
+_TEMPLATES = {}
 
 
 def is_text_file(content: bytes) -> bool:
@@ -15,60 +40,276 @@ def is_text_file(content: bytes) -> bool:
         return False
 
 
-def pbir_empty_file(output_folder: str, new_report_name: str):
+class ReportTemplate:
+    """
+    Modèle de rapport compilé : chemins et contenus découpés autour des noms à remplacer.
+
+    Le nom du modèle (et les éventuelles variables) ne sont remplacés que dans
+    les chemins et les fichiers texte (UTF-8) ; les fichiers binaires
+    (ex: `cache.abf`) sont recopiés tels quels. Le découpage est calculé une
+    fois par ensemble de noms à remplacer, puis réutilisé pour chaque rapport.
+
+    Args:
+        files: {chemin relatif ("/" comme séparateur): contenu bytes}
+        placeholder: Nom remplacé par celui du nouveau rapport
+
+    Example:
+        >>> template = ReportTemplate({"_Name_.pbip": b'{"path": "_Name_.Report", "bu": "_BU_"}'})
+        >>> template.render("Ventes", {"_BU_": "Nord"})
+        [('Ventes.pbip', b'{"path": "Ventes.Report", "bu": "Nord"}')]
+    """
+
+    def __init__(self, files, placeholder=PLACEHOLDER):
+        self.placeholder = placeholder
+        self.files = [(rel_path, content, is_text_file(content)) for rel_path, content in files.items()]
+        self._compiled = {}  # noms remplacés (tuple) -> [(morceaux du chemin, morceaux du contenu)]
+
+    def _split(self, keys):
+        """
+        Chemins et contenus découpés autour de `keys`.
+
+        Chaque liste de morceaux alterne texte fixe et nom à remplacer
+        (indices impairs) ; les noms les plus longs sont reconnus en premier.
+        """
+        entries = self._compiled.get(keys)
+        if entries is None:
+            alternatives = "|".join(re.escape(key) for key in sorted(keys, key=len, reverse=True))
+            path_pattern = re.compile(f"({alternatives})")
+            content_pattern = re.compile(f"({alternatives})".encode("utf-8"))
+            # Un contenu UTF-8 valide peut être découpé directement en octets :
+            # le résultat est celui de decode / replace / encode
+            entries = self._compiled[keys] = [
+                (path_pattern.split(rel_path), content_pattern.split(content) if is_text else [content])
+                for rel_path, content, is_text in self.files
+            ]
+        return entries
+
+    def render(self, name, variables=None):
+        """
+        Fichiers du rapport `name` : [(chemin relatif, contenu)].
+
+        Args:
+            name: Nom du nouveau rapport (remplace le nom du modèle)
+            variables: {texte du modèle: valeur} remplacés en plus du nom (optionnel)
+        """
+        values = dict(variables or {})
+        values[self.placeholder] = name
+        encoded = {key: value.encode("utf-8") for key, value in values.items()}
+        files = []
+        for path_parts, pieces in self._split(tuple(sorted(values))):
+            path = "".join([values[part] if i % 2 else part for i, part in enumerate(path_parts)])
+            content = b"".join([encoded[piece.decode("utf-8")] if i % 2 else piece for i, piece in enumerate(pieces)])
+            files.append((path, content))
+        return files
+
+    def write(self, output_folder, name, variables=None):
+        """
+        Écrit les fichiers du rapport `name` dans `output_folder` (dossier ou `Storage`).
+
+        Returns:
+            list: Chemins relatifs des fichiers écrits
+        """
+        files = self.render(name, variables)
+        if isinstance(output_folder, Storage):
+            output_folder.commit(dict(files), ())
+            return [rel_path for rel_path, _ in files]
+        _make_dirs(os.path.dirname(os.path.join(output_folder, rel_path)) for rel_path, _ in files)
+        _write_files((os.path.join(output_folder, rel_path), content) for rel_path, content in files)
+        return [rel_path for rel_path, _ in files]
+
+
+def _make_dirs(folders):
+    """Crée une seule fois chaque dossier distinct (parents d'abord)."""
+    for folder in sorted(set(folders)):
+        os.makedirs(folder, exist_ok=True)
+
+
+def _write_files(files):
+    """Écrit des fichiers [(chemin complet, contenu)] dont les dossiers existent déjà."""
+    for full_path, content in files:
+        with open(full_path, "wb") as f:
+            f.write(content)
+
+
+def _write_reports(output_folder, template, reports, io_workers):
+    """Écrit les rapports dans un dossier : dossiers créés en un lot, une tâche d'écriture par rapport."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    rendered = [
+        [(os.path.join(output_folder, rel_path), content) for rel_path, content in template.render(name, variables)]
+        for name, variables in reports.items()
+    ]
+    _make_dirs(os.path.dirname(full_path) for files in rendered for full_path, _ in files)
+
+    if io_workers <= 1 or len(rendered) < 2:
+        for files in rendered:
+            _write_files(files)
+    else:
+        # Une tâche par rapport : assez de parallélisme, sans un aller-retour par fichier
+        with ThreadPoolExecutor(io_workers) as pool:
+            list(pool.map(_write_files, rendered))  # list() : remonte la première erreur d'écriture
+
+
+def _read_archive(path):
+    """Fichiers d'une archive de modèle (nom générique `_Name_`)."""
+    import zipfile  # import coûteux, inutile tant qu'aucun modèle n'est chargé
+
+    with zipfile.ZipFile(path) as archive:
+        return {
+            info.filename: archive.read(info)
+            for info in archive.infolist() if not info.is_dir()
+        }, PLACEHOLDER
+
+
+def _read_folder(folder):
+    """
+    Fichiers d'un dossier PBIR existant et nom de son rapport.
+
+    Seuls `<Nom>.Report`, `<Nom>.SemanticModel`, `<Nom>.pbip`... sont repris :
+    les autres fichiers du dossier (git, README...) sont ignorés.
+    """
+    reports = [
+        name[:-len(".Report")] for name in sorted(os.listdir(folder))
+        if name.endswith(".Report") and os.path.isdir(os.path.join(folder, name))
+    ]
+    if len(reports) != 1:
+        raise ValueError(f"❌ Le modèle doit contenir un seul dossier *.Report : {folder}")
+    placeholder = reports[0]
+
+    files = {}
+    for entry in sorted(os.listdir(folder)):
+        if not entry.startswith(f"{placeholder}."):
+            continue
+        path = os.path.join(folder, entry)
+        if os.path.isfile(path):
+            with open(path, "rb") as f:
+                files[entry] = f.read()
+            continue
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            rel_dir = os.path.relpath(dirpath, folder).replace(os.sep, "/")
+            for filename in sorted(filenames):
+                with open(os.path.join(dirpath, filename), "rb") as f:
+                    files[f"{rel_dir}/{filename}"] = f.read()
+    return files, placeholder
+
+
+def load_template(source=None):
     """
-    Recrée un report PBIR à partir du dictionnaire interne files_to_create.
-    Remplace dynamiquement les occurrences de 'Base' ou 'Init_PBIR' par le nouveau nom.
-    
+    Charge un modèle de rapport (une seule fois par processus).
+
     Args:
-        output_folder (str): Chemin du dossier de sortie
+        source: None (rapport vide intégré), dossier PBIR existant ou archive
+            .zip dont les chemins et contenus utilisent `_Name_`
+
+    Returns:
+        ReportTemplate: Modèle compilé, partagé par les appels suivants
+
+    Raises:
+        ValueError: si `source` n'existe pas, ou si un dossier ne contient pas
+            exactement un dossier `*.Report`
+    """
+    key = BUILTIN_TEMPLATE if source is None else os.path.abspath(source)
+    template = _TEMPLATES.get(key)
+    if template is None:
+        if os.path.isdir(key):
+            files, placeholder = _read_folder(key)
+        elif os.path.isfile(key):
+            files, placeholder = _read_archive(key)
+        else:
+            raise ValueError(f"❌ Modèle de rapport introuvable : {source}")
+        template = _TEMPLATES[key] = ReportTemplate(files, placeholder)
+    return template
+
+
+def pbir_empty_file(
+    output_folder: str, new_report_name: str, quiet: bool = False, on_event=None, template=None
+):
+    """
+    Crée un report PBIR à partir d'un modèle (par défaut le rapport vide intégré).
+    Remplace dans les chemins et le contenu texte le nom du modèle par le nouveau nom.
+
+    Args:
+        output_folder (str): Chemin du dossier de sortie (ou `Storage`, voir `storage`)
         new_report_name (str): Nom du nouveau rapport à créer
-        
+        quiet (bool): Si True, rien n'est affiché dans la console
+        on_event: Callback appelé avec chaque `PbirEvent` (optionnel)
+        template: Modèle à utiliser : None (rapport vide intégré), dossier PBIR
+            existant, archive .zip ou `ReportTemplate` (chargé une fois par processus)
+
     Example:
         >>> pbir_empty_file("/path/to/output", "MonNouveauRapport")
+        >>> pbir_empty_file("/path/to/output", "Ventes", template="/path/to/ModeleEntreprise")
     """
-    
-    # --- DICTIONNAIRE INTÉGRÉ ---
-    files_to_create = {
-        "_Name_.pbip": b'{\r\n  "$schema": "https://developer.microsoft.com/json-schemas/fabric/pbip/pbipProperties/1.0.0/schema.json",\r\n  "version": "1.0",\r\n  "artifacts": [\r\n    {\r\n      "report": {\r\n        "path": "_Name_.Report"\r\n      }\r\n    }\r\n  ],\r\n  "settings": {\r\n    "enableAutoRecovery": true\r\n  }\r\n}',
-        "_Name_.Report/.platform": b'{\r\n  "$schema": "https://developer.microsoft.com/json-schemas/fabric/gitIntegration/platformProperties/2.0.0/schema.json",\r\n  "metadata": {\r\n    "type": "Report",\r\n    "displayName": "Test_"\r\n  },\r\n  "config": {\r\n    "version": "2.0",\r\n    "logicalId": "dd679b6a-edc5-421f-84eb-1f677eb1062b"\r\n  }\r\n}',
-        "_Name_.Report/definition.pbir": b'{\r\n  "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/report/definitionProperties/2.0.0/schema.json",\r\n  "version": "4.0",\r\n  "datasetReference": {\r\n    "byPath": {\r\n      "path": "../_Name_.SemanticModel"\r\n    }\r\n  }\r\n}',
-        "_Name_.Report/.pbi/localSettings.json": b'{\r\n  "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/report/localSettings/1.0.0/schema.json",\r\n  "securityBindingsSignature": "AQAAANCMnd8BFdERjHoAwE/Cl+sBAAAAEvXDnSdjCU2DmptG1GFlIwAAAAACAAAAAAAQZgAAAAEAACAAAABuNjnEHG5nSLfBlmcwiVsyPotP5HouiZV4MzvWwLEY3gAAAAAOgAAAAAIAACAAAABKFj09Ey4mqM9NAcKggQ3ti9/QSAbbvBhElqXH4UHylLAAAAApe4ta4UG1GFBOSPT6BXred4k7emm8RCaQ2Vu+aAwNQZx4km+tBhIdTU4MfMR8Rs5kwspODb3OP9hFMTXL36t2FYQ/xYZBo3qWmYewhOqvhl0uEzuthivRIsjRUNFhqxjFR6rV0ZoXtz+YLkx1a3QI4yVD7Z/u0tSZ9yLH+CFDCfwHhDdhY3ZuNNjWJvk+byMhilInPYfXSO5/BPUmBxnRafhASJM948henewVH4XoWEAAAABLM66aYJv1WZ6h0DE+pFC0NU5qI0G4UoMEeIIkmQdsZF+ALZ0FoJozNknujwu43NqDA3ytpYGSkRs4yINjnid+"\r\n}',
-        "_Name_.Report/definition/report.json": b'{\r\n  "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/report/definition/report/3.1.0/schema.json",\r\n  "themeCollection": {\r\n    "baseTheme": {\r\n      "name": "CY25SU12",\r\n      "reportVersionAtImport": {\r\n        "visual": "2.5.0",\r\n        "report": "3.1.0",\r\n        "page": "2.3.0"\r\n      },\r\n      "type": "SharedResources"\r\n    }\r\n  },\r\n  "objects": {\r\n    "section": [\r\n      {\r\n        "properties": {\r\n          "verticalAlignment": {\r\n            "expr": {\r\n              "Literal": {\r\n                "Value": "\'Middle\'"\r\n              }\r\n            }\r\n          }\r\n        }\r\n      }\r\n    ]\r\n  },\r\n  "resourcePackages": [\r\n    {\r\n      "name": "SharedResources",\r\n      "type": "SharedResources",\r\n      "items": [\r\n        {\r\n          "name": "CY25SU12",\r\n          "path": "BaseThemes/CY25SU12.json",\r\n          "type": "BaseTheme"\r\n        }\r\n      ]\r\n    }\r\n  ],\r\n  "settings": {\r\n    "useStylableVisualContainerHeader": true,\r\n    "exportDataMode": "AllowSummarized",\r\n    "defaultDrillFilterOtherVisuals": true,\r\n    "allowChangeFilterTypes": true,\r\n    "useEnhancedTooltips": true,\r\n    "useDefaultAggregateDisplayName": true\r\n  }\r\n}',
-        "_Name_.Report/definition/version.json": b'{\r\n  "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/report/definition/versionMetadata/1.0.0/schema.json",\r\n  "version": "2.0.0"\r\n}',
-        "_Name_.Report/definition/pages/pages.json": b'{\r\n  "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/report/definition/pagesMetadata/1.0.0/schema.json",\r\n  "pageOrder": [\r\n    "ce21feaaf51eb1cd2003"\r\n  ],\r\n  "activePageName": "ce21feaaf51eb1cd2003"\r\n}',
-        "_Name_.Report/definition/pages/ce21feaaf51eb1cd2003/page.json": b'{\r\n  "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/report/definition/page/2.0.0/schema.json",\r\n  "name": "ce21feaaf51eb1cd2003",\r\n  "displayName": "Page 1",\r\n  "displayOption": "FitToPage",\r\n  "height": 720,\r\n  "width": 1280\r\n}',
-        "_Name_.Report/StaticResources/SharedResources/BaseThemes/CY25SU12.json": b'{\r\n  "name": "CY25SU12",\r\n  "dataColors": [\r\n    "#118DFF",\r\n    "#12239E",\r\n    "#E66C37",\r\n    "#6B007B",\r\n    "#E044A7",\r\n    "#744EC2",\r\n    "#D9B300",\r\n    "#D64550",\r\n    "#197278",\r\n    "#1AAB40",\r\n    "#15C6F4",\r\n    "#4092FF",\r\n    "#FFA058",\r\n    "#BE5DC9",\r\n    "#F472D0",\r\n    "#B5A1FF",\r\n    "#C4A200",\r\n    "#FF8080",\r\n    "#00DBBC",\r\n    "#5BD667",\r\n    "#0091D5",\r\n    "#4668C5",\r\n    "#FF6300",\r\n    "#99008A",\r\n    "#EC008C",\r\n    "#533285",\r\n    "#99700A",\r\n    "#FF4141",\r\n    "#1F9A85",\r\n    "#25891C",\r\n    "#0057A2",\r\n    "#002050",\r\n    "#C94F0F",\r\n    "#450F54",\r\n    "#B60064",\r\n    "#34124F",\r\n    "#6A5A29",\r\n    "#1AAB40",\r\n    "#BA141A",\r\n    "#0C3D37",\r\n    "#0B511F"\r\n  ],\r\n  "foreground": "#252423",\r\n  "foregroundNeutralSecondary": "#605E5C",\r\n  "foregroundNeutralTertiary": "#B3B0AD",\r\n  "background": "#FFFFFF",\r\n  "backgroundLight": "#F3F2F1",\r\n  "backgroundNeutral": "#C8C6C4",\r\n  "tableAccent": "#118DFF",\r\n  "good": "#1AAB40",\r\n  "neutral": "#D9B300",\r\n  "bad": "#D64554",\r\n  "maximum": "#118DFF",\r\n  "center": "#D9B300",\r\n  "minimum": "#DEEFFF",\r\n  "null": "#FF7F48",\r\n  "hyperlink": "#0078d4",\r\n  "visitedHyperlink": "#0078d4",\r\n  "textClasses": {\r\n    "callout": {\r\n      "fontSize": 24,\r\n      "fontFace": "DIN",\r\n      "color": "#252423"\r\n    },\r\n    "title": {\r\n      "fontSize": 12,\r\n      "fontFace": "DIN",\r\n      "color": "#252423"\r\n    },\r\n    "header": {\r\n      "fontSize": 12,\r\n      "fontFace": "Segoe UI Semibold",\r\n      "color": "#252423"\r\n    },\r\n    "label": {\r\n      "fontSize": 10,\r\n      "fontFace": "Segoe UI",\r\n      "color": "#252423"\r\n    }\r\n  },\r\n  "visualStyles": {\r\n    "*": {\r\n      "*": {\r\n        "*": [\r\n          {\r\n            "wordWrap": true\r\n          }\r\n        ],\r\n        "line": [\r\n          {\r\n            "transparency": 0\r\n          }\r\n        ],\r\n        "outline": [\r\n          {\r\n            "transparency": 0\r\n          }\r\n        ],\r\n        "plotArea": [\r\n          {\r\n            "transparency": 0\r\n          }\r\n        ],\r\n        "categoryAxis": [\r\n          {\r\n            "showAxisTitle": true,\r\n            "gridlineStyle": "dotted",\r\n            "concatenateLabels": false\r\n          }\r\n        ],\r\n        "valueAxis": [\r\n          {\r\n            "showAxisTitle": true,\r\n            "gridlineStyle": "dotted"\r\n          }\r\n        ],\r\n        "y2Axis": [\r\n          {\r\n            "show": true\r\n          }\r\n        ],\r\n        "title": [\r\n          {\r\n            "titleWrap": true\r\n          }\r\n        ],\r\n        "lineStyles": [\r\n          {\r\n            "strokeWidth": 3\r\n          }\r\n        ],\r\n        "wordWrap": [\r\n          {\r\n            "show": true\r\n          }\r\n        ],\r\n        "background": [\r\n          {\r\n            "show": true,\r\n            "transparency": 0\r\n          }\r\n        ],\r\n        "border": [\r\n          {\r\n            "width": 1\r\n          }\r\n        ],\r\n        "outspacePane": [\r\n          {\r\n            "backgroundColor": {\r\n              "solid": {\r\n                "color": "#ffffff"\r\n              }\r\n            },\r\n            "transparency": 0,\r\n            "border": true,\r\n            "borderColor": {\r\n              "solid": {\r\n                "color": "#B3B0AD"\r\n              }\r\n            }\r\n          }\r\n        ],\r\n        "filterCard": [\r\n          {\r\n            "$id": "Applied",\r\n            "transparency": 0,\r\n            "foregroundColor": {\r\n              "solid": {\r\n                "color": "#252423"\r\n              }\r\n            },\r\n            "border": true\r\n          },\r\n          {\r\n            "$id": "Available",\r\n            "transparency": 0,\r\n            "foregroundColor": {\r\n              "solid": {\r\n                "color": "#252423"\r\n              }\r\n            },\r\n            "border": true\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "scatterChart": {\r\n      "*": {\r\n        "bubbles": [\r\n          {\r\n            "bubbleSize": -10,\r\n            "markerRangeType": "auto"\r\n          }\r\n        ],\r\n        "general": [\r\n          {\r\n            "responsive": true\r\n          }\r\n        ],\r\n        "fillPoint": [\r\n          {\r\n            "show": true\r\n          }\r\n        ],\r\n        "legend": [\r\n          {\r\n            "showGradientLegend": true\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "lineChart": {\r\n      "*": {\r\n        "general": [\r\n          {\r\n            "responsive": true\r\n          }\r\n        ],\r\n        "smallMultiplesLayout": [\r\n          {\r\n            "backgroundTransparency": 0,\r\n            "gridLineType": "inner"\r\n          }\r\n        ],\r\n        "forecast": [\r\n          {\r\n            "matchSeriesInterpolation": true\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "map": {\r\n      "*": {\r\n        "bubbles": [\r\n          {\r\n            "bubbleSize": -10,\r\n            "markerRangeType": "auto"\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "azureMap": {\r\n      "*": {\r\n        "bubbleLayer": [\r\n          {\r\n            "bubbleRadius": 8,\r\n            "minBubbleRadius": 8,\r\n            "maxRadius": 40\r\n          }\r\n        ],\r\n        "barChart": [\r\n          {\r\n            "barHeight": 3,\r\n            "thickness": 3\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "pieChart": {\r\n      "*": {\r\n        "legend": [\r\n          {\r\n            "show": true,\r\n            "position": "RightCenter"\r\n          }\r\n        ],\r\n        "labels": [\r\n          {\r\n            "labelStyle": "Data value, percent of total"\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "donutChart": {\r\n      "*": {\r\n        "legend": [\r\n          {\r\n            "show": true,\r\n            "position": "RightCenter"\r\n          }\r\n        ],\r\n        "labels": [\r\n          {\r\n            "labelStyle": "Data value, percent of total"\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "pivotTable": {\r\n      "*": {\r\n        "rowHeaders": [\r\n          {\r\n            "showExpandCollapseButtons": true,\r\n            "legacyStyleDisabled": true\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "multiRowCard": {\r\n      "*": {\r\n        "card": [\r\n          {\r\n            "outlineWeight": 2,\r\n            "barShow": true,\r\n            "barWeight": 2\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "kpi": {\r\n      "*": {\r\n        "trendline": [\r\n          {\r\n            "transparency": 20\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "cardVisual": {\r\n      "*": {\r\n        "layout": [\r\n          {\r\n            "maxTiles": 3\r\n          },\r\n          {\r\n            "$id": "default",\r\n            "cellPadding": 12,\r\n            "paddingIndividual": false,\r\n            "paddingUniform": 12,\r\n            "backgroundShow": true\r\n          }\r\n        ],\r\n        "overflow": [\r\n          {\r\n            "type": 0\r\n          }\r\n        ],\r\n        "image": [\r\n          {\r\n            "$id": "default",\r\n            "position": "Left",\r\n            "imageAreaSize": 20,\r\n            "padding": 12,\r\n            "rectangleRoundedCurve": 4,\r\n            "fit": "Normal",\r\n            "fixedSize": false\r\n          }\r\n        ],\r\n        "referenceLabel": [\r\n          {\r\n            "$id": "default",\r\n            "backgroundColor": {\r\n              "solid": {\r\n                "color": "backgroundLight"\r\n              }\r\n            },\r\n            "paddingUniform": 12,\r\n            "rectangleRoundedCurveCustomStyle": true,\r\n            "rectangleRoundedCurveLeftBottom": 4,\r\n            "rectangleRoundedCurveRightBottom": 4\r\n          }\r\n        ],\r\n        "referenceLabelDetail": [\r\n          {\r\n            "$id": "default",\r\n            "detailBackgroundColor": {\r\n              "solid": {\r\n                "color": "foreground"\r\n              }\r\n            },\r\n            "detailFontColor": {\r\n              "solid": {\r\n                "color": "background"\r\n              }\r\n            }\r\n          }\r\n        ],\r\n        "referenceLabelTitle": [\r\n          {\r\n            "$id": "default",\r\n            "titleFontColor": {\r\n              "solid": {\r\n                "color": "foregroundNeutralSecondary"\r\n              }\r\n            }\r\n          }\r\n        ],\r\n        "referenceLabelValue": [\r\n          {\r\n            "$id": "default",\r\n            "valueFontFamily": "\'Segoe UI Semibold\', wf_segoe-ui_semibold, helvetica, arial, sans-serif",\r\n            "fontColor": {\r\n              "solid": {\r\n                "color": "foreground"\r\n              }\r\n            }\r\n          }\r\n        ],\r\n        "value": [\r\n          {\r\n            "$id": "default",\r\n            "fontFamily": "\'Segoe UI Semibold\', wf_segoe-ui_semibold, helvetica, arial, sans-serif"\r\n          }\r\n        ],\r\n        "label": [\r\n          {\r\n            "$id": "default",\r\n            "position": "belowValue",\r\n            "fontColor": {\r\n              "solid": {\r\n                "color": "foregroundNeutralSecondary"\r\n              }\r\n            }\r\n          }\r\n        ],\r\n        "spacing": [\r\n          {\r\n            "$id": "default",\r\n            "verticalSpacing": 2\r\n          }\r\n        ],\r\n        "outline": [\r\n          {\r\n            "$id": "default",\r\n            "lineColor": {\r\n              "solid": {\r\n                "color": "backgroundLight"\r\n              }\r\n            }\r\n          }\r\n        ],\r\n        "divider": [\r\n          {\r\n            "$id": "default",\r\n            "dividerColor": {\r\n              "solid": {\r\n                "color": "backgroundLight"\r\n              }\r\n            }\r\n          }\r\n        ],\r\n        "shapeCustomRectangle": [\r\n          {\r\n            "$id": "default",\r\n            "tileShape": "rectangleRoundedByPixel",\r\n            "rectangleRoundedCurve": 4\r\n          }\r\n        ],\r\n        "smallMultiplesOuterShape": [\r\n          {\r\n            "$id": "default",\r\n            "rectangleRoundedCurveCustomStyle": false,\r\n            "rectangleRoundedCurve": 4\r\n          }\r\n        ],\r\n        "smallMultiplesHeader": [\r\n          {\r\n            "$id": "default",\r\n            "paddingIndividual": false,\r\n            "paddingUniform": 12,\r\n            "backgroundColor": {\r\n              "solid": {\r\n                "color": "backgroundLight"\r\n              }\r\n            }\r\n          }\r\n        ],\r\n        "smallMultiplesLayout": [\r\n          {\r\n            "style": "Table",\r\n            "cellPadding": 12,\r\n            "rowCount": 3,\r\n            "orientation": 1,\r\n            "titleOrientation": 1,\r\n            "headerPosition": "Top"\r\n          }\r\n        ],\r\n        "smallMultiplesGrid": [\r\n          {\r\n            "gridlineColor": {\r\n              "solid": {\r\n                "color": "foregroundNeutralTertiary"\r\n              }\r\n            }\r\n          }\r\n        ],\r\n        "smallMultiplesBorder": [\r\n          {\r\n            "$id": "default",\r\n            "gridlineColor": {\r\n              "solid": {\r\n                "color": "foregroundNeutralTertiary"\r\n              }\r\n            }\r\n          }\r\n        ],\r\n        "padding": [\r\n          {\r\n            "$id": "default",\r\n            "paddingUniform": 12,\r\n            "paddingIndividual": false\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "advancedSlicerVisual": {\r\n      "*": {\r\n        "layout": [\r\n          {\r\n            "maxTiles": 3\r\n          }\r\n        ],\r\n        "shapeCustomRectangle": [\r\n          {\r\n            "$id": "default",\r\n            "tileShape": "rectangleRoundedByPixel",\r\n            "rectangleRoundedCurve": 4\r\n          }\r\n        ],\r\n        "selectionIcon": [\r\n          {\r\n            "$id": "default",\r\n            "size": 12\r\n          }\r\n        ],\r\n        "value": [\r\n          {\r\n            "$id": "default",\r\n            "fontFamily": "\'\'\'Segoe UI Semibold\'\', wf_segoe-ui_semibold, helvetica, arial, sans-serif\'"\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "slicer": {\r\n      "*": {\r\n        "general": [\r\n          {\r\n            "responsive": true\r\n          }\r\n        ],\r\n        "date": [\r\n          {\r\n            "hideDatePickerButton": false\r\n          }\r\n        ],\r\n        "items": [\r\n          {\r\n            "padding": 4,\r\n            "accessibilityContrastProperties": true\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "waterfallChart": {\r\n      "*": {\r\n        "general": [\r\n          {\r\n            "responsive": true\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "columnChart": {\r\n      "*": {\r\n        "general": [\r\n          {\r\n            "responsive": true\r\n          }\r\n        ],\r\n        "legend": [\r\n          {\r\n            "showGradientLegend": true\r\n          }\r\n        ],\r\n        "smallMultiplesLayout": [\r\n          {\r\n            "backgroundTransparency": 0,\r\n            "gridLineType": "inner"\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "clusteredColumnChart": {\r\n      "*": {\r\n        "general": [\r\n          {\r\n            "responsive": true\r\n          }\r\n        ],\r\n        "legend": [\r\n          {\r\n            "showGradientLegend": true\r\n          }\r\n        ],\r\n        "smallMultiplesLayout": [\r\n          {\r\n            "backgroundTransparency": 0,\r\n            "gridLineType": "inner"\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "hundredPercentStackedColumnChart": {\r\n      "*": {\r\n        "general": [\r\n          {\r\n            "responsive": true\r\n          }\r\n        ],\r\n        "legend": [\r\n          {\r\n            "showGradientLegend": true\r\n          }\r\n        ],\r\n        "smallMultiplesLayout": [\r\n          {\r\n            "backgroundTransparency": 0,\r\n            "gridLineType": "inner"\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "barChart": {\r\n      "*": {\r\n        "general": [\r\n          {\r\n            "responsive": true\r\n          }\r\n        ],\r\n        "legend": [\r\n          {\r\n            "showGradientLegend": true\r\n          }\r\n        ],\r\n        "smallMultiplesLayout": [\r\n          {\r\n            "backgroundTransparency": 0,\r\n            "gridLineType": "inner"\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "clusteredBarChart": {\r\n      "*": {\r\n        "general": [\r\n          {\r\n            "responsive": true\r\n          }\r\n        ],\r\n        "legend": [\r\n          {\r\n            "showGradientLegend": true\r\n          }\r\n        ],\r\n        "smallMultiplesLayout": [\r\n          {\r\n            "backgroundTransparency": 0,\r\n            "gridLineType": "inner"\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "hundredPercentStackedBarChart": {\r\n      "*": {\r\n        "general": [\r\n          {\r\n            "responsive": true\r\n          }\r\n        ],\r\n        "legend": [\r\n          {\r\n            "showGradientLegend": true\r\n          }\r\n        ],\r\n        "smallMultiplesLayout": [\r\n          {\r\n            "backgroundTransparency": 0,\r\n            "gridLineType": "inner"\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "areaChart": {\r\n      "*": {\r\n        "general": [\r\n          {\r\n            "responsive": true\r\n          }\r\n        ],\r\n        "smallMultiplesLayout": [\r\n          {\r\n            "backgroundTransparency": 0,\r\n            "gridLineType": "inner"\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "stackedAreaChart": {\r\n      "*": {\r\n        "general": [\r\n          {\r\n            "responsive": true\r\n          }\r\n        ],\r\n        "smallMultiplesLayout": [\r\n          {\r\n            "backgroundTransparency": 0,\r\n            "gridLineType": "inner"\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "lineClusteredColumnComboChart": {\r\n      "*": {\r\n        "general": [\r\n          {\r\n            "responsive": true\r\n          }\r\n        ],\r\n        "smallMultiplesLayout": [\r\n          {\r\n            "backgroundTransparency": 0,\r\n            "gridLineType": "inner"\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "lineStackedColumnComboChart": {\r\n      "*": {\r\n        "general": [\r\n          {\r\n            "responsive": true\r\n          }\r\n        ],\r\n        "smallMultiplesLayout": [\r\n          {\r\n            "backgroundTransparency": 0,\r\n            "gridLineType": "inner"\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "ribbonChart": {\r\n      "*": {\r\n        "general": [\r\n          {\r\n            "responsive": true\r\n          }\r\n        ],\r\n        "smallMultiplesLayout": [\r\n          {\r\n            "backgroundTransparency": 0,\r\n            "gridLineType": "inner"\r\n          }\r\n        ],\r\n        "valueAxis": [\r\n          {\r\n            "show": true\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "hundredPercentStackedAreaChart": {\r\n      "*": {\r\n        "general": [\r\n          {\r\n            "responsive": true\r\n          }\r\n        ],\r\n        "smallMultiplesLayout": [\r\n          {\r\n            "backgroundTransparency": 0,\r\n            "gridLineType": "inner"\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "group": {\r\n      "*": {\r\n        "background": [\r\n          {\r\n            "show": false\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "basicShape": {\r\n      "*": {\r\n        "background": [\r\n          {\r\n            "show": false\r\n          }\r\n        ],\r\n        "general": [\r\n          {\r\n            "keepLayerOrder": true\r\n          }\r\n        ],\r\n        "visualHeader": [\r\n          {\r\n            "show": false\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "shape": {\r\n      "*": {\r\n        "background": [\r\n          {\r\n            "show": false\r\n          }\r\n        ],\r\n        "general": [\r\n          {\r\n            "keepLayerOrder": true\r\n          }\r\n        ],\r\n        "visualHeader": [\r\n          {\r\n            "show": false\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "image": {\r\n      "*": {\r\n        "background": [\r\n          {\r\n            "show": false\r\n          }\r\n        ],\r\n        "general": [\r\n          {\r\n            "keepLayerOrder": true\r\n          }\r\n        ],\r\n        "visualHeader": [\r\n          {\r\n            "show": false\r\n          }\r\n        ],\r\n        "padding": [\r\n          {\r\n            "left": 0,\r\n            "top": 0,\r\n            "right": 0,\r\n            "bottom": 0\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "actionButton": {\r\n      "*": {\r\n        "background": [\r\n          {\r\n            "show": false\r\n          }\r\n        ],\r\n        "visualHeader": [\r\n          {\r\n            "show": false\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "pageNavigator": {\r\n      "*": {\r\n        "background": [\r\n          {\r\n            "show": false\r\n          }\r\n        ],\r\n        "visualHeader": [\r\n          {\r\n            "show": false\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "bookmarkNavigator": {\r\n      "*": {\r\n        "background": [\r\n          {\r\n            "show": false\r\n          }\r\n        ],\r\n        "visualHeader": [\r\n          {\r\n            "show": false\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "textbox": {\r\n      "*": {\r\n        "general": [\r\n          {\r\n            "keepLayerOrder": true\r\n          }\r\n        ],\r\n        "visualHeader": [\r\n          {\r\n            "show": false\r\n          }\r\n        ]\r\n      }\r\n    },\r\n    "page": {\r\n      "*": {\r\n        "outspace": [\r\n          {\r\n            "color": {\r\n              "solid": {\r\n                "color": "#FFFFFF"\r\n              }\r\n            }\r\n          }\r\n        ],\r\n        "background": [\r\n          {\r\n            "transparency": 100\r\n          }\r\n        ]\r\n      }\r\n    }\r\n  }\r\n}',
-        "_Name_.SemanticModel/.platform": b'{\r\n  "$schema": "https://developer.microsoft.com/json-schemas/fabric/gitIntegration/platformProperties/2.0.0/schema.json",\r\n  "metadata": {\r\n    "type": "SemanticModel",\r\n    "displayName": "Test_"\r\n  },\r\n  "config": {\r\n    "version": "2.0",\r\n    "logicalId": "0462feaa-62db-4a95-ac01-0f72bcd1ea7a"\r\n  }\r\n}',
-        "_Name_.SemanticModel/definition.pbism": b'{\r\n  "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/semanticModel/definitionProperties/1.0.0/schema.json",\r\n  "version": "4.2",\r\n  "settings": {}\r\n}',
-        "_Name_.SemanticModel/.pbi/cache.abf": b'T\x00h\x00i\x00s\x00 \x00b\x00a\x00c\x00k\x00u\x00p\x00 \x00w\x00a\x00s\x00 \x00c\x00r\x00e\x00a\x00t\x00e\x00d\x00 \x00u\x00s\x00i\x00n\x00g\x00 \x00X\x00P\x00r\x00e\x00s\x00s\x009\x00 \x00c\x00o\x00m\x00p\x00r\x00e\x00s\x00s\x00i\x00o\x00n\x00.\x00\x00\x00\x00\xf0\x04\x00\x85 \x00\x00*\xd7\x86N\x00\xf0\x04\x00#\x04\x01\x00\xcf\xc9\x06\x00\x00\x00\x00\x00\x83\xd7\x14:\x00\x00\x00\x00h\xff\x17\x17\x00\x00 \x17\xbc^\t\x01\x00\xb2\xab\xee\xef\x8b\x1b\xdcs\x032\xee\xc9X\xca\xe9\xa4\x16W\\\xdfH;|\xed8\xf7\x00\xc0=\x10>y"\r\xc0\x867L\xdc\x13\x86 \x8959\xd6\xff\x9a\xff{\xeeg\x7f\xe7\xe3\xe4\x07g\x17\xa2\xa6\xfa\xe9BRY\xb3\xea\xa1\x98\xd6\x08\xad$\xa4\x11\x08\xa9P\x8f\xa4\x1e\xa4\x1aD\xad\x90\x90\x10\xa2eM\x0b\xf7H\xa8\xa5\x11FV\t\xb1=\x12\xd0h@\x14hJ\xce8Q\'+\xd7\xd3\xa4}b\xa7\xa4\x11\xa0\xc0^j\x00I\xc8;)$\xff\xecy\x92\xd4\xbfU\x1a~\x83G\xb95\xaf\xb3\xa3)\xb2hI\x93\x91\xb5\x19\xb9\x91u\x93\x1b\x18v\xa1wr}\x8c\xc1\x9e\xb5\xf1\xec\x1aG\xbb\x11\t\xac}c\x9d\x14\t\x82\xb3\x8b\x11k\x99\xa2\x1d\xd7l\xaa\x06\xec\x0c\x9b\xc5\x80$/\xe3-\xb4\x92\x84@\xac\xf2w\xfb\xf7\x81\x82\x8c.Z\xca\xca\xfe\xa4\xa5XI\x02\xb1R{\xc9RK\x88\x95\xcae(5@\xbe\xf7\xde\xcb\x05k\x93\x00\x00PWw\x1f\x00\xfc\x8f\xe2A\xf1(^%=/G\xe02\xc9\x84\xbad\x8e\x7f\x0eq\xbaI\x04\x92\xa0-\x89u,$\xbcbo\xec\xc0\xacXb\xc1\xbb\x90\xf0Nzz\xd4\xff4\xe5)\xfbz\xc1\x07\x1e\xb0\x81\t\\P\t_\xef\n\xf0\x80\t\xca\xc16\x1b\x1cP\x0e\xa3\xc0\x04>\x183\x1fUB\t\x0c\x84\x9da\x10l\x0b\x83\xe1w\xc0v\xf0H\xd8\x1e\x0c`\x06\x04~\x98\x08\x11\x08\x83\x13\x18\x08\x82\xf1\xd5\xe6\x01\x0c\x1c\xf0\xc0\x00\x0b\x18\xbcP\x0f4\xf8a,``\x81\x03\x12\x18\xa0\xc1\x08\nP\x83\x1c\x0c K\xeeq\x03\xd8\x01A\x04(\xe0\xc1\x08\xd5\x80\x80\x02\x0e\xf0B\xe7Uj\x98\xcd\xdf`?0\x10\x00\x0c\xc6\xb3\xed\xc3\xd9\x006`\x81]\xe8[\x8e\xb57\x82I\x14\xf3\xf0"\x14\x0b\xf5\x10\x06\xfe\xf9v\xa0\x00\xb5\x83\x9c\'$c\xd6\xca\xccH\xc0P\xff\x16\xde\xe1|\x8a0\x80\t\xc2\x10\x06\n\xea\x17\x8bB\x10\x06\xf6\x08\xee\xad@\x17@\x92#h\x80\x10T\x82\x1f\xaa\xa0\x02\xaa\xa1z\xbe\xe6a\x04`@\xed\x02\xd3\x8c\xa0\x02\x05\xe8A\r:\xd0M\x95%\xc7\xd2\x00V@\xc0\x03\x02/\x900\xb9]I\x01e\xff\xd1\x02\xe1D_\x8aO\x02\xb5\xd8\x13-;B6W\x0cP\x01U\xf0h\xc0\xe0\x07\x1e\x1c`\x9do\xec`\x07\x15\x98\xc0\x0c\n0\x83\x14\xec`\x01\x15\xe8@\n\nP\x80\x1d\xe4 \x05=\xd8\xc1\n\x16\x90\x82\n,`\x03\xfdT-h\x17C\xb5\x8b\xb1\x0b\xd87{)\xd6\xf87FP\x1f\xaa_\xa2J\x0e\xd5;\x14^\xc7\xf5\xc5\x81iS\xf65\x80{\x1d\xae\xc3\xeb\xfc\xcaC\xfd\x0b\x8f\xa1\x00D\xc0?u\x14 \x08\xadS\xab\x15\xf0\x07D\xbe\x96\x93IUs\xf8\r\xdaY0\x9a\r\xe4\xa1\xb7*\x99\x03\xd9<\xe9dP\xa0\xa8.D\xd1\xdcN\xc55<\x1f\x1e&\x93q\xfe\x1a\x1cB\\i\x88\xf4\xb3\x0c\xc7T\xf3\xa5~&$C4\xa2\xea9\x92\xe30;\x89\xf4cN\xa6\x94\xcbU2L\x07I\x1a\x17\x9f%\x0c\x0b\x04(e\xeb\xd1!S\xbe!\xa9l\xed\x97om\x14ry\xbc\xd3\xed\xaf\x90\xcb\x0f\xa8l=\x8d\xdeT)\xa3\xf1}\x85|\x7fetze\xc2\xcfPE\xe3\x9db\x7fUtze\xc2\xcfPG\xe3\x9dr\x7futze\xc2\x1f\xacH\xac\x15\x87U&\xfc\x0c\x8d<q\xa0\xda_#?\xac2\xe1g\x94E\xe3}Ytze\xc2\xcf\xd0F\xe3\x9dn\x7fmtze\xc2\xcf\xd0E\xe3\xbd.:\xbd2\xe1g\xe8\xa3\xf1N\xbf\xbf>:\xbd2\xe1\x0fV$:\xa5\xfc+\x15\x87U&\xfc\xc1\xca\xc4ZyXe\xc2\'@\x91\xe8\x14/P\xcc\xacL\xf8\x04(\x13\x9d\xf2\x05\xca\x99\x95\t\x9f\x00U\xa2\xd3\xbc@5\xb32\xe1\x13\xa0N\xac\xd53+\x13>\x01\x9a\xc4Z3\xb32\xe1\xffE\x1d\x17x\xbdS[[[Z\xab*e\xd8\xe0Z\xd0(d\xbb\xb9\x9c\xde\x85\xe1\xa9\x8d\x8c\xe7R\x92\xe6xD\xfbq\xb1\xd1PQ\xf5h\xec\xe7\xad\xb8\x9a\xa4I\x9edh\xa3\xc1\x8axT\x858l4\x8cB!l\xd4Ui4~\x9d\xaaZ\xaa(\xd3\x95I\xd5\x01m@\x8a\x94H/\xf5k\xca4J\xac\xd1\x06\xfcjd\x90\xcd_\x06\x8759}\x0e\xab\xd1`a1\xe2q\xc0G\x860\xc7\xa3P\xd8\xa8\x94+\xcb\xa4r\x85T\xa9\xf3)\xe4\xc34\xfaaru\xa9^\xaeR\xa9T\x06\xd9\xe1`p"\x8e?\xff9&\x1c@<N\x0e~\x02\x96\xe0\xc7b\x96[T\x97\x1bd\xc7\xc7\xc9\xc0a5\xda\xd5&\x9b^e\xd5IM:\x9bM\xaa\xd6\xaaTR\xbd\xd9\xac\x94\xda\xd46\x85U\xad\xd0\xea\xb46\xf3)~\xd1\xb5\x82\r\x904\xa2\x16N\xb3fp/\xb08\xde\xc9\xf8\x11\x7f\xf6\xdb<\x06o=\xc7\xe3\x90\xb1\x1aQ\x1c6\xc8f\xb9\xbd\xd1NR\xd8Ir\xbcQ^ja\xeb\xc3\xfcH\\_ZE\xd2\x06\xd9\xdc6X1\xe7g\xc9\xf0\x02Gf4\xac\xda|\x98\xb5j\x0cM\xee\x11\xc1\x8e\x80Q\xaf\xb2\xc9\xadz\xa5E\xaaS[\xf4R\xb5^\xa9\x97\xeaMf\xbdTm\xb2+\x94r\x93RkW\xdb\r\xb23\xb1\xc1\x14\x0c\xb28\xb8\xf8\xe4fq5Y\'[\xeaG\x07#(\x88\x8d\n\xb9\xaal)\xd8\xac\x1b,\x0cE\xa1o\'\xa8\x9f\x87\xabQ\x84\xe2\x8f\xd5\xef&S\xc8\xe5\x0b\xe1dL\x0ccI\x8e\xac\xa2\xb0\x91g#\xd8 \xfbF\x1b\\\x88\xe31\xbb4\xc0\xcbDX?vXeF\x83\x9be\xfc\x98\xe3H:\xe8fI\x86%\xf9\xfav\xb5\x13\xcd\xf0\xfe\x93\x0e\xf3\xf2\x0c\x8b\x82\xd8\xb6\x9c\xef\x18\x0e\x07\x8a&!*\x82\xd7N\xfc\xfd\xc5*6\xfaPU\x84B\xac\x0b\xf3(\x80x\xb48\xd7j\xc39\xe10\x0b\x13\n#\x9e\xac")\x92\xafw\xe2I\x982*\xca\x96\xdc\x93\x02\x0c>\x16\xd1\xdc2\x03N\xb6B\xc0\x12r(\x8cY\x8e\xa1g\xaf\x83\xaef\x8c\x86\xb9\xe3b\x02\xd8xI\x92Av8\x1aL~?\x13\xa1\xf9\xa5*\x88\xe3j\x196`\xb4\x98\xbe\xd6\\N\xd5\x8f\xae\xdae\xf4\xe8\xf2\xea*\xf7n\xbb\x8c\xabc\xd5\x93C\xb8\xa8\x97A\xf6\x9a\xb6BN\x9b5\x8e\xee\xef\x89z\xd4\r\xb2\x17\xad\xb2B\xb6f\x0e\xd9\x1d\x89`\xfc\xec?=pw\xe9\xef\xfe\xeb\xa3\x9e\xfc\xcc/\xd2}\xee\xd3\xac\xa6\xee\x00 \x07\x007\x00l\n\x00\x04\x00\x88\xee\x18\x8a)S\xa6\xdc\xb1\x14D7\x80\xbcj\x00\xf8\xc3\x00\xe1\x02B\xb7S\xd0\xb6\xcds9\xe7v\x9b\x1a\x03\x9f\xff\x84\xcf\xd4m1`\xa7\xa6\xbf\x00\xff\xf0O\x85\xc6\x96?z\x94\xf7\xf3\xa74<Y^\xb9m\xc5\x1f\xe1\xff\xe8s\x7f\xff\xdf\xd6\xd0\x8f\xfa}\xdd\x9e1\xe9s\xbe\xe0\xe9\xfd&\xf7\xa9\xfd\x93\xdd>\xb8\x19\x17\x01\xbc\xa3\x9d$\x8f\x8b\xaa\x196\x84\xf8"\x15l\n\x04\x01;\x17\x15-y\xec2\xf5k\xcd\x00\xd0\x1d^@@<\xdf\x14J\xf7\xd9\xac\x07\x00\xf4\x10\x7f\xd9\x8bL\xe2\xe7\x8a\x9f%\xfe;\xe2\xbf%\xfe2\xf1s\x0eM|k\xec&\x12I\x14\n\xa2I\xc6\xa3*\n\x9bx\x9e%\xab"<\x1eAb\x16\xb1\xfe\x9a\xfa\x13\xa5\xc0\xe2\xb1\x99|\xb6"\x9f\xc9\xec\xb4\x15\x8d?3\xec\xbe}\xd1x\x87u\xf7"\xc7(\x9f\xad\xdc\xe6)\x1aZT4\xde\xc2P\x91\x10\xddl^\x1e\xf1\xf8\xf8y\xf3s\xad\xee3\xb8\x8b\t\x90\xd5\xe4\xaa7\x8fW\x0f\xaef1W\xd3\x02\xeb\xf68\\&\xcf\xb8\xa2\x91\xb6q\xdb\x17;\xac\xc5E&\xaf\xa5\xa4\xa8\xe4\xf1\x9f\x91/\x92l\xb5\x15\xf1{wm/8\x9f\xf5_\x15]\xd0>\xa6\xda0\xec\x9b\xa7\x0f\xb6\xd5\x85)\xd2O\xf2+\xf5\xde\xbd\xc8g\xdb\xcd7\xfb\x1ct5fY\x1c\xf8\xc7\xa7\xb8k\x0e\xfb\xea\xc3\x17ZO\xa9-\xecG\x9b\x05\xf18\xc8\xb0\xf5\xffkz7\x9c\xff\xdc\xc1\x8d \x03\x01L\xa7\xb2F\x07\xb7J\xcc\x83G\xe2\xfa\x99\x0enT\x84\xa2\x96\x0e\\\xe9L\x91A:\x84i>\x05-V\xcc#\x92r3\x1cy\xfe\xe7\x8d\xd0j\x92\x9c\xa8\nS-\xc2\x8e\x10\n\xe2\x03\xbc\x91P\x08\xb1\xe4dl\xbe0\xb4,7-K\xae~Z\x05\xd4%\xee\xff\xec\x98\xa8`\xc9 I\xa7\x80\x9d]9\xec\xe5j\xf6\x0eL\xbc<K\xd2\xc1\xcb\x03M\x93\x10\xd9\x0e\xe3\xa0]\xd6\xdd\xce\xebY\xde\\\xbf\xdfy\xe6\xf7~LW\x18\xbd<\x1b\xf1\xf3\x11\x16\xa7\xf7w\x8e\xbf\xd5\x1dv\n\x05\xb9\xe3s$\xc6\xe1\x15\'<L\xed\xab\xd9Jra\n\xd5\xdfV\x96\x03l,\xcb\xb0.\xccq\xed\xc6\x97r,\xdbs\xb3\xcc$2\x80\xd9e\x9b\xd3\xae\x83v\x16dg\xa8\x00f\xdf\xbe\x93\xf63\x01\x92\x0e\x8e \xdf\xb1\xc6\x83\xa9\xb5\x95Z\xe6\xb4b\x0ewU\x15\xc5c\x96F<\xae\xa8\xfewN\x92\xc6(\x88}(x\xf1\xa8\x85\xd6\xb66\x13\x1dp\x9bq\r\x9aD2\xec\xb7B\x19\td\xaf\xcd{\x88$\x12\t\xb1O\x8f\x98\xef\xbf\x95\xff\xff\xfe\x98M\x19\xf4c-\x0f\xa8\x83o\xfe"s6\xc2b@\xa6\x85,=\xc6\x93\xb6.\xde\x1a\xa6\xd6\xc4\x8dE,yk[*h\xea\x96=\xdc,9\xe9\x96]V\x93\xb0L\xfe\x9aL\xefgF\xca\xfe\xaf\xdb\x83\xfd8\x80i\x7f\x9a9\xba\x19\x8a\xf4\xbf\xd3\xae\x05Q\xfe\xc8\xb4\x05_9\xcbD\xc2k<\xf0S\x91\x00\xb6\xb3L\xa8\x9d\xf5\xec&\xdd\xb7Yf\xe3B4\n\xe2@\xab\xc1\xa6\x08\xcf\x84\x10O\xfa?@B.\x9d[j\xaa\xea.\x92\x0c\x1cH\xec-\x8e\xbd\x1fK/U\x8f\x1b@\xcd\xc9\xf4a\xa949Z\x13\x9a\x85\xa1i\xec\x9fw\xd6t\xf5}U\xbb\xd2\xfd\xd6\xb0\x9d\x16\xdf\xcb\xb3\xe3\xc6\x85\xea\xce\x15\xb9w\xc4a\x96\xa5\x1fpM5&r\xb3\x1f\xef:f\xda\xb9[\xda\n\x9e+\xafF\xe54[\x11~\xd1\xab\xc4\xc2^S\x8a\'W^\x15\xbd)\xd4Cp\x1d\x9fAFSR\xbe\xf7g\xe4E%\x12\xe2\t\xe3c\xed\xa4/\xa9\xfb\x15\xdb\xb3)\x85\xd6\xa9"x5\r\xefU\xfa\xb7\xc0\xe5\xa8\xafF\xbd.\xf8ZQ\x92\xb8\xf6\xca\x95\x08\xb52\x8a\xef\xd4S\xd4y\\f5\xc9\x82\xdc\xe4_k\xe9\xab\xf9\xbe\xad\x86\x11\x17aoQ\xe8\x95\xeefj1kv\\O\xf1\xb6\xb4\xbe\xb6\xd9\x19\xd6\x8fW\xfd\xbcTi\r\xd0~&\xd2\xf1V\xe8\xd6\x0e\x9dM\'\ryp\x98a\x93j\xbe}\xb12\xaa*\ns\x15\x930\xcb\x92\x01\x9c!WO\x8b\xdf&OG\x18OJ\xa3#\x98\xad\xbf\xfa\xd3\xf5\xbe\\\\\x8e\xf4\x96\xdb\xda\xb2\xafU\xd0\x8a@o\xd22(L\n*In\xdd0#<c\xab#9\xfeM\x85\x0b\xd5\xb9\x11\x8b(\nS$\x17rc6C\x83\xbd\xce,\x86^\xd5\xd6\x81p\x87_\x97d\xbc]\xeek\x19\x8b\xfd\xbc\x13ML\x89\xd8\xd8;\x90\xc1N\xae\x144\xc9\xc1\x8b\xa9en\xe7\x8aIN?`\x0f+h\xad2\xf5[DF\x02x\x0c!\x92\x0c\x1eL4\xe8W\x95gv{*\xdc6\x8f\xcfa\xf3\x1e\xc5n7\xa7w\xdc\x1e\xb2\xfd\xf8Q&\x97m\xf7"\xaf\xcf\xe3\x18U>\xb4h\xfcX\x93s\x8c\xed\xf5\xfd\xd07\xec\xafi\x0b\xfc\x12m\xb7|\xc9\xc8\xc1\x04\x90t\x00\xd7q{P$\x8f+Q\x84gfC\xe5\xb9&\x00(u\x00P\\\x02\x00\x92\xad\x01\xa0\xf7\xda\xef\xf7\x12\xf5\x11\xff\t\xe8]\xf8T(\xfc"\xf13\xc4_ \xfe\x1c\xf1\xde\xe2\x1aqy\xe1S\xc5\xd2\xc2}\x0b\xffj|\x94\x08\x83\xed\xb7I\x9e\x8c\xb0\x9a|&o\xc5\x18\x8f\xc56\xd6\xe6\xf1:*Fu\xebI\xe4I\x08\x97i7\x87\xb5\xcf\xc0\xcd\xf2\x1c\x05N\x93\xd7\xe76;\xdcc\xccN\x87e7\x97\xd3d\xa9p\xb9\x1c>\x9f\xcd\xeas\xb8l\xd2\xbey\xa3\xf3\xe7\r\x97\xcdgZ\xd0XF\x98F\x95\xdb\xec\x15\x1e\xef\xb8Q\x96\xd7,\xe2K\x9ehS<\xfb)\xe6-7\xcd\x1b2\xff\x1d\xaf\xcf\xd9\xecI\x03\n\xf24\xfb\x8d1\xdb\xbc\x96\x116\xd7\xd9\xcb\xbc0\xd0\xfd\xa4\xa7\xf4\x17\xe5)\xbe\xf2\\\xf5\x7f\xfc\xe6\xf9y\xd2\x02\x8f\xcd\xeb\xab\xf0\xd8Lf\xfb\xf9\xd4-{\xe4i\x0b\xe61\xb3\xc9k3;+,#\x1d\xa3\xca\xbd>\x93\xcf&~\x16lQpq\xbf_^\x9e\x8cX@\x9e\x1fx\xa5E\xfav\xcb\x1bB\x1c?k\xf7\xdf\xb3\xdd\xa4\xd7\x1d\x0bP\xb8/\x88\xff\x80\xf8\xa9\xe2\x11bN\xfc(\xf1\xc0\xc2}\xc5\x7fQ\xfcl\xf1>\xe2g\x1e\x1e<{`\xe2\xb88\xcfAt\x0eE`\xb3\xed\xf2F\x13\xf1\xbco\xdf\xbc!\xc4\x0fj\xc0\xa6[\xe6i\x88N\x94\x80\x82-\xf2\x14\xc4\x8f(\x80\xe8ayR\xe2\x87\x05 \x7f\xab<-\x11\x97\x1e\xfd:\xf1\x1f6\xe9\x97\xe0\xbc\xbe?\x1c\x00\xdd\n\xf2$\x1f\x02\x80>S\t\xf1d\x10O\x86\x17\x87:7\xe4\x11E \x01((\x90@~~C\x9f\x02\xa2\xa0\xa0\xa0\x80\x90@\x01\x10DA\xecN\xe6X\xcdJ\xed\x1e\xe2K\x9eh{D\xf5\xe3\xeb\xbe\x01_\xbc\xcfcz\x15\x15\x15S8\x88\xfc\xf5\x1e\x1c\xb8\x93$r\xc5\xc3\x8ax6\x82\x87\x1e\xbd,\xe6#,}\xa7\x88\xbeS$r\xa6;\xc3\xf8\xc9\xa3\xd7c\xbb\xf5ZxM\x99r\x07\x00\xdc\xa9\xfe_\x1c\xfa\x9dxH\xf8\xe2\xe7\x80\x88\xd8\x19\xc4f\xf1\x9f\xe9m\xea9!\xff\xcfw\xb3\x11;\x8b\x9f\x13\xbf\x85Bh-\x00\xc4\xe6\xadT\x1c\xe5<\x00(\x98vP\xaf/\x85\x9e\xf0\x85P0\xb8\xc7\x1f\xcbk$\x9eQ\xf8\xac\xc2\x92M\xfeP\xef?\x0b_\xd8\xebo\xc0\xb60\xe4y\rC6\x13I\x86\x0c!\x1a\xfb\xf0\x1f\x00\xc6\xadDzy\xfb]P\x9e\xcb\x19\xdc\xa7\xa2\x96\xc6l\x0b\xd5\x9aX\xdd\x88\xaf\xc9d\x8d5n\xb6\xa9H"\x93\x11M\xde\xd8\x86\xc2\xd0G\xd8D\'\xc4\xe6\x17\xc8^\x07\xb2\xb4\xf8\x15\x9d/\xc6\xdd\xe5QjAk\x83\'\xcb\x841\xcb\xd7O_\xee,S\x04\xb6\x8e.\xb7\xd7"\xab\x87\xd8\xa6\xb7H2`\x00\xf18Q\xec}\xf9\xfc\xa6\x14^Q\xd09@\x84,\x9d>S\x0c\x9b\x9d\xd5\xbc\xf3Y.d\xfb\xd0f\x95\xa3#\xc8\x00v\xe1P\x15fo\x96(\xbbxSJ>\xf7\x1c\xdaK$\xd9zk\xe2\xf1\xb2\xd8j=\xbf\xee>\xb7\x17\xe1\x18Km2;9"\xb2\xf5\xe3S\xd3\xed\xd4jw\xa4\xdbq\x11\xd8\xc1y\xc9P\xf8\xd2\x9a\x0b\x85Y\x06yJ\xcf\xb3\xb9:\xb32\xe0\xb7]$]O_\xbc\xd8\xa3gt\xf0`\xe2w\r\x8e\xad\xfb\xfc\xca\xe4k\xc8\xf0Q\xdc\xe4\x86\x1c\xaf\xda\xecr\x8b\x0e\xce\xe4\xe7\xc9IW\x9a\xc5\x89e8n\xd5\xe4$\x1d\xccp\xdb\xbb0$]A[\x11\x9f\x91\xeb=\x98\xaa\xaf\xa0=\xb8\x1a\xb3\xb7\x92\xceA\xf38\xc8\x92\xfc\xd7\x8c_\x0b\xda4\xe9;:;Y@f+\xfaPT\xfco\xc8\xc7\xb4\x92\xe3cZ\x99\xf11\xad\xa6\xa4\xc1\xdf\xdb\n3\xc2M\x12\x862S\x01\xd4\x19\xfb\t\xf6G\x96\xfe\xa4\x86\x98\x9d\xfa\x15\x9a\x82\xe8\x80\x01\xc4>\xfa\x98\x1b\xb1\xfcrq\xdf\x94\x9e7\xb89\x163oSY\x01\xf3\x8c\xbf\xaeL\xd7\xeb};\xd8\xab\x0f\xb3\xc8\x85%\xb0\x8c\x933\x0b\xdd\xfc\xffV\xed\xdc`PF\x80\xf1\xacD\x85\xee\xa8\x8d\xa4\xa8u\xff\xfc\x81\x9e8\xafFt\x10{y\xc4\xf2\xbb\x17yl&\xe7\x9c\xb2\xd1\x81\xe6)g\x11\x1d\xa1\xd0\xf7\x8e]\xb233\xcc\xc4\x10b\'~\x87\xa2\xdd\xaeS\\\xe3]=\xa6\x186+\xce\\\xe9\x153\t/\x1d\xcc\xb8\xa36\x8c\xbbn\x88\x91\x16\\\x00\xf0\xcc;:\xb3q\x1c\xdf\xb0k_\xd1\xac]\x03\xc8I\xd2\xc1\x08\xc9\xf1\xa4\xff\xbd\xf7;Q\x1evC\xb53Cv\xde\xa1\x0fb\xc1\x0f\xd6D\xe7\xe0\x18\xe6\xb1w\x9ej\x93r\xc3\xee\xe2u@h\xea\x1b[\x12\xf8\xba7\x9b\xf9^,\xc7)\x93\x0bx\xf5@\xa6\xe2$3\n?\xab\xbf\xea^(\x92l\xbe9\xb1\x17\x13\x1b\xe9v\x8ct;\xfa^\x80\x1d\xe9v\xb4\x11\xb5S\xc1\xa0\x93H\x06\xb1A\xcc\xb7\xc4\x9c\xa5\x89\x1c\xb3Y\xc9\xc8J?"\\9\x8b\xc25\xa4\xff\x04\xec\xd4\xf58\x9a[\x99e1\x1dx\xb33\xfb\xda$w\xf4\xb6\x12\x93j\x0e\x1bv\xe9\x13\x1d8\x90h\xac\x8c\x99h\x9a\xe1;V}\xa96\xfd\xa1l>6\xb3\xc4\xdf\xec\x93\x97\xde\x98(;CiVQ,\xda$*\x91\x10M\xa1\xd8\xfaJ\xd8K\x12\xdfH\xffhjC_\xa7\xf9h\'\xa9\xe6\x8c\x14\xaffY\x0ci\x175{\xfe\xa4\x1f{8\xf8\x00\xe0\xd4n\xe2\'\x81\xf8/\x89\x9f\x14\x0fKI\xdc\x83\xb1}\x1f\x11\xf4\xecY2(\xdfmvT\xbaY\xc6\xc70\x14I\x07\xc7\x17[\xf1$\x17\x13\xc0\xc5\xbb\x13\xebI\xc1#?W\xba\xc9<U.\xce\xaf\xac\x9c\xc7|d\x08;h\x1eS\x14\x19\xc4\xb4\x1f\xdbhTE\xe1\x80bc\x12\xf0G\x83\xc2\x01\x00!~:\x88\x9f\x9ex\x1e\x0ff\x8e\x1f\xf7\xef%\x82\x9e\x12"?\x7f}\xfc\xb7\xf7\x87\xf0\xff\xf3B\xff\xfe\xf3B\xf1\xe0\xf0\xa7\x81\xf8i\xf1plM\xef| \xc6\xe5\xf7\xec\xf5\x98\xe2\xbbPF\xc5\xc3\x8a\x15\xa5\xf2Ry\xf1\xd0\xe2\x8f\xed\n\x15\x0f+\xc6\xb4t\x8c\xb7\xf8\xb1\xff\xea\x8b\xf7\x89\x07\x86w\x06\x83\x03@o\x82\x85<]\xb7\xdf#\xde\xb1\xd0\xd6\xf3\xef\x16<E\xf4\xc7\xf3{w\xffk\xdd7#X\x00\x18\x13\xef\xf2\xb7\xc9\x8f5n\xb5\xb5H\xa2R\x11M\xe3\xeea\xd5\xdd\xa5vk\x81\x19 8]\xdd\xc9B\xc0\xc8\xd8\xe9GH\x8ci\x1f\xde\xb2\t\xc0\xab\x13\xf49\'\x00\xe8\xed\xab\x1ct\x00\xd7\t\xec\x83[\x9f\x17k\xdad\x1b\x91d\xa7\x9d\x88\xbdv\xe0S\x7f\xa0B\x802\x9a\xf0EM(\xfc\x84\xc2\xed\xf2p\x91\xa4\xa4\x84h\xac\x88yq0\x84i\xfe\x12\xb1W\xf8\x11W\x1a\xcem\xc1\x19K\x85\xf4mw6b\xd9p\xa6\x9c\xab\x97\xa0\x93Tz\x1a\xa5\xb1d+\x91D\xaf\xdf\x98^kc@\x0b[\x7f\x01u\xa5g\x946Wn\x13n[\xca\xb7\xfeT\x94\xd9E\xfb{\xc0wW\xc0]e\x94jX\x9a\x86l\x19\x95\xc9\x88\xbd\x1e\x1b\xb3\x92\xebo\x8e\xd1\x8d\x88\xc3\x13b\x9b\xbb\xa9\x8dg\x80T\xdb!\xf0\xe5\xb4\x85-E%f\xc4aG`\xa6\x0b\x05i\x92\x8f\x04\xf0G\xe4yN\xc4\xf1g A\x07\xa7\x82\x12O+\xc2\x98E<I\x07+h\x95\xf2B\xd0\xa5\n\x02J>S\x869\xdeKNNOF\xffNIT&#\x9a\x86|\x95\x0b\xbd\x8b\xc1\x13b\xeb4\xa5>\x15\xa4P5\x9d\xaa\xba\xfa\xd2\x83\xfd\x0c\x1bH\xe3\xed\xb4E?irn\xcc\x9eL\xda\xf2\x7f\xe3\x8e[\x88$R)\xb1gI\xec\xa2T3<\\\x90N`[\xce\xcf$6\x9f#\x0bDX\xbd\xca,\x8d\xec\xef:\xd8\x05\x0e\xb8\x8eD\x07\xb4\xaf\xbb\x98\xe2\xd1z\xa3\xe0\xbbrleP\xd0\xd6\xab\xbb_t\xc8\x10\xe2\x89\x95\xff\xe8\xff*4\xab[e0\xa0t\xb6=u,s\x8b\x10\x07z1\x7f\x8d\\\xae\x15\xf34\xac\x15\x90\xdaY\xc1\x060\xbb\xd1\xc3\xfa\x13\xdc>\xc6\x8f\xde\xb1\xdfL.bXj\x10\x8b\xfc\xfc=\xff\xc7\x95\x92u\x00\xcfUZ\xbf\x1e\xb4\x9f\xef(-\xe9\x8ek\x03np\x8dj\xa7\nT\x17\xcf6\xf4\\\x11\xe5"\xe9k\xc3$\x93\xe8q\xda\xbc\x0c\xcb/\xc6\']aj3\xf4\xf6k\xc2\x08\xd4\xf1\x11\x97\x88<N\x9b\'B\'\x1d\xa8\xe0k0\xcb%S3\x86\xfb\xc9I\xec[\xcf\xcc\x02\xa8a\xe7\xfcn\xaexbaB\x1b\x11~\xc9\x12\xb9\x11\x8bBIK\x82\xab\xb9:\xb8\xe5\xa5o:\xe2:7\xffv\xbe8&](\x1c&\xe9\xa0\xbb\xa6\x9e#\xfd\x88\xfa\xfe\xcd\x9d\x91\xde\xf3\x82\x9dE!\x1c\x10\x84.\x1b\xbb\xcd\x17,\x19"\xa3\x93p\x06\xa6\xbe\xa9\x8aL,zF!\xe5\x1e\x16\x1d<\x98h*\x89\xfd\x84\xb9\xf5(n)@\xe35\x13A!\xe4)\xc6,\xaf$C&x\x1cc\xc9\xbb\xf2\xa8\xd9HK\x19\x94\xabM\xed\xe6\xcdE\x92A\x83\x88\xc6\x91\xb1wc\xff\xb2m\x91\xe5T\x92\x02\x1fb\xb3;\xa7\xcc\x0cH\\\x10\n\xc5H\xf1G\xff+<\x00\xec|4\xf8\x01\xa0\x900A\xe1\x1e\x9b\xb8{\x0f\xef\xd5\xd8\xf3\xc9\x05_Z\x90/\xd2\xe6\xb3=j\xbb?*\xcf\xd9\r\x08\x13\xb8A\xf6\xfc\xfc\xa1\xf9\xb1\xc6\xdeCD\x92\x01\x03\x88&\xbc\x9e\x1f\xf4q0\xbc\xb1\r\xf4#\xd7s\x9e\x9a\xc41[\x1d\x8f\xe9\x00\x0e|\xec\xdd\xad\x19d3\x9b?\xce\xb9U\x8e\xd8\x99!\xb7^\x12k0\x94DKJ\x88FU\xcc\x8dY.\x8c\xfd<9\t{1\xff\n\x97\xde\x9d\x88\x9a\xdb\x02\x1d\xa2N\x15\x025\x8c\xbc\xf8*\x84\\\xab0\xe6\xd8>\xba\xf9\xe6\xc4\x9e\xf51/\xe6\xbd\x98\x97~\xf4E\xc5\x0bK\xd0Q\x8e\xd7\xc5r\x14I\xe6\xe0\xac\xf54\n\x91\xfe7F\xb9\x1b.\xb7\\\xcd\xe2\x96R\xa6\xb4V\xfc\xc6\x0c\xbd\x02\xebX\x14\x0e\x9dR)\xfe\x12\xe2\xfb\xd8}ou9\x03&{\x80\xd4B+\xf8\x1f\xd7\x01L\x17Z\x1e\xbe\x9dH\xb2\xc3\x0eD\xd3\xc4\x98\xefZ\x8f!r\x83\xe0\xe9\x15\xdfA\x80\r\xd3\x1c\x17\x88[\xc6\xe4\xe0\xb4-\x8d\x92\xee\x95g\xcb\xd5\x04gi\x04\x93\x96\x11\x1b\tW\xdf\xe1J\x8d;\x1a\xea\x06GKJ\x88\xa6\x1db\x8b\x9a\xf7\x8d\xc9\xd5\x90\xe1W\xf8\x91w\xef\xcf\xe6v\xaa\xd48I\xde\xe8\xe3\x98\x9a\xb7\xae/\x1c\xc04O\xf2\xf59\xc4\xdb\x9b\xef\xd6\x04\x95ic2o+\x92\xf4\xebG4\x06c\x8b\\\xff\x85\x92\xef:\xe7h:-wH\xd07_\xa7\xc4\xb4m\xb7\xe8\x1c\x14U(\x88FK\xec\xdd\xa9\xddG\xa7v\xa2l\x9f1\xffr\x91\xf5\\&\x150\'\xe2jm\xed\xd3W,\x92h4\xd1\x91\x07\xde\x94B\x0b\xd2\x906\x9b\xe6\x06Dvmi5\xb7\xbb9\xd8\xa6\xd7\x11\x03\xa32\x19\xd18\xfc\xc0\xbb V\xcd\xb1]\x9bE\xef\xbaZ\xb5\xed93\xbcT[\xbb\xdc\xb5(*\x95\x12\x8d\xe8@_\x0b\xc2\xe06K\xe6l`\xf04\x92)\xb0r\xd0~*\x12\xc0&\x8aj;\xd1\x0e\x1b\x10\x1d4\x88h\xdc\xf1\xc0\x97m\xdb6\x83f\xde\x94\x90\xad\x7fR\xf8\x88\xe8\xdawU\xc4~f\x17\xaf\x19\x06\xcdl\xfe8\xa7\xad\xe1\xcfp\xbe\xe1I\x98\xca\xd1\xc0\x9c\x0b\xf1\x98%\x11EN^g\x01\x01\x95X\xb7\x81\xa4\x05\xb6\x9e\xe3q\x8e\xc4\xeaR\x12\xb1\xe7#\xfa\x8b$\xc3\x87\x13{\x8f\x8c\xe5\xccQ\xb1\xc5r\xe0\x15#IC)d\xc9\x8d\xba\x0f\x05Q\x88U\x84y2t\t\xc8\xbd\xf4m7@I\xa5B\xab\x9f\xb8\xabZ\xe6c\xac\x88GI\x14\xeb\x9fm\x8c\xa0\xfd\xb2\rD\xb2{\r\xe6\xee\tu\tQ\x06\xee\xc7\xa7\\\x17\xbbS\xe6;~\x04\xe2>\xac\x0c\x9bA\xd2\xdf_QT\xd7<\xf7\xb2\xc3\xcd6\x17\xaasb:\xc8\xd7\xa4\xf3\x10\x1fQ\xe8=OP\x18^\x8bb\xd1\xed\'H\xca\x11R\x87\xde\xf3\xd7P\x13\xc0uW\x7f\x0b\x84\xce\x13\x8c\xdd\xe6g\xe8\x00b\xeb\x93N\x08q\xee+u\xe0\xfc\xfa:\xdd\xc2\xfe\xb1\x07\x85\x07\x00tn\x07~\x00\xd0\xeb\xaf\x80\x18H\xe8\xd3\xbd\xa7\xa6`\x94\xc8\x92\xff\x84\x1e\x7f\xae\xfbW\xe4\xfd\xc1n\x7f\x99\xd8\xa9\xf7\xdf\xeb=Z\xac-l\x00\xb2\xf7\xb3\xfb\xe4\x014\x16\xaa\xefmZ\xd5\xc6\xba\xd8^M\x0b\xdb0K\xc3h\xdd\x86`\xfb\x98\xd8\xfd`w\x02&\x96\'\xab\x91\x9fo\x06\xe3\xcc\xe6\x8fs\xae\xce\x008G\xc9\xe11j5f\x7f\xee\x17\x8f\x90\xc4\xf7\x9b\x1e\xa6\x8a\x0e\x19B\xec\x15\x8c\xfdb8\x9e\x97W\xffQ[\xf9q,\xcc\xb6\xfe\'\xbd6\x801\x14E\xd2\xc1]I:\xc0\xd4v\xb9\xe33\xa7\x1b7fI&\xf0K\x98wh?\x8bC\x98\xe6\x11\xd5j\xc6i\xa45%N\x06\x15\xd5\xd5\x1c\xe6\xbf\xc6}>C \xca\xfe\xbd\xc6\xa4\x82\xbe\xf6\xa7\x0b*\x85\xdfE\xb9\xdf\xf8\xd8\'<\xf9\xbcl\xba\x99\xc7i\x9c\x05.\xce\x9b\x11\x87\x0f\x8f\x05V\x9d\xdf\x1f\xf6\x07\xdd\x13`\x17T\x0c?R\x11\xdda\x07bOW\xec\x13({\x1c<\x0e}\xf3\xb5?=\x9bz\xbc\xb7Q\xb6+\xc1\xdb\xd35\xd9v#\xf4\\ya\xee\xf6O\x13\x86.\xa4+\x93\xd6\r\x1eyt\xa5!\xbb\xc6.\xf27C\xd9\xcc\xe6\x8fs\x8a\xecSMD\x97\x0c\xf5\x11\xec\x9c/\x8b\x0e\x19\x12\xad\x88-\xde|L\\\xf5\xe5\xd5\\\xf0\x9c\xcb\x82\xc9\xdc\xbb\x12\xfe?\x0b\x0b\x92\x0e\n\x17\xe7|EiT\xa3!\x1a{\xc4\xda0\xd0\x82\xa4\x16\xc0\x02\xff?G\xba\xb2.\xb4\x04\xfc\x02iT\xa3!\x9aT\xb1.D\x92\xd3\x82\xa4\xba\x80\x96\xc4\x11\xe7Lmn\xee\xfa^ \xa5\xbf\x81\xa1\xd1k\xbe>f\xbf\x8df\xff\xfb\xe8\x02\x9aA\xf1\x1f^\xfd\xf1\xe8\xd4qpj!\x9d{\xea;\xd04p\x87\xe8\xc0\x81\xc4\xe3\xfa\xc4.+{\xa9\xe4\xdf\x07\x8cK\x11\x85W\xb0\xfe\x91$\x1dH\xad\xe4\xbb\x1c\xf1\x1b7bQ\x08\xf3\xf8\xfe m)\xd1\xea\xa2\xe47]\rb \x0f\x0e1<~}|\xa1\xbe+i\x82#h\xb6\xfe\xefC]\xeec\xa2B\xc3\x00\xcd\xcf\xa1\xb4\xe9\x19\xbb\x0c\xec\xa5\xdaq\xe6\x9c\x8cs\x9a8tA\xaf\x9d4x\xc8\x19-@\xf6\xe8x\xdf\xa9Kr\xc9|\xb5%\xf7\x9b\x96\x01\x00>3\xfe\xb9A\xa5]\x07\xae\xc6\xfe\xfb\xd5 :xY\xd37\x7f\xa7\xc3\x8e\xf78w--\xfb\xa4\xd3\x19\xf6\xb2\xa8J\xf5\xddB&\x1aQ\xf5<\xe9\xe7L\x8e_8\x02t\xe2\x18n\x9f\xe3\x99"\xb3\xec\xf0\xbe\x03\x04\xd3\xfdr%sx@\x90\xdbz|\x01\x00z\xff\x03\xe8\r\x9f\x05\xbd\xbe\xbc\xe0\xd9"\xa2\xc7Wt\xff\xec\xbc\xa7t\xfb\x9b\xc4\x97\xc3g\x89\xd5\x85\xea\xe7\xef\x13\xbf\xc97\xe7\xc7\x1a\xc7\x99D\x92\xfe\xfd\x89\xbd6\x0c\xa8\xed\x11\xda\xbf>\x92<\x0b#\xee\x1e$\xbf\xf2\x84\xcd\xd59\'\xa1\xee\xb9\xa9\xa2{NU\xd8\x13}\xd7\xb9{\xd4\x86\xc9;\x8b$;\xeeH4\xf5\xde\xf8\xcf\xc6t\x00\xb1\x1b\xb8\xcf?\x8e\x0fo\x91+\xbf\xa7\xa1\x9dD#H\x99\xfb\xb4%\x90\x1bZ\xe0/\xb4\x83s\xb3d\x08\xb1\xbf\xf0z\xe9\xcao\xa1\xe6b\xdb\x87G?L;n\x83J\x0b\x8c}f\x12D\x9cO9\xcd\xb8h5\x86&\xf9\xb6\x93$2F\xfb\xf7\'\x9a\xfa\x1d0\x0b\xb66\x9e\t\xb3Vw\xba\x10)4\xe3i\xa1\xadj\xfbv\x12I\xb4Zb\xcf\xf2\xd8G\xf4\xde\xd7sn\xa1\xb2\n6\xfb\x16\x86\x84k\xe1<!\x9e\x99?!\x9cA\xa3\x1f\xe86+\x94\x1b\xf3F\xb1!\xaa\xd7\x13M\xfaX\x17\xcbmma\xb3\xdc\r\xebNR\x11H\x02\xdd\xa5M\x9dR\x1fZ\x04ens;F\x15\nb\xef\xbe17b\xf7\x88`\xde\xfe\x80\xf1\xa5\x13\xc5|7E\xfau!\x85\x06]\xa5m\xa7_.\x005\xbe\x0b\xec\xd7>\xb8\xc2\xc0\xc7#\xd4\xbf\xc75\x85[(=Lm\xb0\x83\x9c\x9f\x8dD\xefb/\xb97\x00\xb7\xe2C\x16\x11\xc6b?\xcf\xb0\x8b\xd8]\xc4\xc8\xf6\xf4b&\xf9\x10\n\x0b\x08`O"\xfa\xae\xfbk\x8d\x83\xa6H\x1a\x9f\xc4\x0e1;+\xccm\x82\xb1e\xf2\x84\x9b\xf8a\xd1\xe1\xc3\x89\xc7\xd5\xc6R\xd6\xd9b\xb9\xf3G}\xe3IA\xe9A\xc4\xb4\x08x\x00\x1d\xac\x00\x8b\xf8U\xb4\xddL\x9a\x87a\xf84\x9a\x88\xb0,\xa6\xf98.$>\xbc\xb1\xbe,\x18\xf1(\x84X\xbe\x05\xf6~2N]\xd0\xf7u\x1a\xa2\xa8*\xe4\x9f\xe8\xc1\x88c\xba2sN]\xa8\xea\x96\xe2\x91\x93\t\xde8g\xa3h\xfe\x81\x91P\'\xec\xcf[\x8b\xbdX\x9c\xd1\x7fz\xeaE\x92\xf1\xe3\x89F2V\x8ei\xcc"\xea\x13\xa9\xa1f\xe9\n\xe2\xe4\xf4\x0c\xbf\xdb\xab\x9e\x9c\xd84\x86\xe8\xcatD\xe5\x8c\x8b]\x98/\xdc\x01\xba\r\x8b\t\xdf#\xf7\xc2_\xb6\xc9\xdd\xf0X\xcb\xadF\xec\x1b\xeb\x92\x1dP-r\xbb\xccL\x8a\x89\xcb\xe9\xa1\xb9\xc7\xd0\xfe\xfboC\xe1\xc0\x9a%]$\xdde\xc5\xac\\\xa8\xaeE9\xa5\xb0\x0est\xd0\xa0\xe8\xb8\x98\x99\xa4\x03$\x1dt\xd0\xd5\xcc\xcb\xe6\xb8\x00}\x9cf7\xab\xcea\xa3\xfc\xcf\x87\xc9\xfd?4\t\xdb\x8e\x07\x00|\xca\xbe\x0f]\x95\x05\xa3\x80R\xd0\x80\n\x1eZ\xa6\x05\xe3\x9d-\x93^\xa2\x07\x18`\x80\x07#L\x80\t0\x1c&\x80\x05\x86\xc1\x04\x18\x03\xdc\xc9xZ\x00\xc8#"\x80a\x02\xb8\x80\x04\xff\xa1\x0cp\xc0@5\xf00\x01\xdc\xc0@\xed|W\x04fp@\x11X\x17+&\x02\x7fh\x18\x8a\xc0\xfb\x16K\xd1\x83\x9b\xc0L\x00\x13\xd0\x80\x80\x82\xfa\xc5\x9c\xe8?]\x00\xce\xf3\xbb\x1e\xc4\xc2D\xe0 \xbc\x98\x1c\xe5\x92\x9d\xad\x049\x04\x8e\xa8\x86*\xd0C\x00\xf4 \x05-\xe8\xc0\x0fr\x90\x82\x1a\x10(\xc1\x0fR\xd0\xb7k\xa9A\n\x1a\xd0\x03\x025TC\x004P\x05\xd5\x80\xa0\x1a\xe40\xe1W\xb6\x7fY\xaa\x97b\xa3\xa5^\x93\x80\xfd\x8d\xe7`\xdcP\x0b\x81_\x8b\x10\x86\x07\xb6\x1d\xea,$9\x82W\xd0\xda\xda\t\xaa\x80\x02\x0cf \x8ft\xb4\x1ev\x03\x178\x7fkA\x98\xe4\x8enu\xe8C\x93;a\x92\x8d7\xb4\x88>\xa4g\xc3$S\xf7\xd0\xa6v\x98Oo\x08\xf3\xab\x1d\xb5\xe8\xa0\n4\xa0\x01?\xe8@\x05\xd5 \x05\x05\x94\x81\x0e\xca@zP\x00\xb4\x10\x00\xe9\x11J@\xcb\xd9\xf8A\x03e\xa0\x01%`\xd0\xccv\xffr;\xbf\xd9\'\xcc\xa7\xffj\xf9\xf5Ja\x02S[\xaf\xed\xb3<\x03\xec\n,\x90\xc0/\x06x\x1e\x9c\x1ef\x0e\xcd\xb3\xa7\x8bE\xa2\xa5(ap\x00\r\xd5\xc0\x1ct\x05\xd7\x99\xc0\x00\x0e\xe0\xc0\xb7\x9cBd\xb6\xb37*<\x9cW\x88\xa0\xfe\xe5o\xcc\xd9\x02N@@C\x10"\xed\xb2\x87p-d\xd3\x14 \x07\xd5\x83\xb1\xc3\x9c\xe8\x87\xf3Y\xca\xa7\x0e\x89)\xef\x80g\xa5X-\x8a\xe7\xa3\x16\x91\xb8\xf9d\x81\xfc\x9f(\xaf\xc55\x87\r\x0f\x9e\x11\x93\xba\x92\xfeT.1\xe9w\xa6\xd2\xaa\xe9=Z\xca\xdf\xe9e\r\x9f\xee\xd8*\xdexp\x1e\xe4\x7f\xab\xf69D25\xad)\xe2>\x925\x99\xdbj\xed\x84\xf4\xa5\x8dR\x90C)\x04\xa0*5v\xbe\x8c\xd5p\xa9\xd4\n\xc3IU\xb2\x17\xfev\xee1vP\x83\tl\xa0\x07\x15XA\x07R0\x81\x0el`[\xec\xd3\x82\nTS\xf5`\x063(A\n6P\x83\r\x14`\x055(\xa6\xea@\x0b60g\x80$k\xec:\xfc\xce%J\xe3\xed\xc09\x05\xfc\x93\xf4\x1dDP)\xd4A\x08\xa8k\x15\xa5\x95\xcd\x1c\xd5\x80\xfa%,\xa2Y\xa1\x0cT`\x82\xb2#\xadz0G\x19=Xn\xf3[\xab\x12\xab\x0c=\x84\x7f\xb7\xcd> W\x1b\xa5\x842\xd0\x82\x12\xf4\xa0\x03]\xbb\x87\xf6&C\x93J\r\xbf6\xb3\x8c\x1a\x94\xa0\x02\xfd\x0b?\x9d\xb4\x8c,m\x8e\xd2w(S\x13\x8e\x94\xe5}\x8e\xfa\xe4~3\xa5P\xb5\xcet\xe9\x92\x97\xbc\x03\xa0\x95\xc4\xd8\xc1\x06r\xd0\x80\x1d\xf4 \x07u\x07=\x96#\xd6*D\x13\x8b/\x15\xa0\xba\x96\xa3\x1c\xb4\xa0X\xaeR\xbd\x10\xd3NU\x82f\xb5\xf0\xe9\x92\x99b!\x90\xae\x94\xc92d\x98,+\x94\xc9V\xaa)\x03}\xfc\xd7\x022{\xca\x9as\x8c\xec?\x1e\xd7\xc8\xff\xb3\xe8\x7f\x9f\xe8\xe0\xc4\x9duB\x070\xfc\x07\x01\xe1,\xb3\x148\xd8\x03\xa8\xd5F^o\ne2\x87m`=B\x05Z\xd0\x82\t\xd4\xa0\x03%\xd8\xc1t\x90\x1d\xe4`\x01\xf3:\xec\xd8\x12\xaf\xa3kE\xa4\x05\xf9\xa1\xdaC\xe3\x8d\xaa\x03tE\x87\xec\x86\xcc{\x8ae\x9d\x86\r\x0f\xdd\xd7\xdaJ\x8da,\xc9\xf2\x11D}\xb2\xf7\x03\x86\xad7\x1a\xcc\xc8?1\x12\xb6\x93\x146\x1a\xdc\x88\xaf1\x9a\xacV\x87\xcfQ1\xca\xe4\xactV\x94\x1bd\xb3\xcb\xe0%\'c\xa3B\xa14\xc8\x8e\x94!T\xe9\xaf\xda d\x1b\x81Q\x00\xb3F\xb5\\_f\x90\x9dp\x86\r\xf8\xb6Oi\t3\xcb\xbf\xfd7\x8cB\xa5V\xa8\xe5Z\x85F\xab\xd3(\x94*\x8d\\\xff\x10\xde\r\xf3\xc9\x01\x10\x92\xd4^\xb9\x06\'\xe2\xf8]Y\x92\xc7\xf3n\x92\xd4k\x85A\xf66\x81\xab\x1c\xdc&\x8f\xaf\xfd\xc1{\xb9\x82R\x97r\tJ\xb9.\xfeR\xa5\xd2\xc8\x15\xf1\xea\xe4\x16/NV\xf1\x85F\xadQ+\xd4\xd62\x95\xa9L\xa1V\xe9\xb4z\xbdEu\xf9\x84Z\xa9\xd2\xa7\xa2\nUY\xfc\xb2L\xa5\xd2i\xcb\xe2\xb3SZ<?E\xc5\x17r\x93\xcdf\xb6\xdb\xe4\x1a\xbb^\xae6\x9b-z\xb9J\xf3\xd5\n\xb5:e\x14:\xb5V\x13\xffa\xb3jTZ\xadI\xadS\xdaMj\xbb\xdcb.S\xd8\xbeZ%W)\xe4\xa9\xe8\xa2L\xa1\x8f\x7f\xd2\x95\xc9\xe5\xf1\xf2_\xc7\x17\xefaJ\xa3S\xca\xa7\xa5\x84@\xa5Ph\x95\xaa\xd4\x0b\x03\xbd\\\xa9\x94+\x14\xf1r^\xd3\xcb\xb5\xfaD~\xaa\x8a\x0fe\xb7\xc0\t/\x0e\x83\x00',
-        "_Name_.SemanticModel/.pbi/editorSettings.json": b'{\r\n  "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/semanticModel/editorSettings/1.0.0/schema.json",\r\n  "autodetectRelationships": true,\r\n  "parallelQueryLoading": true,\r\n  "typeDetectionEnabled": true,\r\n  "relationshipImportEnabled": true,\r\n  "shouldNotifyUserOfNameConflictResolution": true\r\n}',
-        "_Name_.SemanticModel/.pbi/localSettings.json": b'{\r\n  "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/semanticModel/localSettings/1.2.0/schema.json",\r\n  "userConsent": {},\r\n  "securityBindingsSignature": "AQAAANCMnd8BFdERjHoAwE/Cl+sBAAAAEvXDnSdjCU2DmptG1GFlIwAAAAACAAAAAAAQZgAAAAEAACAAAACkTjTPN3lFXo+BMVP5icIcKOWMRHmHUo4RNkWDHEXAIwAAAAAOgAAAAAIAACAAAADIiNCiNdur08o5tdbjypulLinRe6bSebiE8Mj4DV03Z1AAAADmZZLbenw+JEQj20h7ERYPc35NobCS5WQJRBTYtI+TKbm705dUKPZiqguyXtWvja/ynzgPdsuA8oyiAUEwhmuOeAvCS/MezyrNC53yCks2AUAAAAA5sMa2f4MfTICIiZQ/0XbNO8uZ5yKyXdLAtuYCiRtU7J4yr3InjTGl0RNV9AgvH6nKwsq7BLcKYyUTF9uLa1Im"\r\n}',
-        "_Name_.SemanticModel/definition/database.tmdl": b'database\r\n\tcompatibilityLevel: 1600\r\n\r\n',
-        "_Name_.SemanticModel/definition/model.tmdl": b'model Model\r\n\tculture: fr-FR\r\n\tdefaultPowerBIDataSourceVersion: powerBI_V3\r\n\tsourceQueryCulture: fr-FR\r\n\tdataAccessOptions\r\n\t\tlegacyRedirects\r\n\t\treturnErrorValuesAsNull\r\n\r\nannotation __PBI_TimeIntelligenceEnabled = 1\r\n\r\nannotation PBI_ProTooling = ["DevMode"]\r\n\r\nref cultureInfo fr-FR\r\n\r\n',
-        "_Name_.SemanticModel/definition/cultures/fr-FR.tmdl": b'cultureInfo fr-FR\r\n\r\n\tlinguisticMetadata =\r\n\t\t\t{\r\n\t\t\t  "Version": "1.0.0",\r\n\t\t\t  "Language": "en-US"\r\n\t\t\t}\r\n\t\tcontentType: json\r\n\r\n',
-    }
-
-
-
-    # Création des fichiers
-    for relative_path, content in files_to_create.items():
-        # 1. Remplacer 'Base' dans le NOM du fichier/dossier
-        new_relative_path = relative_path.replace("_Name_", new_report_name)
-        
-        full_path = os.path.join(output_folder, new_relative_path)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-
-        # 2. Remplacer 'Base' dans le CONTENU si c'est du texte
-        if is_text_file(content):
-            text_content = content.decode("utf-8")
-            text_content = text_content.replace("_Name_", new_report_name)
-            content_to_write = text_content.encode("utf-8")
-        else:
-            # Si c'est un binaire, on écrit tel quel
-            content_to_write = content
+    if not isinstance(template, ReportTemplate):
+        template = load_template(template)
+    template.write(output_folder, new_report_name)
+
+    make_emitter(quiet=quiet, on_event=on_event).info(
+        "report_created", "✔ Report PBIR '{name}' recréé avec succès dans : {folder}",
+        name=new_report_name, folder=output_folder,
+    )
+
+
+def pbir_empty_files(
+    output_folder: str,
+    reports,
+    template=None,
+    io_workers: int = None,
+    quiet: bool = False,
+    on_event=None
+):
+    """
+    Crée de nombreux rapports PBIR à partir d'un même modèle.
+
+    Le modèle est chargé et découpé une seule fois, les dossiers de tous les
+    rapports sont créés en un lot, puis les fichiers sont écrits sur un pool
+    de threads : le coût par rapport se réduit à l'écriture de ses fichiers.
+
+    Args:
+        output_folder (str): Chemin du dossier de sortie commun à tous les rapports
+            (ou `Storage` : tous les fichiers y sont écrits en un seul `commit`)
+        reports: Noms des rapports (list), ou {nom: {texte du modèle: valeur}}
+            pour remplacer aussi des variables propres à chaque rapport
+        template: Modèle à utiliser (voir `pbir_empty_file`)
+        io_workers (int): Nombre de threads d'écriture (défaut: celui de `PbirProject`)
+        quiet (bool): Si True, rien n'est affiché dans la console
+        on_event: Callback appelé avec chaque `PbirEvent` (optionnel)
+
+    Returns:
+        list: Noms des rapports créés, dans l'ordre de `reports`
+
+    Example:
+        >>> pbir_empty_files("/path/to/output", ["Nord", "Sud", "Est"])
+        >>> pbir_empty_files("/path/to/output", {"Nord": {"_BU_": "Nord"}}, template="/path/to/Modele")
+    """
+    events = make_emitter(quiet=quiet, on_event=on_event)
+    if not isinstance(reports, dict):
+        reports = {name: None for name in reports}
+    for name, variables in reports.items():
+        if not isinstance(name, str) or not name:
+            raise ValueError(f"❌ Nom de rapport invalide : {name!r}")
+        if variables is not None and not all(isinstance(v, str) for v in variables.values()):
+            raise ValueError(f"❌ Les variables du rapport {name} doivent être des chaînes")
+    if not isinstance(template, ReportTemplate):
+        template = load_template(template)
 
-        with open(full_path, 'wb') as f:
-            f.write(content_to_write)
+    if isinstance(output_folder, Storage):
+        output_folder.commit(
+            {
+                rel_path: content
+                for name, variables in reports.items()
+                for rel_path, content in template.render(name, variables)
+            },
+            (),
+        )
+    else:
+        _write_reports(output_folder, template, reports, DEFAULT_IO_WORKERS if io_workers is None else io_workers)
 
-    print(f"✔ Report PBIR '{new_report_name}' recréé avec succès dans : {output_folder}")
+    for name in reports:
+        events.debug("report_created", "Report {name} créé", name=name, folder=output_folder)
+    events.info(
+        "reports_created", "✔ {count} report(s) PBIR créé(s) dans : {folder}",
+        count=len(reports), folder=output_folder,
+    )
+    return list(reports)
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Événements structurés émis par les outils PBIR.
+
+Chaque étape (phase) et chaque objet traité (visuel, groupe, bookmark) émet un
+événement nommé avec ses champs. Un événement peut être :
+- affiché dans la console (niveau INFO et plus, sauf en mode silencieux)
+- transmis au module standard `logging` (logger "pbir_tools")
+- transmis à un callback utilisateur
+
+Le message n'est formaté que si au moins une de ces sorties est active.
+"""
+
+import logging
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+
+logger = logging.getLogger("pbir_tools")
+
+
+class PbirEvent:
+    """
+    Événement transmis aux callbacks.
+
+    Attributes:
+        name: Nom de l'événement (ex: "visual_copied")
+        level: Niveau `logging` (DEBUG, INFO, WARNING)
+        fields: Champs structurés de l'événement
+    """
+
+    __slots__ = ("name", "level", "fields", "_template", "_message")
+
+    def __init__(self, name, level, template, fields):
+        self.name = name
+        self.level = level
+        self.fields = fields
+        self._template = template
+        self._message = None
+
+    @property
+    def message(self):
+        """Message lisible (formaté au premier accès)."""
+        if self._message is None:
+            self._message = self._template.format(**self.fields) if self.fields else self._template
+        return self._message
+
+    def __repr__(self):
+        return f"PbirEvent({self.name!r}, {logging.getLevelName(self.level)}, {self.fields!r})"
+
+
+class EventEmitter:
+    """
+    Point d'émission des événements d'une opération.
+
+    Args:
+        quiet: Si True, rien n'est affiché dans la console
+        callback: Fonction appelée avec chaque `PbirEvent` (optionnel)
+
+    Example:
+        >>> events = EventEmitter(quiet=True, callback=lambda e: print(e.name, e.fields))
+        >>> events.info("page_start", "🔄 Traitement de la page : {page}", page="p1")
+        page_start {'page': 'p1'}
+    """
+
+    def __init__(self, quiet: bool = False, callback=None):
+        self.quiet = quiet
+        self.callback = callback
+
+    def enabled(self, level=DEBUG):
+        """Vrai si un événement de ce niveau serait transmis à au moins une sortie."""
+        return (
+            self.callback is not None
+            or (not self.quiet and level >= INFO)
+            or logger.isEnabledFor(level)
+        )
+
+    def min_level(self):
+        """Plus petit niveau transmis à au moins une sortie (None si aucun)."""
+        for level in (DEBUG, INFO, WARNING):
+            if self.enabled(level):
+                return level
+        return None
+
+    def emit(self, level, event, template="", **fields):
+        """
+        Émet un événement.
+
+        Args:
+            level: Niveau `logging`
+            event: Nom de l'événement
+            template: Message au format `str.format`, rempli avec `fields`
+            **fields: Champs structurés
+        """
+        to_console = not self.quiet and level >= INFO
+        to_logger = logger.isEnabledFor(level)
+        if not (to_console or to_logger or self.callback is not None):
+            return
+
+        pbir_event = PbirEvent(event, level, template, fields)
+        if to_console:
+            print(pbir_event.message)
+        if to_logger:
+            logger.log(level, pbir_event.message.strip("\n"), extra={"event": event, "fields": fields})
+        if self.callback is not None:
+            self.callback(pbir_event)
+
+    def debug(self, event, template="", **fields):
+        """Émet un événement de niveau DEBUG (jamais affiché dans la console)."""
+        self.emit(DEBUG, event, template, **fields)
+
+    def info(self, event, template="", **fields):
+        """Émet un événement de niveau INFO."""
+        self.emit(INFO, event, template, **fields)
+
+    def warning(self, event, template="", **fields):
+        """Émet un événement de niveau WARNING."""
+        self.emit(WARNING, event, template, **fields)
+
+
+class EventRecorder(EventEmitter):
+    """
+    Enregistre les événements au lieu de les émettre.
+
+    Utilisé dans les workers (threads ou processus) : les événements sont
+    rejoués ensuite, dans l'ordre, par le processus principal avec `replay_events`.
+
+    Args:
+        min_level: Niveau minimal à enregistrer (None = rien)
+    """
+
+    def __init__(self, min_level=None):
+        super().__init__(quiet=True)
+        self.min_level_ = min_level
+        self.records = []
+
+    def enabled(self, level=DEBUG):
+        return self.min_level_ is not None and level >= self.min_level_
+
+    def emit(self, level, event, template="", **fields):
+        if self.enabled(level):
+            self.records.append((level, event, template, fields))
+
+
+def replay_events(records, events):
+    """Rejoue des événements enregistrés par un `EventRecorder` sur `events`."""
+    for level, event, template, fields in records:
+        events.emit(level, event, template, **fields)
+
+
+def make_emitter(events=None, quiet: bool = False, on_event=None):
+    """Retourne `events` s'il est fourni, sinon un nouvel `EventEmitter`."""
+    if events is not None:
+        return events
+    return EventEmitter(quiet=quiet, callback=on_event)
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Mode flotte : les mêmes opérations appliquées à de nombreux rapports.
+
+Chaque rapport est traité indépendamment (chargement, opérations, sauvegarde)
+dans un pool de processus : l'échec d'un rapport est enregistré sans
+interrompre les autres, et un bilan agrégé est retourné à la fin.
+"""
+
+import os
+import re
+import glob
+import time
+import traceback
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .project import PbirProject
+from .session import OPERATIONS
+from .cache import content_hash
+from .events import EventRecorder, make_emitter, replay_events
+
+_GLOB_CHARS = re.compile(r"[*?[]")
+
+
+def find_reports(patterns):
+    """
+    Liste les rapports PBIR désignés par des chemins ou des motifs glob.
+
+    Un chemin peut être un dossier `*.Report`, un dossier PBIR contenant un
+    ou plusieurs dossiers `*.Report`, ou une archive .zip d'un dossier PBIR.
+
+    Args:
+        patterns: Chemin ou motif (str), ou liste de chemins et de motifs
+
+    Returns:
+        list: [(dossier PBIR, nom du rapport)], sans doublon, dans l'ordre des motifs
+
+    Raises:
+        ValueError: si un chemin explicite (sans motif) ne contient aucun rapport
+    """
+    if isinstance(patterns, str):
+        patterns = [patterns]
+
+    reports, seen = [], set()
+    for pattern in patterns:
+        paths = sorted(glob.glob(pattern)) if _GLOB_CHARS.search(pattern) else [pattern]
+        found = []
+        for path in paths:
+            path = os.path.normpath(path)
+            if path.endswith(".Report") and os.path.isdir(path):
+                found.append((os.path.dirname(path) or ".", os.path.basename(path)))
+            elif os.path.isdir(path):
+                found.extend(
+                    (path, name) for name in sorted(os.listdir(path))
+                    if name.endswith(".Report") and os.path.isdir(os.path.join(path, name))
+                )
+            elif os.path.isfile(path):
+                from .archive import archive_reports, is_archive
+
+                if is_archive(path):
+                    found.extend((path, name) for name in archive_reports(path))
+        if not found and not _GLOB_CHARS.search(pattern):
+            raise ValueError(f"❌ Aucun rapport PBIR trouvé : {pattern}")
+        for report in found:
+            if report not in seen:
+                seen.add(report)
+                reports.append(report)
+    return reports
+
+
+def _report_cache(cache_dir, pbir_folder_path, report_root_name):
+    """Fichier de cache propre à un rapport dans `cache_dir` (None sans cache)."""
+    if cache_dir is None:
+        return None
+    key = os.path.abspath(os.path.join(pbir_folder_path, report_root_name))
+    return os.path.join(cache_dir, f"{content_hash(key.encode('utf-8'))}.sqlite")
+
+
+def _run_report(report, operations, dry_run, min_level, cache_dir):
+    """
+    Charge un rapport, exécute les opérations et sauvegarde (ou simule).
+
+    Toute exception est capturée : le résultat indique l'échec et son message.
+    """
+    pbir_folder_path, report_root_name = report
+    recorder = EventRecorder(min_level)
+    result = {
+        "report": os.path.join(pbir_folder_path, report_root_name),
+        "ok": True, "stats": None, "error": None, "traceback": None,
+    }
+    started = time.perf_counter()
+    try:
+        cache = _report_cache(cache_dir, pbir_folder_path, report_root_name)
+        with PbirProject(pbir_folder_path, report_root_name, cache=cache) as project:
+            for operation, kwargs in operations:
+                OPERATIONS[operation](project, events=recorder, **kwargs)
+            result["stats"] = project.plan().counts if dry_run else project.save()
+    except Exception as e:
+        result.update(ok=False, error=f"{type(e).__name__}: {e}", traceback=traceback.format_exc())
+    result["seconds"] = time.perf_counter() - started
+    result["events"] = recorder.records
+    return result
+
+
+def pbir_fleet(
+    reports,
+    operations,
+    max_workers: int = None,
+    executor: str = "process",
+    dry_run: bool = False,
+    quiet: bool = False,
+    on_event=None,
+    cache_dir: str = None
+):
+    """
+    Applique les mêmes opérations à plusieurs rapports PBIR, en parallèle.
+
+    Args:
+        reports: Chemin(s) ou motif(s) glob des rapports (voir `find_reports`)
+        operations: Liste de (nom d'opération, paramètres), comme `PbirSession.operations`
+            (ex: [("duplicate_visuals", {"source_page_name": "main"})])
+        max_workers: Nombre de workers (None = nombre de cœurs, 1 = séquentiel)
+        executor: "process" (défaut) ou "thread"
+        dry_run: Si True, calcule les changements de chaque rapport sans rien écrire
+        quiet: Si True, rien n'est affiché dans la console
+        on_event: Callback appelé avec chaque `PbirEvent` (optionnel)
+        cache_dir: Dossier des caches de métadonnées (un fichier par rapport), optionnel
+
+    Returns:
+        dict: {"reports", "succeeded", "failed", totaux des statistiques de
+        sauvegarde (ou des actions si dry_run), "results": [{"report", "ok",
+        "stats", "error", "traceback", "seconds"}]}
+
+    Example:
+        >>> operations = [
+        ...     ("duplicate_visuals", {"source_page_name": "main"}),
+        ...     ("duplicate_bookmark", {"source_page_name": "main"}),
+        ... ]
+        >>> summary = pbir_fleet("C:/PowerBI/*", operations, max_workers=8)
+        >>> [result["report"] for result in summary["results"] if not result["ok"]]
+    """
+    events = make_emitter(quiet=quiet, on_event=on_event)
+
+    operations = [(operation, dict(kwargs)) for operation, kwargs in operations]
+    for operation, _ in operations:
+        if operation not in OPERATIONS:
+            raise ValueError(f"❌ Opération inconnue : {operation}")
+    if executor not in ("process", "thread"):
+        raise ValueError(f"❌ executor inconnu : {executor} (attendu : 'process' ou 'thread')")
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    report_list = find_reports(reports)
+    events.info("fleet_start", "🚚 {count} rapport(s) à traiter", count=len(report_list))
+
+    min_level = events.min_level()
+    args = (operations, dry_run, min_level, cache_dir)
+    if max_workers == 1:
+        results = _collect(((report, partial(_run_report, report, *args)) for report in report_list), events)
+    else:
+        pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        with pool_class(max_workers) as pool:
+            futures = [(report, pool.submit(_run_report, report, *args)) for report in report_list]
+            results = _collect(((report, future.result) for report, future in futures), events)
+
+    summary = {"reports": len(results), "succeeded": 0, "failed": 0}
+    for result in results:
+        summary["succeeded" if result["ok"] else "failed"] += 1
+        for key, value in (result["stats"] or {}).items():
+            summary[key] = summary.get(key, 0) + value
+    summary["results"] = results
+
+    events.info(
+        "fleet_done", "\n🎉 {succeeded}/{reports} rapport(s) traité(s), {failed} échec(s)",
+        **{key: value for key, value in summary.items() if key != "results"},
+    )
+    return summary
+
+
+def _collect(outcomes, events):
+    """
+    Récupère les résultats dans l'ordre des rapports et rejoue leurs événements.
+
+    Un worker interrompu (processus tué...) est compté comme un échec du rapport.
+    """
+    results = []
+    for (pbir_folder_path, report_root_name), get_result in outcomes:
+        try:
+            result = get_result()
+        except Exception as e:
+            result = {
+                "report": os.path.join(pbir_folder_path, report_root_name), "ok": False, "stats": None,
+                "error": f"{type(e).__name__}: {e}", "traceback": traceback.format_exc(),
+                "seconds": 0.0, "events": [],
+            }
+        events.info("fleet_report", "\n📦 Rapport : {report}", report=result["report"])
+        replay_events(result.pop("events"), events)
+        if result["ok"]:
+            events.info(
+                "fleet_report_done", "✅ {report} ({seconds:.2f} s)",
+                report=result["report"], seconds=result["seconds"], stats=result["stats"],
+            )
+        else:
+            events.warning(
+                "fleet_report_failed", "❌ {report} : {error}",
+                report=result["report"], error=result["error"],
+            )
+        results.append(result)
+    return results
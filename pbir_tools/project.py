@@ -0,0 +1,461 @@
+# -*- coding: utf-8 -*-
+"""
+Chargement paresseux d'un projet PBIR.
+
+Les chemins du rapport sont indexés à l'ouverture, mais le contenu d'un fichier
+n'est lu (et parsé) qu'au premier accès. Seul le dossier du rapport
+(`<report_root_name>/`) est indexé : le modèle sémantique, le cache `.abf` et
+les autres artefacts du dossier PBIR ne sont jamais parcourus.
+
+Les fichiers créés, modifiés ou supprimés sont suivis : la sauvegarde n'écrit
+que ceux-là, et ignore ceux dont le contenu est identique à celui du disque.
+
+Un index hiérarchique (page -> page.json / visuels / groupes) est construit en
+une passe et tenu à jour à chaque écriture ou suppression, pour que le coût
+d'accès à une page ne dépende que de la taille de cette page.
+
+Les fichiers sont lus et écrits au travers d'un `Storage` (voir `storage`) :
+dossier PBIR, archive .zip, mémoire ou superposition lecture / écriture. Sur
+un stockage disque, les lectures groupées (`prefetch`) sont réparties sur un
+pool de threads borné.
+"""
+
+from collections import namedtuple
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+
+from . import codec
+from .cache import MetadataCache, content_hash, extract_metadata
+from .storage import DEFAULT_IO_WORKERS, Storage, open_storage
+
+
+# Changement d'un fichier : action "create", "update" ou "delete", empreintes avant / après
+FileChange = namedtuple("FileChange", ["path", "action", "before", "after"])
+
+
+class Changeset:
+    """
+    Plan de sauvegarde : fichiers à créer, modifier ou supprimer.
+
+    Attributes:
+        changes: Liste de `FileChange`, suppressions puis écritures, par chemin
+        unchanged: Chemins modifiés en mémoire mais identiques au disque
+
+    Example:
+        >>> changeset = project.plan()
+        >>> if changeset:
+        ...     project.apply(changeset)
+    """
+
+    def __init__(self, changes, unchanged=()):
+        self.changes = list(changes)
+        self.unchanged = list(unchanged)
+
+    @property
+    def counts(self):
+        """Nombre de fichiers par action : {"create", "update", "delete", "unchanged"}."""
+        counts = {"create": 0, "update": 0, "delete": 0, "unchanged": len(self.unchanged)}
+        for change in self.changes:
+            counts[change.action] += 1
+        return counts
+
+    def to_dict(self):
+        """Représentation sérialisable en JSON."""
+        return {"changes": [change._asdict() for change in self.changes], "counts": self.counts}
+
+    def __iter__(self):
+        return iter(self.changes)
+
+    def __len__(self):
+        return len(self.changes)
+
+    def __repr__(self):
+        return f"Changeset({self.counts})"
+
+
+class PbirProject(MutableMapping):
+    """
+    Vue dictionnaire `{chemin relatif: bytes}` d'un rapport PBIR, chargée à la demande.
+
+    Les clés sont relatives à `pbir_folder_path` et utilisent des "/" (ex:
+    "Report1.Report/definition/pages/main/page.json"), comme l'ancien `files_dict`.
+
+    Args:
+        pbir_folder_path: Chemin vers le dossier PBIR décompressé, vers une
+            archive .zip de ce dossier, ou `Storage` (voir `storage`)
+        report_root_name: Nom du rapport (ex: "Report1.Report" ; dans une archive,
+            chemin du dossier du rapport, ex: "Projet/Report1.Report")
+        io_workers: Nombre de threads pour le parcours et les lectures groupées
+            (1 = tout en série ; sans effet sur un stockage en mémoire)
+        cache: Cache persistant des métadonnées (`MetadataCache` ou chemin du
+            fichier SQLite, hors du dossier du rapport) utilisé par `metadata()`
+
+    Example:
+        >>> with PbirProject("/path/to/pbir", "Report1.Report") as project:
+        ...     page = project.load_json("Report1.Report/definition/pages/main/page.json")
+        >>> archived = PbirProject("/path/to/backup.zip", "Report1.Report")
+        >>> in_memory = PbirProject(MemoryStorage.copy_of("/path/to/pbir"), "Report1.Report")
+    """
+
+    def __init__(
+        self, pbir_folder_path: str, report_root_name: str, io_workers: int = DEFAULT_IO_WORKERS, cache=None
+    ):
+        self.pbir_folder_path = pbir_folder_path
+        self.report_root_name = report_root_name
+        self.io_workers = max(1, io_workers or 1)
+        self.cache = MetadataCache(cache) if isinstance(cache, str) else cache
+        self._owns_cache = isinstance(cache, str)
+        self.storage = open_storage(pbir_folder_path, self.io_workers)
+        self._owns_storage = not isinstance(pbir_folder_path, Storage)
+        self._paths = {}     # chemin relatif -> None (ensemble ordonné des fichiers du rapport)
+        self._contents = {}  # chemin relatif -> bytes (lus ou écrits)
+        self._json = {}      # chemin relatif -> objet JSON parsé
+        self._originals = {}  # chemin relatif -> bytes lus sur disque avant modification
+        self._on_disk = set()  # chemins présents sur disque à la dernière synchro
+        self._dirty = set()    # chemins créés ou modifiés depuis la dernière synchro
+        self._deleted = set()  # chemins supprimés depuis la dernière synchro
+        self.pages_prefix = f"{report_root_name}/definition/pages/"
+        self.bookmarks_prefix = f"{report_root_name}/definition/bookmarks/"
+        self._pages = {}       # page -> {"page": chemin page.json, "visuals": {...}, "groups": {...}}
+        self._bookmarks = {}   # chemin -> None (ensemble ordonné des fichiers de bookmarks)
+        self._scan()
+
+    # ===== Indexation =====
+    def _scan(self):
+        """Indexe les chemins du dossier du rapport, sans lire les fichiers."""
+        root_rel = self.report_root_name.replace("\\", "/").strip("/")
+        for rel_path in self.storage.list(root_rel):
+            self._paths[rel_path] = None
+            self._index(rel_path)
+        self._on_disk = set(self._paths)
+
+    def _page_entry(self, page):
+        entry = self._pages.get(page)
+        if entry is None:
+            entry = self._pages[page] = {"page": None, "visuals": {}, "groups": {}}
+        return entry
+
+    def _index(self, rel_path):
+        """Ajoute un chemin à l'index des pages / bookmarks."""
+        if rel_path.startswith(self.pages_prefix):
+            parts = rel_path[len(self.pages_prefix):].split("/")
+            if len(parts) == 2 and parts[1] == "page.json":
+                self._page_entry(parts[0])["page"] = rel_path
+            elif len(parts) == 4 and parts[1] == "visuals":
+                if parts[3] == "visual.json":
+                    self._page_entry(parts[0])["visuals"][parts[2]] = rel_path
+                elif parts[3] == "group.json":
+                    self._page_entry(parts[0])["groups"][parts[2]] = rel_path
+        elif rel_path.startswith(self.bookmarks_prefix):
+            self._bookmarks[rel_path] = None
+
+    def _unindex(self, rel_path):
+        """Retire un chemin de l'index des pages / bookmarks."""
+        if rel_path.startswith(self.pages_prefix):
+            parts = rel_path[len(self.pages_prefix):].split("/")
+            entry = self._pages.get(parts[0])
+            if entry is None:
+                return
+            if len(parts) == 2 and parts[1] == "page.json":
+                entry["page"] = None
+            elif len(parts) == 4 and parts[1] == "visuals":
+                if parts[3] == "visual.json":
+                    entry["visuals"].pop(parts[2], None)
+                elif parts[3] == "group.json":
+                    entry["groups"].pop(parts[2], None)
+        else:
+            self._bookmarks.pop(rel_path, None)
+
+    # ===== Index des pages =====
+    def page_names(self):
+        """Noms (dossiers) des pages possédant un page.json, dans l'ordre d'indexation."""
+        return [page for page, entry in self._pages.items() if entry["page"]]
+
+    def page_json_path(self, page):
+        """Chemin du page.json d'une page, ou None."""
+        entry = self._pages.get(page)
+        return entry["page"] if entry else None
+
+    def page_visuals(self, page):
+        """Visuels d'une page : {id du visuel: chemin du visual.json}."""
+        entry = self._pages.get(page)
+        return dict(entry["visuals"]) if entry else {}
+
+    def page_groups(self, page):
+        """Groupes d'une page : {id du groupe: chemin du group.json}."""
+        entry = self._pages.get(page)
+        return dict(entry["groups"]) if entry else {}
+
+    def bookmark_paths(self):
+        """Chemins des fichiers du dossier bookmarks, dans l'ordre d'indexation."""
+        return list(self._bookmarks)
+
+    # ===== Lectures groupées =====
+    def prefetch(self, rel_paths):
+        """
+        Lit en parallèle les fichiers donnés qui ne sont pas encore chargés.
+
+        Le résultat est identique à des accès `project[path]` successifs ;
+        seules les latences d'ouverture sont recouvertes.
+        """
+        missing = [p for p in rel_paths if p in self._paths and p not in self._contents]
+        if len(missing) < 2 or self.io_workers == 1 or not self.storage.concurrent:
+            for rel_path in missing:
+                self[rel_path]
+            return
+        with ThreadPoolExecutor(min(self.io_workers, len(missing))) as pool:
+            for rel_path, content in zip(missing, pool.map(self.storage.read, missing)):
+                self._contents[rel_path] = content
+
+    # ===== Accès type dictionnaire =====
+    def __getitem__(self, rel_path):
+        if rel_path in self._contents:
+            return self._contents[rel_path]
+        if rel_path not in self._paths:
+            raise KeyError(rel_path)
+        content = self.storage.read(rel_path)
+        self._contents[rel_path] = content
+        return content
+
+    def __setitem__(self, rel_path, content):
+        if rel_path not in self._paths:
+            self._paths[rel_path] = None
+            self._index(rel_path)
+        if rel_path in self._on_disk and rel_path in self._contents:
+            self._originals.setdefault(rel_path, self._contents[rel_path])
+        self._contents[rel_path] = content
+        self._json.pop(rel_path, None)
+        self._dirty.add(rel_path)
+        self._deleted.discard(rel_path)
+
+    def __delitem__(self, rel_path):
+        del self._paths[rel_path]
+        self._unindex(rel_path)
+        self._contents.pop(rel_path, None)
+        self._json.pop(rel_path, None)
+        self._dirty.discard(rel_path)
+        if rel_path in self._on_disk:
+            self._deleted.add(rel_path)
+
+    def __contains__(self, rel_path):
+        return rel_path in self._paths
+
+    def __iter__(self):
+        return iter(list(self._paths))
+
+    def __len__(self):
+        return len(self._paths)
+
+    # ===== JSON =====
+    def load_json(self, rel_path):
+        """
+        Retourne le contenu JSON parsé d'un fichier (parsé une seule fois).
+
+        L'objet retourné est partagé : le copier avant de le modifier,
+        ou le réécrire ensuite avec `set_json`.
+        """
+        if rel_path not in self._json:
+            self._json[rel_path] = codec.loads(self[rel_path])
+        return self._json[rel_path]
+
+    def set_json(self, rel_path, data, content=None, like=None):
+        """
+        Enregistre `data` sous `rel_path`, dans la mise en forme du fichier existant.
+
+        Un fichier existant garde ses fins de ligne, son indentation et son saut de
+        ligne final ; s'il est sémantiquement inchangé, il n'est pas marqué modifié.
+
+        Args:
+            rel_path: Chemin relatif du fichier
+            data: Objet JSON (None si seul `content` est connu)
+            content: bytes déjà sérialisés (sinon `data` est sérialisé)
+            like: Chemin d'un fichier dont reprendre la mise en forme si
+                `rel_path` n'existe pas encore (ex: le fichier source d'une copie)
+
+        Returns:
+            bool: True si le contenu du fichier a changé
+        """
+        exists = rel_path in self._paths
+        if content is None:
+            if exists:
+                content, _ = codec.dumps_like(data, self[rel_path])
+            else:
+                fmt = codec.detect_format(self[like]) if like in self._paths else None
+                content = codec.dumps(data, fmt)
+        changed = not exists or self[rel_path] != content
+        if changed:
+            self[rel_path] = content
+        if data is not None:
+            self._json[rel_path] = data
+        return changed
+
+    def metadata(self, rel_path):
+        """
+        Champs utiles à la sélection d'un fichier (voir `extract_metadata`).
+
+        Avec un cache, un fichier inchangé dans le stockage n'est ni lu ni parsé ;
+        sans cache (ou pour un fichier modifié en mémoire), seuls les champs
+        extraits sont parsés (voir `codec.LazyDocument`).
+        """
+        if self.cache is None or rel_path in self._dirty or rel_path not in self._on_disk:
+            return self._extract_metadata(rel_path)
+
+        version = self.storage.stat(rel_path)
+        if version is None:
+            # Stockage sans version (mémoire) : le cache n'apporte rien
+            return self._extract_metadata(rel_path)
+        size, mtime = version
+        meta = self.cache.get(rel_path, size, mtime)
+        if meta is not None:
+            return meta
+        digest = content_hash(self[rel_path])
+        meta = self.cache.get_by_hash(rel_path, size, mtime, digest)
+        if meta is None:
+            meta = self._extract_metadata(rel_path)
+            self.cache.put(rel_path, size, mtime, digest, meta)
+        return meta
+
+    def _extract_metadata(self, rel_path):
+        if rel_path in self._json:
+            return extract_metadata(rel_path, self._json[rel_path])
+        doc = codec.LazyDocument(self[rel_path])
+        meta = extract_metadata(rel_path, doc)
+        if doc.parsed is not None:
+            # Document parsé en entier (non indenté) : inutile de le re-parser
+            self._json[rel_path] = doc.parsed
+        return meta
+
+    # ===== Suivi des modifications =====
+    def changes(self):
+        """
+        Retourne les chemins modifiés depuis la dernière synchro.
+
+        Returns:
+            dict: {"created": [...], "modified": [...], "deleted": [...]}
+        """
+        return {
+            "created": sorted(p for p in self._dirty if p not in self._on_disk),
+            "modified": sorted(p for p in self._dirty if p in self._on_disk),
+            "deleted": sorted(self._deleted),
+        }
+
+    def _disk_content(self, rel_path):
+        """Contenu actuel du fichier sur disque (None s'il n'existe pas)."""
+        if rel_path in self._originals:
+            return self._originals[rel_path]
+        try:
+            return self.storage.read(rel_path)
+        except OSError:
+            return None
+
+    # ===== Plan et sauvegarde =====
+    def plan(self):
+        """
+        Calcule les écritures et suppressions d'une sauvegarde, sans toucher au disque.
+
+        Les fichiers modifiés dont le contenu est identique au disque n'y figurent
+        pas (ils sont seulement comptés comme inchangés).
+
+        Returns:
+            Changeset: Changements à appliquer avec `apply`
+        """
+        changes = []
+        unchanged = []
+
+        for rel_path in sorted(self._deleted):
+            before = self._disk_content(rel_path)
+            if before is not None:
+                changes.append(FileChange(rel_path, "delete", content_hash(before), None))
+
+        for rel_path in sorted(self._dirty):
+            content = self._contents[rel_path]
+            before = self._disk_content(rel_path)
+            if before == content:
+                unchanged.append(rel_path)
+            elif before is None:
+                changes.append(FileChange(rel_path, "create", None, content_hash(content)))
+            else:
+                changes.append(FileChange(rel_path, "update", content_hash(before), content_hash(content)))
+
+        return Changeset(changes, unchanged)
+
+    def apply(self, changeset):
+        """
+        Applique un plan calculé par `plan` sur ce projet.
+
+        Raises:
+            ValueError: Si un fichier a été modifié, recréé ou restauré en mémoire
+                depuis le calcul du plan
+
+        Returns:
+            dict: Nombre de fichiers {"written": n, "skipped": n, "deleted": n}
+        """
+        for change in changeset.changes:
+            if change.action == "delete":
+                # Toujours supprimé, et le fichier sur disque est celui du plan
+                before = self._disk_content(change.path) if change.path in self._deleted else None
+                stale = before is None or content_hash(before) != change.before
+            else:
+                stale = content_hash(self._contents.get(change.path, b"")) != change.after
+            if stale:
+                raise ValueError(f"❌ Plan obsolète : {change.path} a changé depuis le calcul du plan")
+
+        deletes = [change.path for change in changeset.changes if change.action == "delete"]
+        writes = {
+            change.path: self._contents[change.path]
+            for change in changeset.changes if change.action != "delete"
+        }
+        if deletes or writes:
+            self.storage.commit(writes, deletes)
+        stats = {"written": len(writes), "skipped": len(changeset.unchanged), "deleted": len(deletes)}
+
+        for change in changeset.changes:
+            if change.action == "delete":
+                self._on_disk.discard(change.path)
+                self._deleted.discard(change.path)
+            else:
+                self._on_disk.add(change.path)
+                self._dirty.discard(change.path)
+            self._originals.pop(change.path, None)
+
+        for rel_path in changeset.unchanged:
+            self._dirty.discard(rel_path)
+            self._originals.pop(rel_path, None)
+
+        if self.cache is not None:
+            self.cache.flush()
+        return stats
+
+    def save(self):
+        """
+        Écrit sur disque les fichiers créés ou modifiés et supprime les fichiers supprimés.
+
+        Les fichiers jamais modifiés ne sont pas réécrits, de même que ceux dont
+        le contenu sérialisé est identique à celui du disque.
+
+        Returns:
+            dict: Nombre de fichiers {"written": n, "skipped": n, "deleted": n}
+        """
+        return self.apply(self.plan())
+
+    def close(self):
+        """
+        Écrit le cache de métadonnées, et le ferme s'il a été ouvert par le projet.
+
+        Ferme aussi le stockage s'il a été ouvert par le projet (archive .zip...).
+        """
+        if self._owns_storage:
+            self.storage.close()
+            self._owns_storage = False
+        if self.cache is not None:
+            self.cache.flush()
+        if self._owns_cache:
+            self.cache.close()
+            self._owns_cache = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+Sélection des visuels d'une page par titre, motif, type ou groupe.
+
+Syntaxe d'un sélecteur (insensible à la casse) :
+- "Mon Graphique" : titre exact
+- "KPI*", "Vente ?" : motif glob sur le titre (`*` et `?`)
+- "re:^KPI \\d+$" : expression régulière sur le titre
+- "type:card" : type de visuel (`visual.visualType`)
+- "group:g1" : groupe parent (identifiant du groupe)
+- "title:Ventes*" : titre exact, pris littéralement (ni motif ni préfixe) :
+  pour un titre contenant `*`, `?` ou `[`, ou commençant par "type:"...
+
+Les sélecteurs sont compilés une fois, et l'index d'une page (titre, type,
+groupe -> identifiants) est construit une fois à partir des métadonnées : un
+titre, un type ou un groupe se résout par une recherche directe, un motif glob
+par une plage de titres triés (préfixe littéral), et seule une expression
+régulière parcourt les titres distincts de la page.
+"""
+
+import re
+import fnmatch
+from bisect import bisect_left
+
+_GLOB_CHARS = re.compile(r"[*?]")
+
+
+def normalize_title(title):
+    """Titre normalisé pour la comparaison (espaces retirés, majuscules)."""
+    return title.strip().upper()
+
+
+class Selector:
+    """
+    Sélecteur compilé (voir la syntaxe en tête du module).
+
+    Attributes:
+        kind: "title", "glob", "regex", "type" ou "group"
+        value: Valeur normalisée (titre, type ou groupe ; motif pour glob et regex)
+    """
+
+    __slots__ = ("kind", "value", "pattern", "prefix")
+
+    def __init__(self, spec):
+        if not isinstance(spec, str):
+            raise ValueError(f"❌ Sélecteur de visuel invalide : {spec!r} (chaîne attendue)")
+        self.pattern = None
+        self.prefix = ""
+        head, sep, rest = spec.partition(":")
+        kind = head.strip().lower() if sep else ""
+        if kind == "title":
+            self.kind, self.value = "title", normalize_title(rest)
+        elif kind in ("type", "group"):
+            self.kind, self.value = kind, rest.strip().upper()
+        elif kind == "re":
+            self.kind, self.value = "regex", rest
+            try:
+                self.pattern = re.compile(rest, re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"❌ Expression régulière invalide : {rest} ({e})") from None
+        elif _GLOB_CHARS.search(spec):
+            self.kind, self.value = "glob", normalize_title(spec)
+            self.pattern = re.compile(fnmatch.translate(self.value), re.IGNORECASE)
+            # Préfixe littéral : restreint la recherche à une plage de titres triés
+            self.prefix = re.split(r"[*?\[]", self.value, 1)[0]
+        else:
+            self.kind, self.value = "title", normalize_title(spec)
+
+    def __repr__(self):
+        return f"Selector({self.kind}={self.value!r})"
+
+
+def compile_selectors(visual_name):
+    """
+    Compile `visual_name` (str, list ou None) en liste de `Selector`.
+
+    Retourne None (tous les visuels) si `visual_name` est None ou une liste vide.
+
+    Raises:
+        ValueError: si `visual_name` n'est ni str, ni list, ni None, ou si une
+            expression régulière est invalide
+    """
+    if visual_name is None or visual_name == []:
+        return None
+    if isinstance(visual_name, str):
+        visual_name = [visual_name]
+    elif not isinstance(visual_name, list):
+        raise ValueError("visual_name doit être string, list ou None")
+    return [Selector(spec) for spec in visual_name]
+
+
+class SelectorIndex:
+    """
+    Index des visuels d'une page par titre normalisé, type et groupe parent.
+
+    Args:
+        metadata: Itérable de (vis_id, métadonnées) dans l'ordre de la page
+            (voir `cache.extract_metadata`)
+
+    Example:
+        >>> visuals = project.page_visuals("main")
+        >>> index = SelectorIndex((vis_id, project.metadata(path)) for vis_id, path in visuals.items())
+        >>> index.select(compile_selectors(["KPI*", "type:card"]))
+        ['v1', 'v4']
+    """
+
+    def __init__(self, metadata):
+        self.order = {}      # vis_id -> rang dans la page
+        self.by_title = {}   # titre normalisé -> [vis_id]
+        self.by_type = {}
+        self.by_group = {}
+        for vis_id, meta in metadata:
+            self.order[vis_id] = len(self.order)
+            self.by_title.setdefault(normalize_title(meta["title"]), []).append(vis_id)
+            visual_type = meta.get("visualType")
+            if visual_type is not None:
+                self.by_type.setdefault(str(visual_type).upper(), []).append(vis_id)
+            group = meta.get("parentGroupName")
+            if group is not None:
+                self.by_group.setdefault(str(group).upper(), []).append(vis_id)
+        self.titles = sorted(self.by_title)
+
+    def match(self, selector):
+        """Identifiants des visuels correspondant à un sélecteur (ordre non garanti)."""
+        if selector.kind == "title":
+            return self.by_title.get(selector.value, [])
+        if selector.kind == "type":
+            return self.by_type.get(selector.value, [])
+        if selector.kind == "group":
+            return self.by_group.get(selector.value, [])
+
+        ids = []
+        if selector.kind == "glob":
+            # Seuls les titres commençant par le préfixe littéral sont testés
+            for i in range(bisect_left(self.titles, selector.prefix), len(self.titles)):
+                title = self.titles[i]
+                if not title.startswith(selector.prefix):
+                    break
+                if selector.pattern.match(title):
+                    ids.extend(self.by_title[title])
+        else:
+            for title in self.titles:
+                if selector.pattern.search(title):
+                    ids.extend(self.by_title[title])
+        return ids
+
+    def select(self, selectors):
+        """
+        Identifiants des visuels correspondant à au moins un sélecteur, dans l'ordre de la page.
+
+        `selectors` vaut None pour sélectionner tous les visuels.
+        """
+        if selectors is None:
+            return list(self.order)
+        ids = set()
+        for selector in selectors:
+            ids.update(self.match(selector))
+        return sorted(ids, key=self.order.__getitem__)
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Session PBIR : plusieurs opérations sur un seul chargement du rapport.
+
+Les opérations (duplication de visuels, de bookmarks) sont mises en file puis
+exécutées dans l'ordre sur un même projet en mémoire, avec une seule
+sauvegarde à la fin.
+"""
+
+from .project import PbirProject
+from .visuals import duplicate_visuals
+from .bookmarks import duplicate_bookmark
+from .events import make_emitter
+
+# Opérations disponibles, par nom
+OPERATIONS = {
+    "duplicate_visuals": duplicate_visuals,
+    "duplicate_bookmark": duplicate_bookmark,
+}
+
+
+class PbirSession:
+    """
+    File d'opérations appliquées à un seul chargement du rapport.
+
+    Args:
+        pbir_folder_path: Chemin vers le dossier PBIR décompressé, son archive .zip ou un `Storage`
+        report_root_name: Nom du rapport (ex: "Report1.Report")
+        quiet: Si True, rien n'est affiché dans la console
+        on_event: Callback appelé avec chaque `PbirEvent` (optionnel)
+        cache: Fichier du cache de métadonnées (voir `PbirProject`), optionnel
+
+    Example:
+        >>> with PbirSession("/path/to/pbir", "Report1.Report") as session:
+        ...     session.duplicate_visuals("main", ["page2"])
+        ...     session.duplicate_visuals("header", ["page2"])
+        ...     session.duplicate_bookmark("main")
+    """
+
+    def __init__(
+        self, pbir_folder_path: str, report_root_name: str, quiet: bool = False, on_event=None, cache=None
+    ):
+        self.pbir_folder_path = pbir_folder_path
+        self.report_root_name = report_root_name
+        self.cache = cache
+        self.events = make_emitter(quiet=quiet, on_event=on_event)
+        self.operations = []
+
+    def add(self, operation: str, **kwargs):
+        """
+        Ajoute une opération à la file.
+
+        Args:
+            operation: Nom de l'opération (clé de OPERATIONS)
+            **kwargs: Paramètres de l'opération (hors chemin du rapport)
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"❌ Opération inconnue : {operation}")
+        self.operations.append((operation, kwargs))
+        return self
+
+    def duplicate_visuals(
+        self, source_page_name="main", target_pages=None, visual_name=None,
+        max_workers=None, executor="process"
+    ):
+        """Met en file une duplication de visuels (voir `pbir_duplicate_visuals`)."""
+        return self.add(
+            "duplicate_visuals",
+            source_page_name=source_page_name,
+            target_pages=target_pages,
+            visual_name=visual_name,
+            max_workers=max_workers,
+            executor=executor,
+        )
+
+    def duplicate_bookmark(self, source_page_name="main", target_pages=None, bookmark_name=None):
+        """Met en file une synchronisation de bookmarks (voir `pbir_duplicate_bookmark`)."""
+        return self.add(
+            "duplicate_bookmark",
+            source_page_name=source_page_name,
+            target_pages=target_pages,
+            bookmark_name=bookmark_name,
+        )
+
+    def run(self, project: PbirProject):
+        """Exécute les opérations en file sur un projet déjà chargé, sans sauvegarder."""
+        results = []
+        for operation, kwargs in self.operations:
+            self.events.info("operation", "\n▶ {operation}", operation=operation, **kwargs)
+            results.append(OPERATIONS[operation](project, events=self.events, **kwargs))
+        return results
+
+    def plan(self):
+        """
+        Charge le rapport et exécute toutes les opérations sans rien écrire (simulation).
+
+        La file d'opérations est conservée : `commit()` peut être appelé ensuite.
+
+        Returns:
+            Changeset: Fichiers qui seraient créés, modifiés et supprimés
+        """
+        with PbirProject(self.pbir_folder_path, self.report_root_name, cache=self.cache) as project:
+            self.run(project)
+            changeset = project.plan()
+        self.events.info(
+            "plan", "📝 Simulation : {create} création(s), {update} modification(s), {delete} suppression(s)",
+            **changeset.counts,
+        )
+        return changeset
+
+    def commit(self):
+        """
+        Charge le rapport, exécute toutes les opérations puis sauvegarde une seule fois.
+
+        Returns:
+            dict: Statistiques de sauvegarde {"written": n, "skipped": n, "deleted": n}
+        """
+        with PbirProject(self.pbir_folder_path, self.report_root_name, cache=self.cache) as project:
+            self.run(project)
+            stats = project.save()
+        self.events.info(
+            "saved", "💾 {written} fichier(s) écrit(s), {skipped} inchangé(s), {deleted} supprimé(s)",
+            **stats,
+        )
+        self.operations = []
+        return stats
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        return False
@@ -0,0 +1,374 @@
+# -*- coding: utf-8 -*-
+"""
+Stockages des fichiers d'un projet PBIR.
+
+`PbirProject` ne lit et n'écrit ses fichiers qu'au travers d'un `Storage` :
+- `DirectoryStorage` : dossier PBIR sur disque (comportement historique)
+- `ArchiveStorage` : archive .zip du dossier PBIR (voir `archive`)
+- `MemoryStorage` : fichiers en mémoire, sans aucune entrée / sortie disque
+- `OverlayStorage` : lit une couche de base, écrit dans une autre couche
+
+Toutes les fonctions publiques acceptent un `Storage` à la place du chemin du
+dossier PBIR : un chemin est converti par `open_storage`.
+
+Les chemins sont relatifs à la racine du stockage et utilisent des "/"
+(ex: "Report1.Report/definition/pages/main/page.json").
+"""
+
+import abc
+import os
+
+# Nombre de threads d'entrée/sortie par défaut (parcours et lectures)
+DEFAULT_IO_WORKERS = 8
+
+
+def _list_dir(path):
+    """Liste un dossier : ([noms de fichiers], [noms de sous-dossiers]), dans l'ordre de scandir."""
+    files, dirs = [], []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.name)
+                else:
+                    files.append(entry.name)
+    except OSError:
+        pass
+    return files, dirs
+
+
+def _read_file(full_path):
+    with open(full_path, "rb") as f:
+        return f.read()
+
+
+class Storage(abc.ABC):
+    """
+    Interface d'un stockage de fichiers : lister, lire, écrire, supprimer.
+
+    Les sous-classes implémentent `list`, `read`, `write` et `delete`
+    (méthodes abstraites : un stockage incomplet ne peut pas être créé) ;
+    `stat`, `commit` et `close` ont un comportement par défaut.
+
+    Attributes:
+        concurrent: True si des lectures simultanées (threads) recouvrent des
+            latences d'entrée / sortie ; False pour un stockage en mémoire
+    """
+
+    concurrent = False
+
+    @abc.abstractmethod
+    def list(self, folder=""):
+        """Chemins des fichiers sous `folder` ("" = tout le stockage)."""
+
+    @abc.abstractmethod
+    def read(self, rel_path):
+        """
+        Contenu d'un fichier.
+
+        Raises:
+            FileNotFoundError: si le fichier n'existe pas
+        """
+
+    @abc.abstractmethod
+    def write(self, rel_path, content):
+        """Crée ou remplace un fichier (les dossiers parents sont implicites)."""
+
+    @abc.abstractmethod
+    def delete(self, rel_path):
+        """Supprime un fichier (sans erreur s'il n'existe pas)."""
+
+    def stat(self, rel_path):
+        """
+        (taille, version) d'un fichier sans le lire, clé du cache de métadonnées.
+
+        Retourne None si le stockage n'a pas de version à proposer : le cache
+        n'est alors pas utilisé.
+
+        Raises:
+            FileNotFoundError: si le fichier n'existe pas
+        """
+        return None
+
+    def commit(self, writes, deletes):
+        """
+        Applique une sauvegarde : suppressions puis écritures.
+
+        Args:
+            writes: {chemin: contenu bytes} des fichiers créés ou modifiés
+            deletes: Chemins des fichiers à supprimer
+        """
+        for rel_path in deletes:
+            self.delete(rel_path)
+        for rel_path, content in writes.items():
+            self.write(rel_path, content)
+
+    def close(self):
+        """Libère les ressources du stockage (fichiers ouverts...)."""
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class DirectoryStorage(Storage):
+    """
+    Dossier PBIR décompressé sur disque.
+
+    Sur un partage réseau (SMB, OneDrive...), chaque ouverture de fichier coûte
+    plusieurs millisecondes : le parcours des dossiers est réparti sur un pool
+    de threads borné, et les lectures groupées de `PbirProject.prefetch` aussi.
+
+    Args:
+        path: Chemin du dossier PBIR
+        io_workers: Nombre de threads pour le parcours (1 = en série)
+    """
+
+    concurrent = True
+
+    def __init__(self, path, io_workers=DEFAULT_IO_WORKERS):
+        self.path = path
+        self.io_workers = max(1, io_workers or 1)
+
+    def _full(self, rel_path):
+        return os.path.join(self.path, *rel_path.split("/")) if rel_path else self.path
+
+    def list(self, folder=""):
+        """
+        Chemins des fichiers sous `folder`, dans l'ordre d'un `os.walk` descendant.
+
+        Les dossiers sont listés en parallèle (`os.scandir`), puis parcourus
+        dans l'ordre de `os.walk` : fichiers du dossier, puis sous-dossiers.
+        """
+        root_rel = folder.replace("\\", "/").strip("/")
+        listings = {}  # chemin relatif du dossier -> (fichiers, sous-dossiers)
+
+        def join(rel_dir, name):
+            return f"{rel_dir}/{name}" if rel_dir else name
+
+        if self.io_workers == 1:
+            pending = [root_rel]
+            while pending:
+                rel_dir = pending.pop()
+                listings[rel_dir] = _list_dir(self._full(rel_dir))
+                pending.extend(join(rel_dir, d) for d in listings[rel_dir][1])
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(self.io_workers) as pool:
+                futures = {root_rel: pool.submit(_list_dir, self._full(root_rel))}
+                while futures:
+                    rel_dir, future = futures.popitem()
+                    listings[rel_dir] = future.result()
+                    for d in listings[rel_dir][1]:
+                        sub = join(rel_dir, d)
+                        futures[sub] = pool.submit(_list_dir, self._full(sub))
+
+        paths = []
+        stack = [root_rel]
+        while stack:
+            rel_dir = stack.pop()
+            files, dirs = listings[rel_dir]
+            paths.extend(join(rel_dir, file) for file in files)
+            stack.extend(join(rel_dir, d) for d in reversed(dirs))
+        return paths
+
+    def read(self, rel_path):
+        return _read_file(self._full(rel_path))
+
+    def write(self, rel_path, content):
+        full_path = self._full(rel_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "wb") as f:
+            f.write(content)
+
+    def delete(self, rel_path):
+        try:
+            os.remove(self._full(rel_path))
+        except FileNotFoundError:
+            pass
+
+    def stat(self, rel_path):
+        stat = os.stat(self._full(rel_path))
+        return stat.st_size, stat.st_mtime_ns
+
+    def commit(self, writes, deletes):
+        """Suppressions puis écritures, chaque dossier parent n'étant créé qu'une fois."""
+        for rel_path in deletes:
+            self.delete(rel_path)
+        for folder in sorted({os.path.dirname(self._full(rel_path)) for rel_path in writes}):
+            os.makedirs(folder, exist_ok=True)
+        for rel_path, content in writes.items():
+            with open(self._full(rel_path), "wb") as f:
+                f.write(content)
+
+    def __repr__(self):
+        return f"DirectoryStorage({self.path!r})"
+
+
+class MemoryStorage(Storage):
+    """
+    Fichiers en mémoire : aucune entrée / sortie disque.
+
+    Permet d'enchaîner des opérations (chacune relit l'état laissé par la
+    précédente), de tester ou de mesurer sans disque.
+
+    Args:
+        files: {chemin: contenu bytes} initial (copié), optionnel
+
+    Attributes:
+        files: {chemin: contenu bytes}, dans l'ordre de création
+
+    Example:
+        >>> storage = MemoryStorage.copy_of("C:/PowerBI/Report1")
+        >>> pbir_duplicate_visuals(storage, "Report1.Report", "main", quiet=True)
+        >>> pbir_duplicate_bookmark(storage, "Report1.Report", "main", quiet=True)
+        >>> DirectoryStorage("C:/PowerBI/Resultat").commit(storage.files, ())
+    """
+
+    def __init__(self, files=None):
+        self.files = dict(files or {})
+
+    @classmethod
+    def copy_of(cls, source, folder=""):
+        """
+        Copie en mémoire des fichiers d'un autre stockage (ou d'un chemin).
+
+        Args:
+            source: `Storage`, dossier PBIR ou archive .zip
+            folder: Dossier à copier ("" = tout le stockage)
+        """
+        storage = open_storage(source)
+        try:
+            return cls({rel_path: storage.read(rel_path) for rel_path in storage.list(folder)})
+        finally:
+            if storage is not source:
+                storage.close()
+
+    def list(self, folder=""):
+        prefix = folder.strip("/") + "/" if folder.strip("/") else ""
+        return [rel_path for rel_path in self.files if rel_path.startswith(prefix)]
+
+    def read(self, rel_path):
+        try:
+            return self.files[rel_path]
+        except KeyError:
+            raise FileNotFoundError(rel_path) from None
+
+    def write(self, rel_path, content):
+        self.files[rel_path] = content
+
+    def delete(self, rel_path):
+        self.files.pop(rel_path, None)
+
+    def stat(self, rel_path):
+        if rel_path not in self.files:
+            raise FileNotFoundError(rel_path)
+        return None
+
+    def __repr__(self):
+        return f"MemoryStorage({len(self.files)} fichier(s))"
+
+
+class OverlayStorage(Storage):
+    """
+    Lit la couche `base`, écrit dans la couche `upper` : `base` n'est jamais modifiée.
+
+    Un fichier présent dans `upper` masque celui de `base`. Un fichier de
+    `base` supprimé est seulement masqué : l'ensemble `deleted` est enregistré
+    dans `upper` (fichier `DELETED_MANIFEST`, un chemin par ligne) à chaque
+    sauvegarde et relu à l'ouverture, pour qu'un fichier supprimé ne
+    réapparaisse pas d'une exécution à l'autre. `upper` ne contient donc que
+    les fichiers créés ou modifiés, et ce manifeste.
+
+    Args:
+        base: Couche en lecture seule (`Storage` ou chemin)
+        upper: Couche d'écriture (`Storage` ou chemin ; défaut: `MemoryStorage`)
+
+    Example:
+        >>> overlay = OverlayStorage("//serveur/rapports/Report1", "C:/Resultats/Report1")
+        >>> pbir_duplicate_visuals(overlay, "Report1.Report", "main")
+    """
+
+    DELETED_MANIFEST = ".pbir-overlay-deleted"
+
+    def __init__(self, base, upper=None):
+        self.base = open_storage(base)
+        self.upper = MemoryStorage() if upper is None else open_storage(upper)
+        self._owned = [layer for layer, given in ((self.base, base), (self.upper, upper)) if layer is not given]
+        try:
+            self.deleted = set(self.upper.read(self.DELETED_MANIFEST).decode("utf-8").splitlines())
+        except FileNotFoundError:
+            self.deleted = set()
+        self.concurrent = self.base.concurrent or self.upper.concurrent
+
+    def list(self, folder=""):
+        """Fichiers de `base` non supprimés (dans leur ordre), puis ceux créés dans `upper`."""
+        paths = [p for p in self.base.list(folder) if p not in self.deleted]
+        seen = set(paths)
+        seen.add(self.DELETED_MANIFEST)
+        paths.extend(p for p in self.upper.list(folder) if p not in seen)
+        return paths
+
+    def read(self, rel_path):
+        try:
+            return self.upper.read(rel_path)
+        except FileNotFoundError:
+            if rel_path in self.deleted:
+                raise
+            return self.base.read(rel_path)
+
+    def write(self, rel_path, content):
+        self.commit({rel_path: content}, ())
+
+    def delete(self, rel_path):
+        self.commit({}, (rel_path,))
+
+    def stat(self, rel_path):
+        try:
+            return self.upper.stat(rel_path)
+        except FileNotFoundError:
+            if rel_path in self.deleted:
+                raise
+            return self.base.stat(rel_path)
+
+    def commit(self, writes, deletes):
+        """Écritures et suppressions dans `upper`, avec le manifeste des suppressions s'il change."""
+        deleted = (self.deleted | set(deletes)) - set(writes)
+        upper_writes = dict(writes)
+        upper_deletes = list(deletes)
+        if deleted != self.deleted:
+            if deleted:
+                upper_writes[self.DELETED_MANIFEST] = "".join(f"{p}\n" for p in sorted(deleted)).encode("utf-8")
+            else:
+                upper_deletes.append(self.DELETED_MANIFEST)
+        self.upper.commit(upper_writes, upper_deletes)
+        self.deleted = deleted
+
+    def close(self):
+        for layer in self._owned:
+            layer.close()
+
+    def __repr__(self):
+        return f"OverlayStorage({self.base!r}, {self.upper!r})"
+
+
+def open_storage(location, io_workers=DEFAULT_IO_WORKERS):
+    """
+    Stockage correspondant à `location`.
+
+    Args:
+        location: `Storage` (retourné tel quel), dossier PBIR ou archive .zip
+        io_workers: Nombre de threads pour le parcours d'un dossier
+
+    Raises:
+        ValueError: si `location` est un fichier qui n'est pas une archive .zip
+    """
+    if isinstance(location, Storage):
+        return location
+    if os.path.isfile(location):
+        from .archive import ArchiveStorage, is_archive  # zipfile n'est importé que pour une archive
+
+        if not is_archive(location):
+            raise ValueError(f"❌ Ni un dossier PBIR ni une archive .zip : {location}")
+        return ArchiveStorage(location)
+    return DirectoryStorage(location, io_workers)
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+Générateur de rapports PBIR synthétiques, de taille paramétrable.
+
+Sert aux mesures de montée en charge (voir `benchmarks/bench_scaling.py`) et
+aux tests sur de gros rapports, sans rapport réel à disposition.
+
+Le rapport généré a la structure attendue par les outils :
+- une page source ("main") de `visuals` visuels, dont une partie répartie
+  dans `groups` groupes et une partie liée (visualLink) aux bookmarks ;
+- `pages - 1` pages cibles portant chacune `visuals` visuels propres ;
+- `bookmarks` bookmarks de la page source, dont l'état référence ses visuels.
+
+Les visuels ressemblent à ceux de Power BI Desktop (requête, mise en forme,
+titre) pour que la taille des fichiers et le coût du parsing soient réalistes.
+Le résultat est déterministe : mêmes paramètres, mêmes octets.
+"""
+
+import os
+
+from . import codec
+from .storage import open_storage
+
+_SCHEMA = "https://developer.microsoft.com/json-schemas/fabric/item/report/definition"
+
+# Types de visuels utilisés à tour de rôle, avec leurs rôles de requête
+_VISUAL_TYPES = (
+    ("card", ("Values",)),
+    ("clusteredColumnChart", ("Category", "Y")),
+    ("lineChart", ("Category", "Y", "Series")),
+    ("tableEx", ("Values",)),
+    ("slicer", ("Values",)),
+    ("pieChart", ("Category", "Y")),
+)
+
+_FIELDS = (
+    ("Ventes", "Montant"), ("Ventes", "Quantité"), ("Produits", "Catégorie"),
+    ("Calendrier", "Mois"), ("Clients", "Région"), ("Ventes", "Marge"),
+)
+
+
+def _literal(value):
+    return {"expr": {"Literal": {"Value": f"'{value}'"}}}
+
+
+def _projection(entity, prop):
+    return {
+        "field": {"Column": {"Expression": {"SourceRef": {"Entity": entity}}, "Property": prop}},
+        "queryRef": f"{entity}.{prop}",
+        "nativeQueryRef": prop,
+    }
+
+
+def make_visual(vis_id, title, index, z, group=None, bookmark=None):
+    """
+    visual.json réaliste : position, requête, mise en forme et titre.
+
+    Un visuel lié à un bookmark est un bouton (`actionButton`) dont le lien
+    (`visualLink`) pointe vers ce bookmark.
+    """
+    position = {
+        "x": float(40 + (index % 6) * 200), "y": float(40 + (index // 6 % 5) * 140),
+        "z": z, "height": 120.0, "width": 180.0, "tabOrder": z,
+    }
+    if bookmark is not None:
+        visual = {
+            "visualType": "actionButton",
+            "objects": {"icon": [{"properties": {"shapeType": _literal("rightArrow")}}]},
+            "visualContainerObjects": {
+                "visualLink": [{"properties": {
+                    "show": {"expr": {"Literal": {"Value": "true"}}},
+                    "type": _literal("Bookmark"),
+                    "bookmark": _literal(bookmark),
+                }}],
+            },
+            "drillFilterOtherVisuals": True,
+        }
+    else:
+        visual_type, roles = _VISUAL_TYPES[index % len(_VISUAL_TYPES)]
+        query_state = {
+            role: {"projections": [_projection(*_FIELDS[(index + i) % len(_FIELDS)])]}
+            for i, role in enumerate(roles)
+        }
+        visual = {
+            "visualType": visual_type,
+            "query": {"queryState": query_state, "sortDefinition": {"isDefaultSort": True}},
+            "objects": {
+                "labels": [{"properties": {"show": {"expr": {"Literal": {"Value": "true"}}}}}],
+                "dataPoint": [{"properties": {"fill": {"solid": {"color": {"expr": {"ThemeDataColor": {
+                    "ColorId": index % 8, "Percent": 0}}}}}}}],
+            },
+            "drillFilterOtherVisuals": True,
+        }
+    data = {
+        "$schema": f"{_SCHEMA}/visualContainer/1.3.0/schema.json",
+        "name": vis_id,
+        "position": position,
+        "visual": visual,
+        "visualContainerObjects": {
+            "title": [{"properties": {"show": {"expr": {"Literal": {"Value": "true"}}}, "text": _literal(title)}}],
+            "border": [{"properties": {"show": {"expr": {"Literal": {"Value": "false"}}}}}],
+        },
+    }
+    if group is not None:
+        data["parentGroupName"] = group
+    return data
+
+
+def build_report(
+    pages: int = 10,
+    visuals: int = 20,
+    groups: int = 2,
+    bookmarks: int = 5,
+    report_name: str = "Synthetic",
+    source_page: str = "main"
+):
+    """
+    Construit en mémoire les fichiers d'un rapport synthétique.
+
+    Args:
+        pages: Nombre total de pages, page source comprise (>= 1)
+        visuals: Nombre de visuels par page
+        groups: Nombre de groupes de la page source (la moitié des visuels
+            non liés y est répartie)
+        bookmarks: Nombre de bookmarks de la page source ; un bouton de la page
+            source est lié à chacun (dans la limite de `visuals`)
+        report_name: Nom du rapport (dossier `<report_name>.Report`)
+        source_page: Nom de la page source
+
+    Returns:
+        dict: {chemin relatif: contenu bytes}, dans l'ordre d'un parcours du dossier
+    """
+    if pages < 1 or min(visuals, groups, bookmarks) < 0:
+        raise ValueError("❌ pages doit valoir au moins 1, et visuals / groups / bookmarks être positifs")
+
+    root = f"{report_name}.Report"
+    definition = f"{root}/definition"
+    files = {}
+
+    def add(rel_path, data):
+        files[rel_path] = codec.dumps(data)
+
+    add(f"{report_name}.pbip", {
+        "version": "1.0",
+        "artifacts": [{"report": {"path": root}}],
+        "settings": {"enableAutoRecovery": True},
+    })
+    add(f"{root}/definition.pbir", {
+        "version": "4.0",
+        "datasetReference": {"byPath": {"path": f"../{report_name}.SemanticModel"}},
+    })
+    add(f"{definition}/version.json", {"$schema": f"{_SCHEMA}/versionMetadata/1.0.0/schema.json", "version": "2.0.0"})
+    add(f"{definition}/report.json", {
+        "$schema": f"{_SCHEMA}/report/1.2.0/schema.json",
+        "themeCollection": {"baseTheme": {"name": "CY24SU10", "type": "SharedResources"}},
+        "settings": {"useStylableVisualContainerHeader": True, "defaultDrillFilterOtherVisuals": True},
+    })
+
+    page_names = [source_page] + [f"page{i:04d}" for i in range(1, pages)]
+    bookmark_names = [f"Bookmark{i:04d}" for i in range(bookmarks)]
+    add(f"{definition}/pages/pages.json", {
+        "$schema": f"{_SCHEMA}/pagesMetadata/1.0.0/schema.json",
+        "pageOrder": page_names,
+        "activePageName": source_page,
+    })
+
+    # Page source : boutons liés aux bookmarks, puis visuels groupés et libres
+    linked = min(bookmarks, visuals)
+    group_names = [f"Groupe{i:03d}" for i in range(groups)]
+    source_prefix = f"{definition}/pages/{source_page}"
+    source_ids = []
+    members = {name: [] for name in group_names}
+    for i in range(visuals):
+        vis_id = f"src{i:05d}"
+        source_ids.append(vis_id)
+        group = None
+        bookmark = bookmark_names[i] if i < linked else None
+        if bookmark is None and group_names and (i - linked) % 2 == 0:
+            group = group_names[(i - linked) // 2 % len(group_names)]
+            members[group].append(vis_id)
+        add(f"{source_prefix}/visuals/{vis_id}/visual.json",
+            make_visual(vis_id, f"Visuel {i:05d}", i, z=1000 + i, group=group, bookmark=bookmark))
+    for z, name in enumerate(group_names):
+        add(f"{source_prefix}/visuals/{name}/group.json", {
+            "name": name, "displayName": name, "visuals": members[name], "position": {"z": 500 + z},
+        })
+    add(f"{source_prefix}/page.json", {
+        "$schema": f"{_SCHEMA}/page/1.3.0/schema.json",
+        "name": source_page, "displayName": "Accueil", "displayOption": "FitToPage",
+        "height": 720, "width": 1280, "visualContainers": group_names,
+    })
+
+    # Pages cibles : contenu propre
+    for number, page in enumerate(page_names[1:], 1):
+        prefix = f"{definition}/pages/{page}"
+        for i in range(visuals):
+            vis_id = f"{page}_{i:05d}"
+            add(f"{prefix}/visuals/{vis_id}/visual.json",
+                make_visual(vis_id, f"Contenu {number} - {i}", i + number, z=i))
+        add(f"{prefix}/page.json", {
+            "$schema": f"{_SCHEMA}/page/1.3.0/schema.json",
+            "name": page, "displayName": f"Page {number}", "displayOption": "FitToPage",
+            "height": 720, "width": 1280, "visualContainers": [],
+        })
+
+    # Bookmarks de la page source : état de chaque visuel de la page
+    for i, name in enumerate(bookmark_names):
+        add(f"{definition}/bookmarks/{name}.bookmark.json", {
+            "$schema": f"{_SCHEMA}/bookmark/1.2.0/schema.json",
+            "name": name,
+            "displayName": f"Vue {i}",
+            "explorationState": {
+                "version": "1.3",
+                "activeSection": source_page,
+                "sections": {
+                    source_page: {
+                        "visualContainers": {
+                            vis_id: {"singleVisual": {"display": {"mode": "hidden" if (i + j) % 3 == 0 else "visible"}}}
+                            for j, vis_id in enumerate(source_ids)
+                        },
+                    },
+                },
+                "objects": {"merge": {"outspacePane": [{"properties": {"expanded": {"expr": {"Literal": {"Value": "false"}}}}}]}},
+            },
+            "options": {"targetVisualNames": source_ids[:10]},
+        })
+    add(f"{definition}/bookmarks/bookmarks.json", {
+        "$schema": f"{_SCHEMA}/bookmarksMetadata/1.0.0/schema.json",
+        "items": [{"name": name} for name in bookmark_names],
+    })
+
+    add(f"{report_name}.SemanticModel/definition.pbism", {"version": "4.2", "settings": {}})
+    return files
+
+
+def generate_report(output, **params):
+    """
+    Écrit un rapport synthétique dans `output` (dossier, archive .zip ou `Storage`).
+
+    Args:
+        output: Destination (voir `storage.open_storage`) ; un chemin en ".zip"
+            qui n'existe pas encore est créé comme archive
+        **params: Paramètres de `build_report` (pages, visuals, groups, bookmarks...)
+
+    Returns:
+        dict: {"report": nom du dossier `*.Report`, "files": nombre de fichiers, "bytes": taille totale}
+
+    Example:
+        >>> generate_report("/tmp/gros_rapport", pages=200, visuals=50, groups=5, bookmarks=20)
+        {'report': 'Synthetic.Report', 'files': 10238, 'bytes': ...}
+    """
+    files = build_report(**params)
+    if isinstance(output, (str, os.PathLike)) and str(output).lower().endswith(".zip") and not os.path.exists(output):
+        import zipfile
+
+        zipfile.ZipFile(output, "w").close()  # archive vide, remplie par `commit`
+    storage = open_storage(output)
+    try:
+        storage.commit(files, ())
+    finally:
+        if storage is not output:
+            storage.close()
+    return {
+        "report": f"{params.get('report_name', 'Synthetic')}.Report",
+        "files": len(files),
+        "bytes": sum(len(content) for content in files.values()),
+    }
@@ -10,20 +10,16 @@ Reproduction exacte de la mise en page source sur les pages cibles :
 - Position z calculée intelligemment
 """
 
-import os
-import json
+import copy
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 
-# ===== Extraire le nom lisible d'un visuel =====
-def get_vis_name(vis):
-    """
-    Retourne le nom lisible du visuel pour le matching.
-    Fallback sur le name du container si absent.
-    """
-    try:
-        value = vis["visualContainerObjects"]["title"][0]["properties"]["text"]["expr"]["Literal"]["Value"]
-        return value.strip("'").strip()
-    except Exception:
-        return vis.get("name", "").strip()
+from . import codec
+from .project import PbirProject
+from .selectors import SelectorIndex, compile_selectors
+from .events import DEBUG, INFO, EventRecorder, make_emitter, replay_events
+from .cache import get_vis_name
 
 # ===== Merge visual =====
 def merge_visual(source, target):
@@ -38,7 +34,7 @@ def merge_visual(source, target):
     return merged
 
 # ===== Merge group =====
-def merge_group(source, target, copied_visual_ids):
+def merge_group(source, target, copied_visual_ids, events=None):
     """Fusionne un groupe source avec un groupe cible existant"""
     merged = source.copy()
     
@@ -51,14 +47,9 @@ def merge_group(source, target, copied_visual_ids):
     source_visuals = source.get("visuals", [])
     existing_visuals = target.get("visuals", []) if target else []
     
-    print(f"\n    DEBUG merge_group:")
-    print(f"      source_visuals: {source_visuals}")
-    print(f"      existing_visuals: {existing_visuals}")
-    print(f"      copied_visual_ids: {list(copied_visual_ids)}")
-    
     # Les visuels copiés viennent en premier (ordre source)
     new_visuals = [v for v in source_visuals if v in copied_visual_ids]
-    print(f"      new_visuals (copiés): {new_visuals}")
+    copied_count = len(new_visuals)
     
     # Puis les visuels déjà présents qui ne sont pas en train d'être écrasés
     copied_ids_set = set(copied_visual_ids)
@@ -66,7 +57,17 @@ def merge_group(source, target, copied_visual_ids):
         if vis_id not in copied_ids_set:
             new_visuals.append(vis_id)
     
-    print(f"      new_visuals (final): {new_visuals}")
+    if events is not None:
+        events.debug(
+            "merge_group",
+            "merge_group {group}: source={source_visuals} existants={existing_visuals} "
+            "copiés={copied} final={new_visuals}",
+            group=merged.get("name"),
+            source_visuals=source_visuals,
+            existing_visuals=existing_visuals,
+            copied=new_visuals[:copied_count],
+            new_visuals=new_visuals,
+        )
     
     if new_visuals:
         merged["visuals"] = new_visuals
@@ -74,311 +75,545 @@ def merge_group(source, target, copied_visual_ids):
     return merged
 
 # ===== Calcul du z : visuels collés au-dessus de l'existant =====
-def compute_z_above_existing(vis_id, source_visuals_z_order, target_page_visuals, visual_id_mapping):
+def compute_z_layers(source_order, target_page_visuals, kept=()):
     """
-    Calcule le z en plaçant les visuels collés au-dessus de tout ce qui existe.
-    Respecte l'ordre relatif entre les visuels collés basé sur l'ordre source ORIGINAL.
+    Calcule en une passe le z de tous les visuels collés sur une page cible.
+
+    Les visuels collés sont placés au-dessus de tout ce qui existe, dans l'ordre
+    source ORIGINAL : chaque visuel est posé au-dessus du z maximum courant de la
+    page (existants + visuels déjà collés), avec un écart égal à son rang source.
+    Un visuel collé remplace la version existante de même id sur la page.
+    Les visuels de `kept` gardent le z de la cible et ne comptent pas dans le rang.
+
+    Args:
+        source_order: Liste [(vis_id, visuel source)] triée par z source ORIGINAL
+        target_page_visuals: Visuels présents sur la page cible avant collage {id: visuel}
+        kept: Identifiants des visuels existants qui gardent leur z (`keep_target_z`)
+
+    Returns:
+        dict: {vis_id: z}
     """
-    # Trouver le z maximum de la page cible
-    all_target = list(target_page_visuals.values())
-    all_zs = [v.get("position", {}).get("z", 0) for v in all_target]
-    max_z_target = max(all_zs) if all_zs else 0
-    
-    # Obtenir l'ordre des visuels dans la source (triés par z ORIGINAL)
-    source_sorted = sorted(
-        visual_id_mapping.items(),
-        key=lambda x: source_visuals_z_order.get(x[0], 0)
-    )
-    
-    # Trouver la position de ce visuel dans l'ordre source
-    source_ids = [sid for sid, _ in source_sorted]
-    idx = source_ids.index(vis_id)
-    
-    # Calculer le z : au-dessus de l'existant + offset selon position dans source
-    # On garde un écart de 1 entre chaque visuel collé
-    z = max_z_target + 1 + idx
-    
-    return z
+    page_zs = {vid: v.get("position", {}).get("z", 0) for vid, v in target_page_visuals.items()}
+    z_counts = Counter(page_zs.values())
+    max_z = max(z_counts) if z_counts else 0
 
-# ===== FONCTION PRINCIPALE : DUPLICATION DE VISUELS =====
+    z_layers = {}
+    rank = 0
+    for vis_id, source_vis in source_order:
+        if vis_id in kept:
+            # Le visuel reste à sa place dans la pile de la cible
+            z_layers[vis_id] = page_zs[vis_id]
+            continue
+        z = max_z + 1 + rank
+        rank += 1
+        z_layers[vis_id] = z
 
-def pbir_duplicate_visuals(
-    pbir_folder_path: str,
-    report_root_name: str,
+        # Le visuel collé remplace l'existant : mise à jour du z maximum courant
+        new_z = z if "position" in source_vis else 0
+        old_z = page_zs.get(vis_id)
+        if old_z is not None:
+            z_counts[old_z] -= 1
+            if not z_counts[old_z]:
+                del z_counts[old_z]
+        page_zs[vis_id] = new_z
+        z_counts[new_z] += 1
+        if new_z > max_z:
+            max_z = new_z
+        elif old_z == max_z and old_z not in z_counts:
+            max_z = max(z_counts)
+
+    return z_layers
+
+# ===== TRAITEMENT D'UNE PAGE CIBLE =====
+def _page_job(project, page):
+    """Données brutes d'une page cible nécessaires à `process_target_page`."""
+    page_json_path = project.page_json_path(page)
+    return {
+        "page": page,
+        "page_json": project[page_json_path] if page_json_path else None,
+        "visuals": {vid: project[path] for vid, path in project.page_visuals(page).items()},
+        "groups": {gid: project[path] for gid, path in project.page_groups(page).items()},
+    }
+
+
+def process_target_page(shared, job, events):
+    """
+    Colle les visuels et groupes source sur une page cible.
+
+    Fonction pure : elle ne lit que `shared` (données de la page source, communes à
+    toutes les pages) et `job` (contenu brut de la page cible), et peut donc
+    s'exécuter dans un thread ou un processus séparé.
+
+    Returns:
+        dict: {"page": page, "writes": [(chemin, bytes, objet JSON ou None)]}
+    """
+    page = job["page"]
+    pages_prefix = shared["pages_prefix"]
+    source_order = shared["source_order"]
+    source_groups = shared["source_groups"]
+    groups_to_copy = shared["groups_to_copy"]
+
+    events.info("page_start", "\n{sep}\n🔄 Traitement de la page : {page}\n{sep}", page=page, sep="=" * 60)
+
+    target_visuals_prefix = f"{pages_prefix}{page}/visuals/"
+    page_json_path = f"{pages_prefix}{page}/page.json"
+    writes = {}
+
+    # Visuels et groupes existants de la cible : seuls les champs lus (z, name...)
+    # sont parsés, l'objet complet ne l'est que pour les groupes fusionnés
+    target_page_visuals = {vid: codec.LazyDocument(raw) for vid, raw in job["visuals"].items()}
+    target_groups = {gid: codec.LazyDocument(raw) for gid, raw in job["groups"].items()}
+
+    # ===== ÉTAPE 1 : COPIER LES GROUPES =====
+    if groups_to_copy:
+        events.info("groups_copy", "\n📁 Copie des groupes...")
+    copied_visual_ids = {vis_id for vis_id, _ in source_order}
+
+    for group_id in groups_to_copy:
+        if group_id in source_groups:
+            source_group = source_groups[group_id]
+            target_group = target_groups.get(group_id, {})
+
+            merged_group = merge_group(source_group, target_group, copied_visual_ids, events)
+
+            writes[f"{target_visuals_prefix}{group_id}/group.json"] = merged_group
+            target_groups[group_id] = merged_group
+
+            status = "mis à jour" if target_group else "créé"
+            events.info(
+                "group_merged", "  ✓ Groupe {status} : {group_id}",
+                page=page, group_id=group_id, status=status,
+            )
+            if "visuals" in merged_group:
+                events.info("group_order", "    └─ Ordre : {visuals}", group_id=group_id, visuals=merged_group["visuals"])
+
+    # ===== ÉTAPE 2 : METTRE À JOUR page.json (ordre des groupes) =====
+    target_page_data = None
+    if job["page_json"] is not None:
+        events.info("page_order", "\n📋 Mise à jour de l'ordre des groupes dans page.json...", page=page)
+
+        target_page_data = codec.loads(job["page_json"])
+
+        # Liste des groupes existants et source
+        existing_groups = target_page_data.get("visualContainers", [])
+        source_groups_list = shared["source_groups_list"]
+
+        # Créer un set pour check rapide
+        groups_to_copy_set = set(groups_to_copy)
+
+        # NOUVELLE LOGIQUE : Construire l'ordre final en respectant l'ordre source
+        new_groups_list = []
+
+        # Parcourir l'ordre de la source et ajouter les groupes dans cet ordre
+        for group_id in source_groups_list:
+            if group_id in groups_to_copy_set:
+                # Ce groupe est copié, l'ajouter dans l'ordre source
+                new_groups_list.append(group_id)
+
+        # Ajouter les groupes existants qui ne sont PAS copiés (ils restent après)
+        for group_id in existing_groups:
+            if group_id not in groups_to_copy_set:
+                new_groups_list.append(group_id)
+
+        events.debug(
+            "page_order_detail",
+            "Ordre source : {source} / cible avant : {before} / cible après : {after}",
+            page=page, source=source_groups_list, before=existing_groups, after=new_groups_list,
+        )
+
+        if new_groups_list != existing_groups:
+            target_page_data["visualContainers"] = new_groups_list
+            writes[page_json_path] = target_page_data
+            events.info("page_order_updated", "  ✓ Ordre des groupes mis à jour", page=page)
+        else:
+            events.info("page_order_unchanged", "  ℹ Ordre des groupes inchangé", page=page)
+
+    # ===== ÉTAPE 3 : COPIER LES VISUELS =====
+    events.info("visuals_copy", "\n🖼️  Copie des visuels...", page=page)
+
+    if events.enabled(DEBUG):
+        z_order = shared["source_visuals_z_order"]
+        for vis_id, vis in source_order:
+            events.debug(
+                "source_z_order", "Ordre source : {name} : z={z}, groupe={group}",
+                vis_id=vis_id, name=get_vis_name(vis),
+                z=z_order.get(vis_id, 0), group=vis.get("parentGroupName", "aucun"),
+            )
+
+    # Calculer les z de tous les visuels collés en une passe
+    kept = ()
+    if shared["keep_target_z"]:
+        # Mise à jour sur place : un visuel existant garde sa place dans la pile de la cible
+        kept = {
+            vis_id for vis_id, _ in source_order
+            if "z" in target_page_visuals.get(vis_id, {}).get("position", {})
+        }
+    z_layers = compute_z_layers(source_order, target_page_visuals, kept)
+
+    # 🔹 ITÉRER SUR LES VISUELS DANS L'ORDRE DE Z SOURCE
+    for vis_id, source_vis in source_order:
+        target_vis = target_page_visuals.get(vis_id, {})
+
+        merged_vis = merge_visual(source_vis, target_vis)
+
+        # z : au-dessus de l'existant, selon l'ordre Z ORIGINAL (ou z conservé)
+        new_z = z_layers[vis_id]
+
+        if "position" in merged_vis:
+            # Copie de position : le dict source est partagé entre les pages
+            merged_vis["position"] = dict(merged_vis["position"], z=new_z)
+
+        writes[f"{target_visuals_prefix}{vis_id}/visual.json"] = merged_vis
+        target_page_visuals[vis_id] = merged_vis
+
+        if events.enabled(INFO):
+            events.info(
+                "visual_copied", "  ✓ {status} : {name} (z={z}, groupe={group})",
+                page=page, vis_id=vis_id, status="Mis à jour" if target_vis else "Créé",
+                name=get_vis_name(merged_vis), z=new_z,
+                group=merged_vis.get("parentGroupName", "aucun"),
+            )
+
+    # ===== ÉTAPE 4 : MISE À JOUR RAPPEL_PAGE_H SI PRÉSENT =====
+    if "Rappel_Page_H" in target_page_visuals:
+        events.info("rappel_page", "\n📝 Mise à jour de Rappel_Page_H...", page=page)
+
+        rappel_path = f"{target_visuals_prefix}Rappel_Page_H/visual.json"
+        if rappel_path in writes:
+            rappel_vis = copy.deepcopy(writes[rappel_path])
+        else:
+            rappel_vis = codec.loads(job["visuals"]["Rappel_Page_H"])
+
+        # Obtenir le nom d'affichage de la page
+        if target_page_data is not None:
+            display_name = target_page_data.get("displayName", page)
+
+            # Mettre à jour le textRun[1] avec le nom de la page
+            for g in rappel_vis.get("visual", {}).get("objects", {}).get("general", []):
+                for p in g.get("properties", {}).get("paragraphs", []):
+                    runs = p.get("textRuns", [])
+                    if len(runs) >= 2:
+                        runs[1]["value"] = display_name
+                        events.info("rappel_page_updated", "  ✓ Nom mis à jour : '{name}'", page=page, name=display_name)
+
+            # Sauvegarder
+            writes[rappel_path] = rappel_vis
+
+    # Sérialisation dans le worker : c'est la partie coûteuse en CPU
+    return {"page": page, "writes": _serialize_writes(shared, job, writes)}
+
+
+def _serialize_writes(shared, job, writes):
+    """
+    Sérialise les fichiers d'une page cible.
+
+    Un fichier existant garde sa mise en forme (CRLF, indentation...) et n'est pas
+    renvoyé s'il est sémantiquement inchangé ; un fichier créé reprend celle du
+    fichier source copié.
+    """
+    target_visuals_prefix = f"{shared['pages_prefix']}{job['page']}/visuals/"
+    originals = {f"{target_visuals_prefix}{vid}/visual.json": raw for vid, raw in job["visuals"].items()}
+    originals.update((f"{target_visuals_prefix}{gid}/group.json", raw) for gid, raw in job["groups"].items())
+    originals[f"{shared['pages_prefix']}{job['page']}/page.json"] = job["page_json"]
+
+    serialized = []
+    for path, data in writes.items():
+        original = originals.get(path)
+        if original is None:
+            fmt = shared["formats"].get(path.rsplit("/", 2)[1])
+            serialized.append((path, codec.dumps(data, fmt), data))
+        else:
+            content, changed = codec.dumps_like(data, original)
+            if changed:
+                serialized.append((path, content, data))
+    return serialized
+
+
+# ===== EXÉCUTION DES PAGES (SÉQUENTIELLE OU PARALLÈLE) =====
+_WORKER_SHARED = None
+
+
+def _init_page_worker(shared):
+    """Initialise un processus worker avec les données source communes."""
+    global _WORKER_SHARED
+    _WORKER_SHARED = shared
+
+
+def _run_page_in_process(job, min_level):
+    """Traite une page dans un processus worker (événements enregistrés, sans objets JSON)."""
+    recorder = EventRecorder(min_level)
+    result = process_target_page(_WORKER_SHARED, job, recorder)
+    # Seuls les bytes reviennent au processus principal : inutile de re-sérialiser les objets
+    result["writes"] = [(path, content, None) for path, content, _ in result["writes"]]
+    result["events"] = recorder.records
+    return result
+
+
+def _run_page_in_thread(shared, job, min_level):
+    """Traite une page dans un thread worker (événements enregistrés)."""
+    recorder = EventRecorder(min_level)
+    result = process_target_page(shared, job, recorder)
+    result["events"] = recorder.records
+    return result
+
+
+def _map_target_pages(shared, jobs, events, max_workers=None, executor="process"):
+    """
+    Traite les pages cibles et produit leurs résultats dans l'ordre des pages.
+
+    Sans `max_workers` (ou avec 1), les pages sont traitées l'une après l'autre.
+    Sinon, elles sont réparties sur un pool de threads ou de processus ; les
+    événements sont enregistrés dans les workers puis rejoués ici, dans l'ordre.
+    """
+    if not max_workers or max_workers <= 1:
+        for job in jobs:
+            yield process_target_page(shared, job, events)
+        return
+
+    min_level = events.min_level()
+    if executor == "process":
+        pool = ProcessPoolExecutor(max_workers, initializer=_init_page_worker, initargs=(shared,))
+        with pool:
+            results = pool.map(_run_page_in_process, jobs, repeat(min_level))
+            for result in results:
+                replay_events(result["events"], events)
+                yield result
+    elif executor == "thread":
+        with ThreadPoolExecutor(max_workers) as pool:
+            results = pool.map(_run_page_in_thread, repeat(shared), jobs, repeat(min_level))
+            for result in results:
+                replay_events(result["events"], events)
+                yield result
+    else:
+        raise ValueError(f"❌ executor inconnu : {executor} (attendu : 'process' ou 'thread')")
+
+# ===== DUPLICATION SUR UN PROJET CHARGÉ =====
+
+def duplicate_visuals(
+    project: PbirProject,
     source_page_name: str = "main",
     target_pages: list = None,
-    visual_name=None
+    visual_name=None,
+    events=None,
+    max_workers: int = None,
+    executor: str = "process",
+    visual_ids=None,
+    keep_target_z: bool = False
 ):
     """
-    Duplique des visuels d'une page source vers des pages cibles en respectant la mise en page.
-    
-    Args:
-        pbir_folder_path: Chemin vers le dossier PBIR décompressé
-        report_root_name: Nom du rapport (ex: "Report")
-        source_page_name: Nom de la page source (défaut: "main")
-        target_pages: Liste des pages cibles (None = toutes sauf source)
-        visual_name: Nom(s) des visuels à copier (str, list ou None = tous)
-    
-    Exemples:
-        # Copier tous les visuels
-        duplicate_visuals("path/to/pbir", "Report", "template")
-        
-        # Copier un visuel spécifique
-        duplicate_visuals("path/to/pbir", "Report", "main", ["page1"], "Mon Graphique")
-        
-        # Copier plusieurs visuels
-        duplicate_visuals("path/to/pbir", "Report", "main", None, ["Graphique 1", "Tableau 2"])
+    Duplique des visuels d'une page source vers des pages cibles d'un projet déjà chargé.
+
+    Les modifications restent en mémoire dans `project` : rien n'est écrit sur disque.
+    Voir `pbir_duplicate_visuals` pour la description des paramètres.
+    `events` est l'`EventEmitter` qui reçoit les événements (console par défaut).
+    `visual_ids` restreint la copie à ces identifiants de visuels (en plus de `visual_name`).
+    Avec `keep_target_z`, un visuel déjà présent sur une cible garde son z
+    (seuls les visuels créés sont placés au-dessus de l'existant).
+
+    Returns:
+        dict: {"visuals": nombre de visuels copiés, "pages": nombre de pages mises à jour}
     """
-    # Normaliser visual_name
-    if visual_name is not None:
-        if isinstance(visual_name, str):
-            visual_name = [visual_name]
-        elif not isinstance(visual_name, list):
-            raise ValueError("visual_name doit être string, list ou None")
-        visual_name = [v.strip().upper() for v in visual_name]
+    events = make_emitter(events)
 
-    # ===== CHARGEMENT DES FICHIERS =====
-    print("📂 Chargement des fichiers PBIR...")
-    files_dict = {}
-    for root, dirs, files in os.walk(pbir_folder_path):
-        for file in files:
-            full_path = os.path.join(root, file)
-            rel_path = os.path.relpath(full_path, pbir_folder_path).replace("\\", "/")
-            with open(full_path, "rb") as f:
-                files_dict[rel_path] = f.read()
-
-    pages_prefix = f"{report_root_name}/definition/pages/"
-    source_visuals_prefix = f"{pages_prefix}{source_page_name}/visuals/"
+    # Compiler les sélecteurs (titres, motifs, types, groupes)
+    selectors = compile_selectors(visual_name)
+
+    pages_prefix = project.pages_prefix
 
     # ===== CHARGEMENT DE LA PAGE SOURCE =====
-    print(f"\n📄 Analyse de la page source : {source_page_name}")
+    events.info("source_page", "\n📄 Analyse de la page source : {page}", page=source_page_name)
     
+    # Lecture groupée des fichiers de la page source (avec un cache de
+    # métadonnées, seuls les visuels sélectionnés seront lus)
+    source_visual_paths = project.page_visuals(source_page_name)
+    source_group_paths = project.page_groups(source_page_name)
+    if project.cache is None:
+        project.prefetch(list(source_visual_paths.values()) + list(source_group_paths.values()))
+
     # Charger page.json source
     source_page_json_path = f"{pages_prefix}{source_page_name}/page.json"
     source_page_data = {}
-    if source_page_json_path in files_dict:
-        source_page_data = json.loads(files_dict[source_page_json_path].decode("utf-8"))
+    if source_page_json_path in project:
+        source_page_data = project.load_json(source_page_json_path)
     
-    # Charger tous les visuels de la source
-    all_source_visuals = {}
-    for path, content in files_dict.items():
-        if path.startswith(source_visuals_prefix) and path.endswith("visual.json"):
-            vis_id = path.split("/")[-2]
-            vis_json = json.loads(content.decode("utf-8"))
-            all_source_visuals[vis_id] = vis_json
+    # Métadonnées (titre, z, groupe) de tous les visuels de la source
+    source_metadata = {
+        vis_id: project.metadata(path)
+        for vis_id, path in source_visual_paths.items()
+    }
     
     # 🔹 IMPORTANT : Créer une copie immuable de l'ordre source pour ne pas qu'il soit modifié
     source_visuals_z_order = {
-        vis_id: vis.get("position", {}).get("z", 0) 
-        for vis_id, vis in all_source_visuals.items()
+        vis_id: meta["z"]
+        for vis_id, meta in source_metadata.items()
     }
 
-    # Charger tous les groupes de la source
-    source_groups = {}
-    for path, content in files_dict.items():
-        if path.startswith(source_visuals_prefix) and path.endswith("group.json"):
-            group_id = path.split("/")[-2]
-            group_json = json.loads(content.decode("utf-8"))
-            source_groups[group_id] = group_json
-
     # ===== FILTRAGE DES VISUELS À COPIER =====
-    print("\n🔍 Sélection des visuels à copier...")
-    visuals_to_copy = {}
+    events.info("selection", "\n🔍 Sélection des visuels à copier...")
+    selected_ids = []
     groups_to_copy = set()
-    
-    for vis_id, vis_json in all_source_visuals.items():
-        vis_name_lisible = get_vis_name(vis_json)
-        
-        # Filtrage par nom si spécifié
-        if visual_name and vis_name_lisible.upper() not in visual_name:
+
+    # Index de la page source : le coût dépend du nombre de visuels sélectionnés
+    index = SelectorIndex(source_metadata.items())
+    for vis_id in index.select(selectors):
+        if visual_ids is not None and vis_id not in visual_ids:
             continue
-        
-        visuals_to_copy[vis_id] = vis_json
-        print(f"  ✓ {vis_name_lisible} (id: {vis_id})")
-        
+        meta = source_metadata[vis_id]
+
+        selected_ids.append(vis_id)
+        events.info("visual_selected", "  ✓ {name} (id: {vis_id})", name=meta["title"], vis_id=vis_id)
+
         # Identifier les groupes nécessaires
-        if "parentGroupName" in vis_json:
-            groups_to_copy.add(vis_json["parentGroupName"])
+        if "parentGroupName" in meta:
+            groups_to_copy.add(meta["parentGroupName"])
+
+    # Seuls les visuels et groupes copiés sont parsés en entier
+    project.prefetch(
+        [source_visual_paths[vis_id] for vis_id in selected_ids]
+        + [source_group_paths[gid] for gid in groups_to_copy if gid in source_group_paths]
+    )
+    visuals_to_copy = {vis_id: project.load_json(source_visual_paths[vis_id]) for vis_id in selected_ids}
+    source_groups = {
+        gid: project.load_json(source_group_paths[gid])
+        for gid in groups_to_copy if gid in source_group_paths
+    }
 
     if not visuals_to_copy:
         raise ValueError("❌ Aucun visuel trouvé à copier")
 
-    print(f"\n📊 {len(visuals_to_copy)} visuel(s) à copier")
+    events.info("selection_done", "\n📊 {count} visuel(s) à copier", count=len(visuals_to_copy))
     if groups_to_copy:
-        print(f"📁 {len(groups_to_copy)} groupe(s) nécessaire(s) : {list(groups_to_copy)}")
+        events.info(
+            "groups_needed", "📁 {count} groupe(s) nécessaire(s) : {groups}",
+            count=len(groups_to_copy), groups=list(groups_to_copy),
+        )
 
     # ===== DÉTERMINATION DES PAGES CIBLES =====
-    all_pages = []
-    for path in files_dict:
-        if path.startswith(pages_prefix) and path.endswith("page.json"):
-            page = path[len(pages_prefix):].split("/")[0]
-            if page != source_page_name:
-                all_pages.append(page)
+    all_pages = [page for page in project.page_names() if page != source_page_name]
+    all_pages_set = set(all_pages)
 
     if target_pages is None:
         target_pages = all_pages
     else:
         for p in target_pages:
-            if p not in all_pages:
+            if p not in all_pages_set:
                 raise ValueError(f"❌ Page cible inconnue : {p}")
 
-    print(f"\n🎯 Pages cibles : {target_pages}")
+    events.info("target_pages", "\n🎯 Pages cibles : {pages}", pages=target_pages)
 
     # ===== DUPLICATION SUR CHAQUE PAGE CIBLE =====
+    # 🔹 IMPORTANT : Trier les visuels par ordre de z source pour les traiter dans le bon ordre
+    source_order = sorted(visuals_to_copy.items(), key=lambda x: source_visuals_z_order.get(x[0], 0))
+
+    shared = {
+        "pages_prefix": pages_prefix,
+        "source_order": source_order,
+        "source_visuals_z_order": source_visuals_z_order,
+        "source_groups": source_groups,
+        "groups_to_copy": list(groups_to_copy),
+        "source_groups_list": source_page_data.get("visualContainers", []),
+        "keep_target_z": keep_target_z,
+        # Mise en forme des fichiers source, reprise par les fichiers créés
+        "formats": {
+            item_id: codec.detect_format(project[paths[item_id]])
+            for paths, ids in ((source_visual_paths, visuals_to_copy), (source_group_paths, groups_to_copy))
+            for item_id in ids if item_id in paths
+        },
+    }
+    # Lecture groupée des fichiers des pages cibles
+    target_paths = []
     for page in target_pages:
-        print(f"\n{'='*60}")
-        print(f"🔄 Traitement de la page : {page}")
-        print(f"{'='*60}")
-        
-        target_visuals_prefix = f"{pages_prefix}{page}/visuals/"
-        page_json_path = f"{pages_prefix}{page}/page.json"
+        target_paths.extend(project.page_visuals(page).values())
+        target_paths.extend(project.page_groups(page).values())
+        target_paths.append(project.page_json_path(page))
+    project.prefetch(target_paths)
+    jobs = (_page_job(project, page) for page in target_pages)
 
-        # Charger les visuels et groupes existants de la cible
-        target_page_visuals = {}
-        target_groups = {}
-        
-        for path, content in files_dict.items():
-            if path.startswith(target_visuals_prefix):
-                if path.endswith("visual.json"):
-                    vid = path.split("/")[-2]
-                    target_page_visuals[vid] = json.loads(content.decode("utf-8"))
-                elif path.endswith("group.json"):
-                    gid = path.split("/")[-2]
-                    target_groups[gid] = json.loads(content.decode("utf-8"))
-
-        # ===== ÉTAPE 1 : COPIER LES GROUPES =====
-        if groups_to_copy:
-            print("\n📁 Copie des groupes...")
-        copied_visual_ids = set(visuals_to_copy.keys())
-        
-        for group_id in groups_to_copy:
-            if group_id in source_groups:
-                source_group = source_groups[group_id]
-                target_group = target_groups.get(group_id, {})
-                
-                merged_group = merge_group(source_group, target_group, copied_visual_ids)
-                
-                group_path = f"{target_visuals_prefix}{group_id}/group.json"
-                files_dict[group_path] = json.dumps(merged_group, indent=2).encode("utf-8")
-                target_groups[group_id] = merged_group
-                
-                status = "mis à jour" if target_group else "créé"
-                print(f"  ✓ Groupe {status} : {group_id}")
-                if "visuals" in merged_group:
-                    print(f"    └─ Ordre : {merged_group['visuals']}")
-
-        # ===== ÉTAPE 2 : METTRE À JOUR page.json (ordre des groupes) =====
-        if page_json_path in files_dict:
-            print("\n📋 Mise à jour de l'ordre des groupes dans page.json...")
-            
-            target_page_data = json.loads(files_dict[page_json_path].decode("utf-8"))
-            
-            # Liste des groupes existants et source
-            existing_groups = target_page_data.get("visualContainers", [])
-            source_groups_list = source_page_data.get("visualContainers", [])
-            
-            print(f"  ℹ Ordre source : {source_groups_list}")
-            print(f"  ℹ Ordre cible avant : {existing_groups}")
-            
-            # Créer un set pour check rapide
-            groups_to_copy_set = set(groups_to_copy)
-            existing_groups_set = set(existing_groups)
-            
-            # NOUVELLE LOGIQUE : Construire l'ordre final en respectant l'ordre source
-            new_groups_list = []
-            
-            # Parcourir l'ordre de la source et ajouter les groupes dans cet ordre
-            for group_id in source_groups_list:
-                if group_id in groups_to_copy_set:
-                    # Ce groupe est copié, l'ajouter dans l'ordre source
-                    new_groups_list.append(group_id)
-            
-            # Ajouter les groupes existants qui ne sont PAS copiés (ils restent après)
-            for group_id in existing_groups:
-                if group_id not in groups_to_copy_set:
-                    new_groups_list.append(group_id)
-            
-            print(f"  ℹ Ordre cible après : {new_groups_list}")
-            
-            if new_groups_list != existing_groups:
-                target_page_data["visualContainers"] = new_groups_list
-                files_dict[page_json_path] = json.dumps(target_page_data, indent=2).encode("utf-8")
-                print(f"  ✓ Ordre des groupes mis à jour")
-            else:
-                print(f"  ℹ Ordre des groupes inchangé")
-
-        # ===== ÉTAPE 3 : COPIER LES VISUELS =====
-        print("\n🖼️  Copie des visuels...")
-        
-        # Créer un mapping pour calculer les z
-        visual_id_mapping = {vid: vid for vid in visuals_to_copy.keys()}
+    for result in _map_target_pages(shared, jobs, events, max_workers, executor):
+        for path, content, data in result["writes"]:
+            project.set_json(path, data, content)
+
+    return {"visuals": len(visuals_to_copy), "pages": len(target_pages)}
+
+
+# ===== FONCTION PRINCIPALE : DUPLICATION DE VISUELS =====
+
+def pbir_duplicate_visuals(
+    pbir_folder_path: str,
+    report_root_name: str,
+    source_page_name: str = "main",
+    target_pages: list = None,
+    visual_name=None,
+    quiet: bool = False,
+    on_event=None,
+    max_workers: int = None,
+    executor: str = "process",
+    cache: str = None,
+    dry_run: bool = False
+):
+    """
+    Duplique des visuels d'une page source vers des pages cibles en respectant la mise en page.
+    
+    Args:
+        pbir_folder_path: Chemin vers le dossier PBIR décompressé, son archive .zip ou un `Storage`
+        report_root_name: Nom du rapport (ex: "Report")
+        source_page_name: Nom de la page source (défaut: "main")
+        target_pages: Liste des pages cibles (None = toutes sauf source)
+        visual_name: Sélecteur(s) des visuels à copier (str, list ou None = tous) :
+            titre exact, motif glob ("KPI*"), "re:<regex>", "type:<visualType>"
+            ou "group:<id du groupe>" (voir `pbir_tools.selectors`) ;
+            "title:<titre>" désigne un titre littéral, sans motif ni préfixe
+            (ex: "title:Ventes*" pour le titre "Ventes*")
+        quiet: Si True, rien n'est affiché dans la console
+        on_event: Callback appelé avec chaque `PbirEvent` (optionnel)
+        max_workers: Nombre de workers pour traiter les pages cibles en parallèle
+            (None ou 1 = traitement séquentiel)
+        executor: "process" (défaut, pour le travail CPU) ou "thread"
+        cache: Fichier du cache de métadonnées (hors du rapport) : les visuels
+            source inchangés depuis la dernière exécution ne sont pas re-parsés
+        dry_run: Si True, calcule les changements sans rien écrire sur disque
+
+    Returns:
+        Changeset: Fichiers créés, modifiés et supprimés (à appliquer si dry_run)
+    
+    Exemples:
+        # Copier tous les visuels
+        duplicate_visuals("path/to/pbir", "Report", "template")
         
-        # 🔹 IMPORTANT : Trier les visuels par ordre de z source pour les traiter dans le bon ordre
-        source_order = sorted(visuals_to_copy.items(), key=lambda x: source_visuals_z_order.get(x[0], 0))
-        print(f"\n  📊 Ordre dans la source ORIGINAL (par z):")
-        for vis_id, vis in source_order:
-            z = source_visuals_z_order.get(vis_id, 0)
-            parent = vis.get("parentGroupName", "aucun")
-            print(f"    • {get_vis_name(vis)} : z={z}, groupe={parent}")
+        # Copier un visuel spécifique
+        duplicate_visuals("path/to/pbir", "Report", "main", ["page1"], "Mon Graphique")
         
-        # 🔹 ITÉRER SUR LES VISUELS DANS L'ORDRE DE Z SOURCE
-        for vis_id, source_vis in source_order:
-            target_path = f"{target_visuals_prefix}{vis_id}/visual.json"
-            target_vis = target_page_visuals.get(vis_id, {})
-
-            merged_vis = merge_visual(source_vis, target_vis)
-
-            # Calculer le z : au-dessus de l'existant
-            new_z = compute_z_above_existing(
-                vis_id,
-                source_visuals_z_order,  # 🔹 Utiliser l'ordre Z ORIGINAL
-                target_page_visuals,
-                visual_id_mapping
-            )
-            
-            if "position" in merged_vis:
-                merged_vis["position"]["z"] = new_z
+        # Copier plusieurs visuels
+        duplicate_visuals("path/to/pbir", "Report", "main", None, ["Graphique 1", "Tableau 2"])
+    """
+    events = make_emitter(quiet=quiet, on_event=on_event)
 
-            files_dict[target_path] = json.dumps(merged_vis, indent=2).encode("utf-8")
-            target_page_visuals[vis_id] = merged_vis
+    # ===== CHARGEMENT DES FICHIERS =====
+    events.info("load", "📂 Chargement des fichiers PBIR...", path=pbir_folder_path)
+    with PbirProject(pbir_folder_path, report_root_name, cache=cache) as project:
+        summary = duplicate_visuals(
+            project, source_page_name, target_pages, visual_name, events, max_workers, executor
+        )
+        changeset = project.plan()
+        if not dry_run:
+            # ===== SAUVEGARDE =====
+            events.info("save", "\n{sep}\n💾 Sauvegarde des modifications...", sep="=" * 60)
+            stats = project.apply(changeset)
 
-            status = "Mis à jour" if target_vis else "Créé"
-            vis_name = get_vis_name(merged_vis)
-            parent = merged_vis.get("parentGroupName", "aucun")
-            print(f"  ✓ {status} : {vis_name} (z={new_z}, groupe={parent})")
+    if dry_run:
+        events.info(
+            "plan", "\n📝 Simulation : {create} création(s), {update} modification(s), {delete} suppression(s)",
+            **changeset.counts,
+        )
+        return changeset
 
-        # ===== ÉTAPE 4 : MISE À JOUR RAPPEL_PAGE_H SI PRÉSENT =====
-        rappel_path = f"{target_visuals_prefix}Rappel_Page_H/visual.json"
-        if rappel_path in files_dict:
-            print(f"\n📝 Mise à jour de Rappel_Page_H...")
-            
-            rappel_vis = json.loads(files_dict[rappel_path].decode("utf-8"))
-            
-            # Obtenir le nom d'affichage de la page
-            if page_json_path in files_dict:
-                target_page_data = json.loads(files_dict[page_json_path].decode("utf-8"))
-                display_name = target_page_data.get("displayName", page)
-                
-                # Mettre à jour le textRun[1] avec le nom de la page
-                for g in rappel_vis.get("visual", {}).get("objects", {}).get("general", []):
-                    for p in g.get("properties", {}).get("paragraphs", []):
-                        runs = p.get("textRuns", [])
-                        if len(runs) >= 2:
-                            runs[1]["value"] = display_name
-                            print(f"  ✓ Nom mis à jour : '{display_name}'")
-                
-                # Sauvegarder
-                files_dict[rappel_path] = json.dumps(rappel_vis, indent=2).encode("utf-8")
-
-    # ===== SAUVEGARDE =====
-    print(f"\n{'='*60}")
-    print("💾 Sauvegarde des modifications...")
-    for rel_path, content in files_dict.items():
-        full_path = os.path.join(pbir_folder_path, rel_path)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        with open(full_path, "wb") as f:
-            f.write(content)
-
-    print("\n🎉 Duplication terminée avec succès !")
-    print(f"   • {len(visuals_to_copy)} visuel(s) copié(s)")
-    print(f"   • {len(target_pages)} page(s) mise(s) à jour")
+    events.info(
+        "saved", "   • {written} fichier(s) écrit(s), {skipped} inchangé(s)",
+        written=stats["written"], skipped=stats["skipped"], deleted=stats["deleted"],
+    )
+
+    events.info(
+        "done", "\n🎉 Duplication terminée avec succès !\n   • {visuals} visuel(s) copié(s)\n   • {pages} page(s) mise(s) à jour",
+        visuals=summary["visuals"], pages=summary["pages"],
+    )
+    return changeset
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+Mode surveillance : propagation continue des modifications de la page source.
+
+Les fichiers de la page source (page.json, visual.json, group.json) et du
+dossier bookmarks sont surveillés par scrutation de leur date de modification.
+À chaque changement, seuls les visuels concernés sont recopiés sur les pages
+cibles (en gardant leur z sur les cibles), et les bookmarks sont resynchronisés
+si un bookmark ou un lien vers un bookmark a changé.
+"""
+
+import os
+import time
+
+from .project import PbirProject
+from .visuals import duplicate_visuals
+from .bookmarks import duplicate_bookmark
+from .events import make_emitter
+
+
+def _stat_tree(root_dir, rel_dir, out, depth):
+    """Ajoute à `out` les fichiers .json de `root_dir` : {chemin relatif: (taille, mtime_ns)}."""
+    try:
+        with os.scandir(root_dir) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if depth:
+                        _stat_tree(entry.path, f"{rel_dir}{entry.name}/", out, depth - 1)
+                elif entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    out[f"{rel_dir}{entry.name}"] = (stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        pass
+
+
+def watched_files(pbir_folder_path, report_root_name, source_page_name="main"):
+    """
+    État des fichiers surveillés : page source et dossier bookmarks.
+
+    Returns:
+        dict: {chemin relatif: (taille, mtime_ns)}
+    """
+    definition = f"{report_root_name}/definition/"
+    files = {}
+    page_dir = f"{definition}pages/{source_page_name}/"
+    _stat_tree(os.path.join(pbir_folder_path, page_dir), page_dir, files, depth=2)
+    bookmarks_dir = f"{definition}bookmarks/"
+    _stat_tree(os.path.join(pbir_folder_path, bookmarks_dir), bookmarks_dir, files, depth=0)
+    return files
+
+
+def changed_files(before, after):
+    """Chemins créés, modifiés ou supprimés entre deux états `watched_files`."""
+    return sorted(path for path in before.keys() | after.keys() if before.get(path) != after.get(path))
+
+
+def sync_changes(project, changed_paths, source_page_name="main", target_pages=None, bookmarks=True, events=None):
+    """
+    Propage sur les pages cibles les fichiers source modifiés d'un projet déjà chargé.
+
+    - visual.json modifié ou créé : ce visuel est recopié (avec les autres
+      visuels de son groupe, pour que l'ordre du groupe reste celui de la source)
+    - group.json modifié : les visuels de ce groupe sont recopiés
+    - page.json source modifié (ordre des groupes) : tous les visuels sont recopiés
+    - bookmark modifié, ou visuel recopié portant un lien de bookmark :
+      les bookmarks sont resynchronisés
+
+    Les modifications restent en mémoire dans `project`.
+
+    Returns:
+        dict: {"visuals": nombre de visuels recopiés, "bookmarks": True si resynchronisés}
+    """
+    events = make_emitter(events)
+    page_prefix = f"{project.pages_prefix}{source_page_name}/"
+
+    visual_ids, group_ids = set(), set()
+    all_visuals = sync_bookmarks = False
+    for path in changed_paths:
+        if path.startswith(project.bookmarks_prefix):
+            sync_bookmarks = True
+        elif path == f"{page_prefix}page.json":
+            all_visuals = True
+        elif path.startswith(f"{page_prefix}visuals/") and path in project:
+            item_id = path.split("/")[-2]
+            if path.endswith("/visual.json"):
+                visual_ids.add(item_id)
+            elif path.endswith("/group.json"):
+                group_ids.add(item_id)
+        elif path.startswith(page_prefix):
+            events.info("watch_removed", "  ℹ Fichier source supprimé (ignoré sur les cibles) : {path}", path=path)
+
+    source_visuals = project.page_visuals(source_page_name)
+    if all_visuals:
+        visual_ids = set(source_visuals)
+    else:
+        group_ids.update(
+            project.metadata(source_visuals[vis_id]).get("parentGroupName") for vis_id in visual_ids
+        )
+        group_ids.discard(None)
+        visual_ids.update(
+            vis_id for vis_id, path in source_visuals.items()
+            if project.metadata(path).get("parentGroupName") in group_ids
+        )
+
+    summary = {"visuals": 0, "bookmarks": False}
+    if visual_ids:
+        duplicate_visuals(
+            project, source_page_name, target_pages, events=events,
+            visual_ids=visual_ids, keep_target_z=True,
+        )
+        summary["visuals"] = len(visual_ids)
+        # La copie remet les liens source : ils doivent être réaffectés
+        if any(project.metadata(source_visuals[vis_id])["bookmarkLinks"] for vis_id in visual_ids):
+            sync_bookmarks = True
+
+    if sync_bookmarks and bookmarks:
+        duplicate_bookmark(project, source_page_name, target_pages, events=events)
+        summary["bookmarks"] = True
+    return summary
+
+
+def pbir_watch(
+    pbir_folder_path: str,
+    report_root_name: str,
+    source_page_name: str = "main",
+    target_pages: list = None,
+    bookmarks: bool = True,
+    interval: float = 0.5,
+    max_cycles: int = None,
+    quiet: bool = False,
+    on_event=None,
+    cache=None
+):
+    """
+    Surveille la page source et propage ses modifications jusqu'à interruption (Ctrl+C).
+
+    Args:
+        pbir_folder_path: Chemin vers le dossier PBIR décompressé
+        report_root_name: Nom du rapport (ex: "Report1.Report")
+        source_page_name: Nom de la page source (défaut: "main")
+        target_pages: Liste des pages cibles (None = toutes sauf source)
+        bookmarks: Si True, resynchronise aussi les bookmarks
+        interval: Délai de scrutation en secondes
+        max_cycles: Nombre maximal de scrutations (None = sans limite)
+        quiet: Si True, rien n'est affiché dans la console
+        on_event: Callback appelé avec chaque `PbirEvent` (optionnel)
+        cache: Fichier du cache de métadonnées (voir `PbirProject`), optionnel
+
+    Returns:
+        int: Nombre de synchronisations effectuées
+
+    Raises:
+        ValueError: si `pbir_folder_path` n'est pas un dossier (une archive .zip
+            ou un `Storage` ne peuvent pas être édités dans Power BI Desktop,
+            donc pas surveillés)
+
+    Example:
+        >>> pbir_watch("C:/PowerBI/Report1", "Report1.Report", "main")
+    """
+    if not isinstance(pbir_folder_path, (str, os.PathLike)) or not os.path.isdir(pbir_folder_path):
+        raise ValueError(f"❌ Le mode surveillance nécessite un dossier PBIR décompressé : {pbir_folder_path}")
+    events = make_emitter(quiet=quiet, on_event=on_event)
+    state = watched_files(pbir_folder_path, report_root_name, source_page_name)
+    events.info(
+        "watch_start", "👀 Surveillance de la page {page} (Ctrl+C pour arrêter)...",
+        page=source_page_name, interval=interval,
+    )
+
+    syncs = cycles = 0
+    try:
+        while max_cycles is None or cycles < max_cycles:
+            time.sleep(interval)
+            cycles += 1
+            current = watched_files(pbir_folder_path, report_root_name, source_page_name)
+            changed = changed_files(state, current)
+            state = current
+            if not changed:
+                continue
+
+            started = time.perf_counter()
+            events.info("watch_changes", "\n🔔 {count} fichier(s) modifié(s)", count=len(changed), paths=changed)
+            with PbirProject(pbir_folder_path, report_root_name, cache=cache) as project:
+                summary = sync_changes(project, changed, source_page_name, target_pages, bookmarks, events)
+                written = project.changes()
+                stats = project.save()
+            syncs += 1
+
+            # Les fichiers écrits par la synchronisation ne sont pas des modifications à propager
+            own = set(written["created"] + written["modified"] + written["deleted"])
+            state.update(
+                (path, stat) for path, stat in
+                watched_files(pbir_folder_path, report_root_name, source_page_name).items()
+                if path in own
+            )
+            for path in own:
+                if path in state and not os.path.exists(os.path.join(pbir_folder_path, path)):
+                    del state[path]
+
+            events.info(
+                "watch_synced", "✅ Synchronisé en {seconds:.2f} s ({written} fichier(s) écrit(s))",
+                seconds=time.perf_counter() - started, visuals=summary["visuals"],
+                bookmarks=summary["bookmarks"], **stats,
+            )
+    except KeyboardInterrupt:
+        pass
+
+    events.info("watch_stop", "⏹️ Surveillance arrêtée ({syncs} synchronisation(s))", syncs=syncs)
+    return syncs
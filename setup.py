@@ -17,6 +17,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/diouetq/pbir-tools",  # À personnaliser
     packages=find_packages(),
+    package_data={"pbir_tools": ["templates/*.zip"]},
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -37,6 +38,9 @@ setup(
         # Uniquement la bibliothèque standard Python
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.6.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -47,8 +51,7 @@ setup(
     },
     entry_points={
         "console_scripts": [
-            # Si vous souhaitez ajouter des commandes CLI plus tard
-            # "pbir-tools=pbir_tools.cli:main",
+            "pbir-tools=pbir_tools.cli:main",
         ],
     },
     keywords="powerbi pbir automation reporting",
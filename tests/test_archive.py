@@ -0,0 +1,166 @@
+"""
+Tests unitaires pour le module archive (rapports PBIR dans un .zip)
+"""
+
+import os
+import tempfile
+import shutil
+import zipfile
+import pytest
+from pbir_tools import pbir_duplicate_visuals, pbir_duplicate_bookmark
+from pbir_tools.fleet import find_reports
+from pbir_tools.archive import ArchiveStorage, archive_reports
+from pbir_tools.project import PbirProject
+
+from .utils import REPORT, PAGES, BOOKMARKS, build_report
+
+
+def zip_folder(folder, archive_path, prefix=""):
+    """Compresse un dossier PBIR (membres dans l'ordre de os.walk)"""
+    with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for dirpath, dirnames, filenames in os.walk(folder):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                full_path = os.path.join(dirpath, filename)
+                rel_path = os.path.relpath(full_path, folder).replace(os.sep, "/")
+                archive.write(full_path, prefix + rel_path)
+
+
+def raw_members(archive_path):
+    """{nom: (CRC, taille compressée)} des membres d'une archive"""
+    with zipfile.ZipFile(archive_path) as archive:
+        return {info.filename: (info.CRC, info.compress_size) for info in archive.infolist()}
+
+
+class TestReportArchive:
+    """Tests pour la lecture et la réécriture d'un rapport zippé"""
+
+    def setup_method(self):
+        """Créer un rapport de test, sa copie zippée et un modèle sémantique à ne pas toucher"""
+        self.test_dir = tempfile.mkdtemp()
+        self.folder = os.path.join(self.test_dir, "dossier")
+        build_report(self.folder)
+        os.makedirs(os.path.join(self.folder, "Test.SemanticModel"), exist_ok=True)
+        with open(os.path.join(self.folder, "Test.SemanticModel", "model.bim"), "wb") as f:
+            f.write(b'{"model": "x"}' * 1000)
+        self.archive = os.path.join(self.test_dir, "rapport.zip")
+        zip_folder(self.folder, self.archive)
+
+    def teardown_method(self):
+        """Nettoyer le dossier temporaire après chaque test"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_lazy_reads(self):
+        """Seuls les membres lus sont décompressés"""
+        project = PbirProject(self.archive, REPORT)
+        assert not project.storage.concurrent  # un seul ZipFile : lectures en série
+        assert set(project.page_names()) == {"main", "p1", "p2"}
+        project.load_json(f"{PAGES}/main/page.json")
+        project.close()
+
+        assert list(project._contents) == [f"{PAGES}/main/page.json"]
+        assert "Test.SemanticModel/model.bim" not in project
+
+    def test_same_result_as_folder(self):
+        """Les opérations sur l'archive donnent le même résultat que sur le dossier"""
+        for path in (self.folder, self.archive):
+            pbir_duplicate_visuals(path, REPORT, "main", None, "kpi", quiet=True)
+            pbir_duplicate_bookmark(path, REPORT, "main", quiet=True)
+
+        with zipfile.ZipFile(self.archive) as archive:
+            for name in archive.namelist():
+                with open(os.path.join(self.folder, name), "rb") as f:
+                    assert archive.read(name) == f.read(), name
+            assert f"{PAGES}/p1/visuals/v1/visual.json" in archive.namelist()
+            assert f"{BOOKMARKS}/bk1_p2.bookmark.json" in archive.namelist()
+            assert archive.testzip() is None
+
+    def test_directory_entries_kept(self):
+        """Une sauvegarde sans changement conserve les entrées de dossiers de l'archive"""
+        archive_path = os.path.join(self.test_dir, "avec_dossiers.zip")
+        shutil.make_archive(archive_path[:-4], "zip", self.folder)
+        with zipfile.ZipFile(archive_path) as archive:
+            before = archive.namelist()
+        assert any(name.endswith("/") for name in before)
+
+        project = PbirProject(archive_path, REPORT)
+        assert all(not path.endswith("/") for path in project)
+        project.storage.commit({}, ())
+        project.close()
+
+        with zipfile.ZipFile(archive_path) as archive:
+            assert archive.namelist() == before
+            assert archive.testzip() is None
+
+    def test_mode_kept(self):
+        """La réécriture de l'archive conserve ses droits d'accès"""
+        os.chmod(self.archive, 0o644)
+        pbir_duplicate_visuals(self.archive, REPORT, "main", quiet=True)
+
+        assert os.stat(self.archive).st_mode & 0o777 == 0o644
+
+    def test_closed_on_error(self):
+        """L'archive est fermée même si l'opération échoue (page source absente)"""
+        closed = []
+        original_close = ArchiveStorage.close
+
+        def close(storage):
+            closed.append(storage.path)
+            original_close(storage)
+
+        ArchiveStorage.close = close
+        try:
+            with pytest.raises(Exception):
+                pbir_duplicate_bookmark(self.archive, REPORT, "absente", quiet=True)
+            with pytest.raises(Exception):
+                pbir_duplicate_visuals(self.archive, REPORT, "absente", quiet=True)
+        finally:
+            ArchiveStorage.close = original_close
+
+        assert closed == [self.archive, self.archive]
+
+    def test_unchanged_members_copied_raw(self):
+        """Les membres inchangés gardent leurs octets compressés, sans fichier temporaire restant"""
+        before = raw_members(self.archive)
+        pbir_duplicate_visuals(self.archive, REPORT, "main", ["p1"], "kpi", quiet=True)
+        after = raw_members(self.archive)
+
+        assert after["Test.SemanticModel/model.bim"] == before["Test.SemanticModel/model.bim"]
+        assert after[f"{PAGES}/main/visuals/v1/visual.json"] == before[f"{PAGES}/main/visuals/v1/visual.json"]
+        assert after[f"{PAGES}/p1/page.json"] != before[f"{PAGES}/p1/page.json"]
+        assert sorted(os.listdir(self.test_dir)) == ["dossier", "rapport.zip"]
+
+    def test_dry_run_leaves_archive(self):
+        """Une simulation ne réécrit pas l'archive"""
+        with open(self.archive, "rb") as f:
+            content = f.read()
+        changeset = pbir_duplicate_visuals(self.archive, REPORT, "main", None, "kpi", quiet=True, dry_run=True)
+
+        assert changeset.counts["create"] == 4  # visuel + groupe, sur 2 pages
+        with open(self.archive, "rb") as f:
+            assert f.read() == content
+
+    def test_nested_report_and_discovery(self):
+        """Un rapport dans un sous-dossier de l'archive est trouvé et traité"""
+        nested = os.path.join(self.test_dir, "projet.zip")
+        zip_folder(self.folder, nested, prefix="Projet/")
+
+        assert archive_reports(nested) == [f"Projet/{REPORT}"]
+        assert find_reports(nested) == [(nested, f"Projet/{REPORT}")]
+
+        pbir_duplicate_visuals(nested, f"Projet/{REPORT}", "main", ["p1"], "kpi", quiet=True)
+        with zipfile.ZipFile(nested) as archive:
+            assert f"Projet/{PAGES}/p1/visuals/v1/visual.json" in archive.namelist()
+
+    def test_not_an_archive(self):
+        """Un fichier qui n'est pas une archive est refusé"""
+        path = os.path.join(self.test_dir, "notes.txt")
+        with open(path, "wb") as f:
+            f.write(b"texte")
+        with pytest.raises(ValueError):
+            PbirProject(path, REPORT)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,112 @@
+"""
+Tests unitaires pour le module bookmarks
+"""
+
+import os
+import tempfile
+import shutil
+from pbir_tools import pbir_duplicate_bookmark
+from pbir_tools import codec
+from pbir_tools.bookmarks import BookmarkTemplate, split_copy_name
+
+from .utils import REPORT, PAGES, BOOKMARKS, build_report, read_json, write_json
+
+
+class TestSplitCopyName:
+    """Tests pour l'interprétation des noms de copies"""
+
+    def test_split(self):
+        """Toutes les découpes "<bookmark>_<page>" sur une page connue sont retournées"""
+        assert split_copy_name("bk1_p1", {"p1"}) == [("bk1", "p1")]
+        assert split_copy_name("a_b_1", {"1", "b_1"}) == [("a", "b_1"), ("a_b", "1")]
+        assert split_copy_name("bk1", {"p1"}) == []
+
+
+class TestBookmarkTemplate:
+    """Tests pour le modèle des copies de bookmarks"""
+
+    SOURCE = {
+        "displayName": "Vue",
+        "name": "bk1",
+        "explorationState": {"sections": {"main": {"filters": [1]}, "p2": {}}, "activeSection": "main"},
+    }
+
+    def test_render_matches_build(self):
+        """Le modèle d'octets produit la même copie que l'objet construit"""
+        template = BookmarkTemplate("bk1", self.SOURCE, "main", codec.DEFAULT_FORMAT)
+        copy = template.build("p1", "bk1_p1", "P1_Vue")
+
+        assert template.render("p1", "bk1_p1", "P1_Vue", codec.DEFAULT_FORMAT) == codec.dumps(copy)
+        assert copy["explorationState"]["sections"] == {"p2": {}, "p1": {"filters": [1]}}
+        assert copy["explorationState"]["sections"]["p1"] is self.SOURCE["explorationState"]["sections"]["main"]
+        assert self.SOURCE["explorationState"]["activeSection"] == "main"
+
+    def test_section_key_collision(self):
+        """Une page déjà présente comme clé de section n'utilise pas le modèle d'octets"""
+        template = BookmarkTemplate("bk1", self.SOURCE, "main", codec.DEFAULT_FORMAT)
+
+        assert template.render("p2", "bk1_p2", "P2_Vue", codec.DEFAULT_FORMAT) is None
+        assert template.build("p2", "bk1_p2", "P2_Vue")["explorationState"]["sections"] == {"p2": {"filters": [1]}}
+
+
+class TestPbirDuplicateBookmark:
+    """Tests pour la fonction pbir_duplicate_bookmark"""
+
+    def setup_method(self):
+        """Créer un rapport de test dans un dossier temporaire"""
+        self.test_dir = tempfile.mkdtemp()
+        build_report(self.test_dir)
+
+    def teardown_method(self):
+        """Nettoyer le dossier temporaire après chaque test"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def _bookmarks(self):
+        return sorted(os.listdir(os.path.join(self.test_dir, BOOKMARKS)))
+
+    def test_copies_and_links(self):
+        """Chaque bookmark source est copié sur chaque page, et les liens réaffectés"""
+        pbir_duplicate_bookmark(self.test_dir, REPORT, "main", quiet=True)
+
+        assert self._bookmarks() == [
+            "bk1.bookmark.json", "bk1_p1.bookmark.json", "bk1_p2.bookmark.json",
+            "bk2.bookmark.json", "bk2_p1.bookmark.json", "bk2_p2.bookmark.json",
+        ]
+        bk = read_json(self.test_dir, f"{BOOKMARKS}/bk1_p2.bookmark.json")
+        assert bk["displayName"] == "P2_BK1"
+        assert bk["explorationState"] == {"activeSection": "p2", "sections": {"p2": {}}}
+
+    def test_orphans(self):
+        """Seules les copies dont le bookmark source n'existe plus sont supprimées"""
+        pbir_duplicate_bookmark(self.test_dir, REPORT, "main", quiet=True)
+        os.remove(os.path.join(self.test_dir, f"{BOOKMARKS}/bk2.bookmark.json"))
+        # Bookmark de la page source dont le nom ressemble à une copie : conservé
+        write_json(self.test_dir, f"{BOOKMARKS}/intro_p1.bookmark.json", {
+            "name": "intro_p1", "explorationState": {"activeSection": "main"},
+        })
+
+        pbir_duplicate_bookmark(self.test_dir, REPORT, "main", bookmark_name="intro_p1", quiet=True)
+
+        assert self._bookmarks() == [
+            "bk1.bookmark.json", "bk1_p1.bookmark.json", "bk1_p2.bookmark.json",
+            "intro_p1.bookmark.json", "intro_p1_p1.bookmark.json", "intro_p1_p2.bookmark.json",
+        ]
+
+    def test_links_remapped_only_when_stale(self):
+        """Seuls les visuels cibles dont le lien diffère de la copie attendue sont réécrits"""
+        link = {"properties": {"bookmark": {"expr": {"Literal": {"Value": "'bk1'"}}}}}
+        for page in ("p1", "p2"):
+            write_json(self.test_dir, f"{PAGES}/{page}/visuals/v3/visual.json", {
+                "name": "v3", "position": {"z": 3}, "visual": {"visualContainerObjects": {"visualLink": [link]}},
+            })
+        pbir_duplicate_bookmark(self.test_dir, REPORT, "main", quiet=True)
+        assert read_json(self.test_dir, f"{PAGES}/p2/visuals/v3/visual.json")["visual"]["visualContainerObjects"][
+            "visualLink"][0]["properties"]["bookmark"]["expr"]["Literal"]["Value"] == "'bk1_p2'"
+
+        write_json(self.test_dir, f"{PAGES}/p1/visuals/v3/visual.json", {
+            "name": "v3", "position": {"z": 3}, "visual": {"visualContainerObjects": {"visualLink": [link]}},
+        })
+        changeset = pbir_duplicate_bookmark(self.test_dir, REPORT, "main", quiet=True)
+
+        assert [change.path for change in changeset] == [f"{PAGES}/p1/visuals/v3/visual.json"]
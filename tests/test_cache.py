@@ -0,0 +1,99 @@
+"""
+Tests unitaires pour le module cache
+"""
+
+import os
+import tempfile
+import shutil
+import pytest
+from pbir_tools import pbir_duplicate_visuals, pbir_duplicate_bookmark
+from pbir_tools.cache import MetadataCache
+from pbir_tools.project import PbirProject
+
+from .utils import REPORT, PAGES, BOOKMARKS, build_report, make_visual, read_json, write_json
+
+
+class TestMetadataCache:
+    """Tests pour le cache persistant des métadonnées"""
+
+    def setup_method(self):
+        """Créer un rapport de test et un fichier de cache hors du rapport"""
+        self.test_dir = tempfile.mkdtemp()
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.cache_dir, "report.cache")
+        build_report(self.test_dir)
+
+    def teardown_method(self):
+        """Nettoyer les dossiers temporaires après chaque test"""
+        for path in (self.test_dir, self.cache_dir):
+            if os.path.exists(path):
+                shutil.rmtree(path)
+
+    def _warm(self):
+        project = PbirProject(self.test_dir, REPORT, cache=self.cache_path)
+        metadata = {path: project.metadata(path) for path in project.page_visuals("main").values()}
+        project.save()
+        project.close()
+        return metadata
+
+    def test_metadata_fields(self):
+        """Titre, z, groupe et liens de bookmark sont extraits"""
+        metadata = self._warm()
+
+        assert metadata[f"{PAGES}/main/visuals/v1/visual.json"] == {
+            "title": "KPI", "z": 2, "visualType": "card", "bookmarkLinks": [], "parentGroupName": "g1",
+        }
+        assert metadata[f"{PAGES}/main/visuals/v3/visual.json"]["bookmarkLinks"] == ["'bk1'"]
+
+    def test_unchanged_files_not_read(self):
+        """Un fichier inchangé n'est ni lu ni parsé lors de l'exécution suivante"""
+        metadata = self._warm()
+
+        project = PbirProject(self.test_dir, REPORT, cache=self.cache_path)
+        for path, meta in metadata.items():
+            assert project.metadata(path) == meta
+        project.close()
+
+        assert project._contents == {}
+
+    def test_changed_file_reparsed(self):
+        """Un fichier modifié est relu et ses métadonnées mises à jour"""
+        self._warm()
+        write_json(self.test_dir, f"{PAGES}/main/visuals/v1/visual.json", make_visual("v1", "Nouveau titre", 7))
+
+        project = PbirProject(self.test_dir, REPORT, cache=self.cache_path)
+        meta = project.metadata(f"{PAGES}/main/visuals/v1/visual.json")
+        project.close()
+
+        assert meta == {"title": "Nouveau titre", "z": 7, "visualType": "card", "bookmarkLinks": []}
+
+    def test_touched_file_not_reparsed(self):
+        """Un fichier dont seul le mtime a changé n'est pas re-parsé"""
+        self._warm()
+        path = f"{PAGES}/main/visuals/v1/visual.json"
+        os.utime(os.path.join(self.test_dir, path), ns=(0, 0))
+
+        project = PbirProject(self.test_dir, REPORT, cache=MetadataCache(self.cache_path))
+        assert project.metadata(path)["title"] == "KPI"
+        assert path not in project._json
+        project.cache.close()
+
+    @pytest.mark.parametrize("runs", [1, 2])
+    def test_same_result_with_cache(self, runs):
+        """Le cache ne change pas le résultat des opérations"""
+        other_dir = tempfile.mkdtemp()
+        try:
+            build_report(other_dir)
+            pbir_duplicate_visuals(other_dir, REPORT, "main", ["p1"], "kpi", quiet=True)
+            pbir_duplicate_bookmark(other_dir, REPORT, "main", quiet=True)
+
+            for _ in range(runs - 1):
+                self._warm()
+            pbir_duplicate_visuals(self.test_dir, REPORT, "main", ["p1"], "kpi", quiet=True, cache=self.cache_path)
+            pbir_duplicate_bookmark(self.test_dir, REPORT, "main", quiet=True, cache=self.cache_path)
+
+            for path in (f"{PAGES}/p1/visuals/v1/visual.json", f"{BOOKMARKS}/bk1_p2.bookmark.json"):
+                assert read_json(self.test_dir, path) == read_json(other_dir, path)
+            assert not os.path.exists(os.path.join(self.test_dir, f"{PAGES}/p1/visuals/v2/visual.json"))
+        finally:
+            shutil.rmtree(other_dir)
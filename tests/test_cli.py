@@ -0,0 +1,83 @@
+"""
+Tests unitaires pour la CLI pbir-tools
+"""
+
+import os
+import sys
+import tempfile
+import shutil
+import subprocess
+from pbir_tools.cli import main
+
+from .utils import REPORT, PAGES, BOOKMARKS, build_report, read_json
+
+
+class TestCli:
+    """Tests pour les sous-commandes de pbir-tools"""
+
+    def setup_method(self):
+        """Créer un rapport de test dans un dossier temporaire"""
+        self.test_dir = tempfile.mkdtemp()
+        build_report(self.test_dir)
+
+    def teardown_method(self):
+        """Nettoyer le dossier temporaire après chaque test"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_sync_visuals_and_bookmarks(self):
+        """sync-visuals et sync-bookmarks appliquent les fonctions correspondantes"""
+        assert main(["sync-visuals", self.test_dir, REPORT, "--target", "p1", "--visual", "KPI*", "-q"]) == 0
+        assert main(["sync-bookmarks", self.test_dir, REPORT, "-q"]) == 0
+
+        assert read_json(self.test_dir, f"{PAGES}/p1/visuals/v1/visual.json")["name"] == "v1"
+        assert not os.path.exists(os.path.join(self.test_dir, f"{PAGES}/p1/visuals/v3/visual.json"))
+        assert os.path.exists(os.path.join(self.test_dir, f"{BOOKMARKS}/bk1_p2.bookmark.json"))
+
+    def test_dry_run_lists_changes(self, capsys):
+        """--dry-run affiche les changements sans rien écrire"""
+        assert main(["sync-bookmarks", self.test_dir, REPORT, "--dry-run", "-q"]) == 0
+
+        assert f"create  {BOOKMARKS}/bk1_p1.bookmark.json" in capsys.readouterr().out
+        assert not os.path.exists(os.path.join(self.test_dir, f"{BOOKMARKS}/bk1_p1.bookmark.json"))
+
+    def test_errors(self, capsys):
+        """Un rapport introuvable ou une erreur de traitement donnent le code 1"""
+        assert main(["sync-bookmarks", os.path.join(self.test_dir, "absent"), REPORT, "-q"]) == 1
+        assert main(["sync-visuals", self.test_dir, REPORT, "--visual", "inconnu", "-q"]) == 1
+        assert "❌" in capsys.readouterr().err
+
+    def test_new_and_fleet(self):
+        """new crée un rapport vide ; fleet traite plusieurs rapports"""
+        assert main(["new", self.test_dir, "Vide", "-q"]) == 0
+        assert os.path.isdir(os.path.join(self.test_dir, "Vide.Report"))
+
+        assert main(["fleet", os.path.join(self.test_dir, REPORT), "--workers", "1", "-q"]) == 0
+
+    def test_lazy_imports(self):
+        """Importer le package ou la CLI ne charge pas les modules de traitement"""
+        code = (
+            "import sys, pbir_tools.cli; "
+            "print(sorted(m for m in sys.modules if m.startswith('pbir_tools.')))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        ).stdout
+
+        assert output.strip() == "['pbir_tools.cli']"
+
+        # sync-bookmarks (métadonnées comprises) ne charge pas la duplication des visuels
+        code = (
+            "import sys; from pbir_tools.cli import main; "
+            f"assert main(['sync-bookmarks', {self.test_dir!r}, {REPORT!r}, '-q']) == 0; "
+            "print(sorted(m for m in sys.modules if m.startswith('pbir_tools.')))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        ).stdout
+
+        assert "'pbir_tools.bookmarks'" in output
+        assert "'pbir_tools.visuals'" not in output
+        assert "'pbir_tools.selectors'" not in output
@@ -0,0 +1,135 @@
+"""
+Tests unitaires pour le module codec
+"""
+
+import json
+import pytest
+from pbir_tools import codec
+
+
+SAMPLES = [
+    {"name": "v1", "position": {"x": 10.5, "y": 0, "z": 3000}, "tags": [], "meta": {}},
+    {"texte": "Données é€ 😀", "ctrl": "a\x00\x1f\x7f\n\t\"\\/"},
+    {"petits": [0.0001, 0.00001, 1e-7, -2.5e-10], "grands": [1e15, 1e16, 1.5e300, -1e22]},
+    {"entiers": [0, -1, 2 ** 63, 2 ** 70, -(2 ** 80)]},
+    {"speciaux": [float("nan"), float("inf"), float("-inf"), -0.0, None, True, False]},
+    {1: "clé entière", "b": [[], [{}], [[1, [2]]]]},
+    [],
+    "texte seul",
+    1e-05,
+]
+
+
+@pytest.fixture(params=[b for b in codec.BACKENDS if b == "json" or getattr(codec, b) is not None])
+def backend(request):
+    previous = codec.get_backend()
+    yield codec.set_backend(request.param)
+    codec.set_backend(previous)
+
+
+class TestCodec:
+    """Tests pour la sérialisation et le parsing JSON"""
+
+    @pytest.mark.parametrize("data", SAMPLES)
+    def test_dumps_matches_stdlib(self, backend, data):
+        """La sortie est identique octet pour octet à json.dumps(indent=2)"""
+        assert codec.dumps(data) == json.dumps(data, indent=2).encode("utf-8")
+
+    @pytest.mark.parametrize("data", SAMPLES[:4])
+    def test_loads_roundtrip(self, backend, data):
+        """Le parsing relit ce qui a été sérialisé"""
+        content = codec.dumps(data)
+
+        assert codec.loads(content) == data
+        assert codec.loads(content.decode("utf-8")) == data
+
+    def test_loads_invalid(self, backend):
+        """Un document invalide lève une ValueError"""
+        with pytest.raises(ValueError):
+            codec.loads(b"{invalide")
+
+    def test_unknown_backend(self):
+        """Un backend inconnu est refusé"""
+        with pytest.raises(ValueError):
+            codec.set_backend("simplejson")
+
+
+class TestFormatPreservation:
+    """Tests pour la conservation de la mise en forme des fichiers existants"""
+
+    ORIGINAL = b'\xef\xbb\xbf{\r\n    "name": "v1",\r\n    "titre": "\xc3\xa9t\xc3\xa9",\r\n    "z": 1\r\n}\r\n'
+
+    def test_detect_format(self):
+        """Fins de ligne, indentation, saut de ligne final, BOM et échappement sont détectés"""
+        fmt = codec.detect_format(self.ORIGINAL)
+
+        assert fmt == codec.JsonFormat("\r\n", "    ", "\r\n", False, True)
+        assert codec.detect_format(codec.dumps({"a": [1]})) == codec.DEFAULT_FORMAT
+
+    def test_unchanged_keeps_original_bytes(self):
+        """Un document sémantiquement identique (ordre des clés compris) n'est pas réécrit"""
+        content, changed = codec.dumps_like({"z": 1, "titre": "été", "name": "v1"}, self.ORIGINAL)
+
+        assert content is self.ORIGINAL
+        assert not changed
+
+    def test_changed_keeps_format(self):
+        """Un document modifié est écrit dans la mise en forme d'origine"""
+        content, changed = codec.dumps_like({"name": "v1", "titre": "été", "z": 2}, self.ORIGINAL)
+
+        assert changed
+        assert content == self.ORIGINAL.replace(b'"z": 1', b'"z": 2')
+
+    def test_bool_is_not_int(self):
+        """true et 1 ne sont pas considérés comme identiques"""
+        _, changed = codec.dumps_like({"a": True}, b'{\n  "a": 1\n}')
+
+        assert changed
+
+
+class TestJsonTemplate:
+    """Tests pour les modèles JSON pré-sérialisés"""
+
+    @pytest.mark.parametrize("fmt", [None, codec.JsonFormat("\r\n", "\t", "\r\n", False, True)])
+    def test_render_matches_dumps(self, fmt):
+        """Le rendu est identique à la sérialisation du document complet"""
+        template = codec.JsonTemplate({"name": codec.slot("name"), "s": {codec.slot("key"): [1, "é"]}}, fmt)
+
+        assert template.slots == ["name", "key"]
+        assert template.render(name="v1 😀", key="p\"1") == codec.dumps({"name": "v1 😀", "s": {"p\"1": [1, "é"]}}, fmt)
+
+
+class TestLazyDocument:
+    """Tests pour la lecture paresseuse des champs d'un document"""
+
+    DATA = {
+        "name": "v1",
+        "position": {"x": 1, "z": 5},
+        "visual": {"objects": {"name": "imbriqué", "z": 9}, "links": [], "empty": {}},
+        "title": "a,\nb",
+        "parentGroupName": "g1",
+    }
+
+    @pytest.mark.parametrize("indent", [2, 4, "\t", None])
+    @pytest.mark.parametrize("crlf", [False, True])
+    def test_lookup_matches_parse(self, indent, crlf):
+        """Les champs extraits sont identiques à ceux du document parsé"""
+        raw = json.dumps(self.DATA, indent=indent, ensure_ascii=False).encode("utf-8")
+        if crlf:
+            raw = raw.replace(b"\n", b"\r\n")
+        doc = codec.LazyDocument(raw)
+
+        assert doc.lookup("position", "z") == 5
+        assert doc.lookup("title") == "a,\nb"
+        assert doc.lookup("visual", "objects", "name") == "imbriqué"
+        assert doc.lookup("visual", "links") == []
+        assert doc.lookup("visual", "empty", "z", default=0) == 0
+        assert doc.lookup("z", default="absent") == "absent"
+        assert doc.get("parentGroupName") == "g1" and "id" not in doc
+        assert (doc.parsed is None) == (indent is not None)
+        assert dict(doc) == self.DATA
+
+    def test_lookup_on_dict(self):
+        """`lookup` s'applique aussi aux objets déjà parsés"""
+        assert codec.lookup(self.DATA, "visual", "objects", "z") == 9
+        assert codec.lookup(self.DATA, "name", "z", default=0) == 0
@@ -6,7 +6,8 @@ import os
 import tempfile
 import shutil
 import pytest
-from pbir_tools import pbir_empty_file
+from pbir_tools import pbir_empty_file, pbir_empty_files
+from pbir_tools.empty_file import load_template
 
 
 class TestPbirEmptyFile:
@@ -82,5 +83,76 @@ class TestPbirEmptyFile:
             assert os.path.exists(full_path), f"Fichier manquant : {file_path}"
 
 
+    def test_template_loaded_once(self):
+        """Le modèle intégré est chargé une seule fois par processus"""
+        assert load_template() is load_template()
+        assert [path for path, _ in load_template().render("R")][0] == "R.pbip"
+
+    def test_custom_template(self):
+        """Un dossier PBIR existant sert de modèle : son nom est remplacé"""
+        template_dir = os.path.join(self.test_dir, "modele")
+        pbir_empty_file(template_dir, "ModeleEntreprise", quiet=True)
+        with open(os.path.join(template_dir, "ModeleEntreprise.Report", "notes.txt"), "wb") as f:
+            f.write(b"Rapport ModeleEntreprise\r\n")
+        with open(os.path.join(template_dir, "README.md"), "wb") as f:
+            f.write(b"ignore")
+
+        output_dir = os.path.join(self.test_dir, "sortie")
+        pbir_empty_file(output_dir, "Ventes", quiet=True, template=template_dir)
+
+        with open(os.path.join(output_dir, "Ventes.Report", "notes.txt"), "rb") as f:
+            assert f.read() == b"Rapport Ventes\r\n"
+        with open(os.path.join(output_dir, "Ventes.pbip"), "rb") as f:
+            assert b"Ventes.Report" in f.read()
+        assert not os.path.exists(os.path.join(output_dir, "README.md"))
+
+    def test_missing_template(self):
+        """Un modèle introuvable est refusé"""
+        with pytest.raises(ValueError):
+            pbir_empty_file(self.test_dir, "R", quiet=True, template=os.path.join(self.test_dir, "absent"))
+
+    def _read_tree(self, folder):
+        files = {}
+        for dirpath, _, filenames in os.walk(folder):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                with open(path, "rb") as f:
+                    files[os.path.relpath(path, folder)] = f.read()
+        return files
+
+    @pytest.mark.parametrize("io_workers", [1, 4])
+    def test_bulk_same_as_single(self, io_workers):
+        """pbir_empty_files produit les mêmes fichiers que des appels à pbir_empty_file"""
+        names = [f"Rapport{i}" for i in range(5)]
+        single_dir = os.path.join(self.test_dir, "un_par_un")
+        bulk_dir = os.path.join(self.test_dir, "en_masse")
+        for name in names:
+            pbir_empty_file(single_dir, name, quiet=True)
+
+        assert pbir_empty_files(bulk_dir, names, quiet=True, io_workers=io_workers) == names
+        assert self._read_tree(bulk_dir) == self._read_tree(single_dir)
+
+    def test_bulk_variables(self):
+        """Les variables de chaque rapport sont remplacées en plus du nom"""
+        template_dir = os.path.join(self.test_dir, "modele")
+        pbir_empty_file(template_dir, "ModeleRegion", quiet=True)
+        with open(os.path.join(template_dir, "ModeleRegion.Report", "notes.txt"), "wb") as f:
+            f.write("Région _REGION_ (ModeleRegion)".encode("utf-8"))
+
+        output_dir = os.path.join(self.test_dir, "sortie")
+        pbir_empty_files(output_dir, {"Nord": {"_REGION_": "Hauts-de-France"}, "Sud": {"_REGION_": "Occitanie"}},
+                         template=template_dir, quiet=True)
+
+        with open(os.path.join(output_dir, "Sud.Report", "notes.txt"), "rb") as f:
+            assert f.read().decode("utf-8") == "Région Occitanie (Sud)"
+        assert os.path.isfile(os.path.join(output_dir, "Nord.pbip"))
+
+    def test_bulk_invalid_name(self):
+        """Un nom de rapport vide est refusé avant toute écriture"""
+        with pytest.raises(ValueError):
+            pbir_empty_files(self.test_dir, ["Ok", ""], quiet=True)
+        assert os.listdir(self.test_dir) == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,70 @@
+"""
+Tests unitaires pour le module events
+"""
+
+import os
+import logging
+import tempfile
+import shutil
+import pytest
+from pbir_tools import pbir_duplicate_visuals
+from pbir_tools.events import EventEmitter, DEBUG, INFO
+
+from .utils import REPORT, build_report
+
+
+class TestEventEmitter:
+    """Tests pour l'émission d'événements"""
+
+    def test_disabled_skips_formatting(self, capsys):
+        """En mode silencieux sans sortie, le message n'est jamais formaté"""
+        events = EventEmitter(quiet=True)
+
+        # Un champ manquant ferait échouer le formatage
+        events.info("test", "{absent}")
+
+        assert not events.enabled(INFO)
+        assert capsys.readouterr().out == ""
+
+    def test_debug_not_printed(self, capsys):
+        """Les événements DEBUG ne sont pas affichés dans la console"""
+        EventEmitter().debug("test", "détail {x}", x=1)
+
+        assert capsys.readouterr().out == ""
+
+    def test_logging_output(self, caplog):
+        """Les événements sont transmis au logger pbir_tools"""
+        with caplog.at_level(logging.DEBUG, logger="pbir_tools"):
+            EventEmitter(quiet=True).debug("test", "détail {x}", x=1)
+
+        assert caplog.records[0].message == "détail 1"
+        assert caplog.records[0].event == "test"
+
+
+class TestQuietMode:
+    """Tests du mode silencieux des fonctions publiques"""
+
+    def setup_method(self):
+        """Créer un rapport de test dans un dossier temporaire"""
+        self.test_dir = tempfile.mkdtemp()
+        build_report(self.test_dir)
+
+    def teardown_method(self):
+        """Nettoyer le dossier temporaire après chaque test"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_quiet_with_callback(self, capsys):
+        """quiet=True n'affiche rien mais le callback reçoit les événements"""
+        received = []
+
+        pbir_duplicate_visuals(self.test_dir, REPORT, "main", ["p1"], quiet=True, on_event=received.append)
+
+        assert capsys.readouterr().out == ""
+        copied = [e for e in received if e.name == "visual_copied"]
+        assert sorted(e.fields["vis_id"] for e in copied) == ["v1", "v2", "v3"]
+        assert any(e.name == "merge_group" and e.level == DEBUG for e in received)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
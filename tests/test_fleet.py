@@ -0,0 +1,74 @@
+"""
+Tests unitaires pour le module fleet
+"""
+
+import os
+import tempfile
+import shutil
+import pytest
+from pbir_tools import pbir_fleet
+from pbir_tools.fleet import find_reports
+
+from .utils import REPORT, PAGES, BOOKMARKS, build_report, read_json
+
+OPERATIONS = [
+    ("duplicate_visuals", {"source_page_name": "main"}),
+    ("duplicate_bookmark", {"source_page_name": "main"}),
+]
+
+
+class TestPbirFleet:
+    """Tests pour le traitement d'une flotte de rapports"""
+
+    def setup_method(self):
+        """Créer trois rapports de test (dont un invalide) dans un dossier temporaire"""
+        self.test_dir = tempfile.mkdtemp()
+        for name in ("a", "b"):
+            build_report(os.path.join(self.test_dir, name))
+        # Rapport sans page source : son traitement échoue
+        os.makedirs(os.path.join(self.test_dir, "c", REPORT, "definition", "pages"))
+
+    def teardown_method(self):
+        """Nettoyer le dossier temporaire après chaque test"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_find_reports(self):
+        """Motifs glob et chemins explicites désignent les dossiers *.Report"""
+        reports = find_reports([os.path.join(self.test_dir, "*"), os.path.join(self.test_dir, "a", REPORT)])
+
+        assert reports == [(os.path.join(self.test_dir, name), REPORT) for name in ("a", "b", "c")]
+        with pytest.raises(ValueError):
+            find_reports(os.path.join(self.test_dir, "absent"))
+
+    @pytest.mark.parametrize("max_workers,executor", [(1, "process"), (2, "thread"), (2, "process")])
+    def test_failures_do_not_abort(self, max_workers, executor):
+        """Un rapport en échec est enregistré sans interrompre les autres"""
+        summary = pbir_fleet(
+            os.path.join(self.test_dir, "*"), OPERATIONS,
+            max_workers=max_workers, executor=executor, quiet=True,
+        )
+
+        assert (summary["reports"], summary["succeeded"], summary["failed"]) == (3, 2, 1)
+        assert [result["ok"] for result in summary["results"]] == [True, True, False]
+        assert summary["results"][2]["error"]
+        assert summary["written"] > 0
+        for name in ("a", "b"):
+            root = os.path.join(self.test_dir, name)
+            assert read_json(root, f"{PAGES}/p1/visuals/v1/visual.json")["name"] == "v1"
+            assert os.path.exists(os.path.join(root, f"{BOOKMARKS}/bk1_p1.bookmark.json"))
+
+    def test_dry_run(self):
+        """En simulation, les actions sont totalisées et rien n'est écrit"""
+        summary = pbir_fleet(
+            [os.path.join(self.test_dir, name) for name in ("a", "b")], OPERATIONS,
+            max_workers=1, dry_run=True, quiet=True,
+        )
+
+        assert summary["succeeded"] == 2 and summary["create"] > 0
+        assert not os.path.exists(os.path.join(self.test_dir, "a", f"{BOOKMARKS}/bk1_p1.bookmark.json"))
+
+    def test_unknown_operation(self):
+        """Une opération inconnue est refusée avant tout traitement"""
+        with pytest.raises(ValueError):
+            pbir_fleet(self.test_dir, [("inconnue", {})])
@@ -0,0 +1,176 @@
+"""
+Tests unitaires pour le module project
+"""
+
+import os
+import tempfile
+import shutil
+import pytest
+from pbir_tools.project import PbirProject
+
+from .utils import REPORT, PAGES, build_report
+
+
+class TestPbirProject:
+    """Tests pour le chargement paresseux PbirProject"""
+
+    def setup_method(self):
+        """Créer un rapport de test dans un dossier temporaire"""
+        self.test_dir = tempfile.mkdtemp()
+        build_report(self.test_dir)
+
+    def teardown_method(self):
+        """Nettoyer le dossier temporaire après chaque test"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_index_scoped_to_report(self):
+        """Seul le dossier du rapport est indexé"""
+        project = PbirProject(self.test_dir, REPORT)
+
+        assert f"{PAGES}/main/page.json" in project
+        assert all(path.startswith(f"{REPORT}/") for path in project)
+
+    def test_contents_read_on_first_access(self):
+        """Aucun fichier n'est lu à l'indexation"""
+        project = PbirProject(self.test_dir, REPORT)
+        assert project._contents == {}
+
+        page = project.load_json(f"{PAGES}/main/page.json")
+
+        assert page["name"] == "main"
+        assert list(project._contents) == [f"{PAGES}/main/page.json"]
+
+    def test_set_json_and_save(self):
+        """Un fichier écrit est créé sur disque à la sauvegarde"""
+        project = PbirProject(self.test_dir, REPORT)
+        path = f"{PAGES}/p1/visuals/new/visual.json"
+
+        project.set_json(path, {"name": "new"})
+        project.save()
+
+        assert path in project
+        assert os.path.exists(os.path.join(self.test_dir, path))
+
+    def test_set_json_unchanged_not_dirty(self):
+        """Un contenu sémantiquement identique ne marque pas le fichier modifié"""
+        project = PbirProject(self.test_dir, REPORT)
+        path = f"{PAGES}/main/page.json"
+        data = dict(reversed(list(project.load_json(path).items())))
+
+        assert project.set_json(path, data) is False
+        assert project.changes()["modified"] == []
+
+    def test_save_only_dirty_files(self):
+        """Seuls les fichiers modifiés avec un contenu différent sont écrits"""
+        project = PbirProject(self.test_dir, REPORT)
+        same = f"{PAGES}/main/page.json"
+        changed = f"{PAGES}/p1/page.json"
+
+        project[same] = project[same]
+        project.set_json(changed, {"name": "p1", "displayName": "Nouveau"})
+
+        assert project.changes()["modified"] == [same, changed]
+        stats = project.save()
+
+        assert stats == {"written": 1, "skipped": 1, "deleted": 0}
+        assert project.changes() == {"created": [], "modified": [], "deleted": []}
+
+    def test_plan_does_not_touch_disk(self):
+        """Le plan liste créations, modifications et suppressions avec leurs empreintes"""
+        project = PbirProject(self.test_dir, REPORT)
+        created = f"{PAGES}/p1/visuals/new/visual.json"
+        updated = f"{PAGES}/p1/page.json"
+        deleted = f"{PAGES}/p2/visuals/x/visual.json"
+
+        project.set_json(created, {"name": "new"})
+        project.set_json(updated, {"name": "p1", "displayName": "Autre"})
+        del project[deleted]
+        changeset = project.plan()
+
+        assert [(c.path, c.action) for c in changeset] == [(deleted, "delete"), (updated, "update"), (created, "create")]
+        assert changeset.counts == {"create": 1, "update": 1, "delete": 1, "unchanged": 0}
+        assert changeset.changes[1].before != changeset.changes[1].after
+        assert not os.path.exists(os.path.join(self.test_dir, created))
+        assert os.path.exists(os.path.join(self.test_dir, deleted))
+
+        assert project.apply(changeset) == {"written": 2, "skipped": 0, "deleted": 1}
+        assert not os.path.exists(os.path.join(self.test_dir, deleted))
+        assert not project.plan()
+
+    def test_apply_stale_plan(self):
+        """Un plan devenu obsolète n'est pas appliqué"""
+        project = PbirProject(self.test_dir, REPORT)
+        path = f"{PAGES}/p1/page.json"
+        project.set_json(path, {"name": "p1", "displayName": "Autre"})
+        changeset = project.plan()
+        project.set_json(path, {"name": "p1", "displayName": "Encore autre"})
+
+        with pytest.raises(ValueError):
+            project.apply(changeset)
+
+    def test_apply_stale_delete(self):
+        """Une suppression n'est pas appliquée si le fichier a été recréé depuis le calcul du plan"""
+        project = PbirProject(self.test_dir, REPORT)
+        path = f"{PAGES}/p1/visuals/x/visual.json"
+        del project[path]
+        changeset = project.plan()
+        project.set_json(path, {"name": "x"})
+
+        with pytest.raises(ValueError):
+            project.apply(changeset)
+        assert os.path.exists(os.path.join(self.test_dir, path))
+
+    def test_delete_applied_on_save(self):
+        """Une suppression n'est appliquée sur disque qu'à la sauvegarde"""
+        project = PbirProject(self.test_dir, REPORT)
+        path = f"{PAGES}/p1/visuals/x/visual.json"
+        full_path = os.path.join(self.test_dir, path)
+
+        del project[path]
+        assert os.path.exists(full_path)
+
+        assert project.save()["deleted"] == 1
+        assert not os.path.exists(full_path)
+
+    def test_page_index(self):
+        """L'index des pages suit les écritures et les suppressions"""
+        project = PbirProject(self.test_dir, REPORT)
+
+        assert sorted(project.page_names()) == ["main", "p1", "p2"]
+        assert sorted(project.page_visuals("main")) == ["v1", "v2", "v3"]
+        assert list(project.page_groups("main")) == ["g1"]
+
+        project.set_json(f"{PAGES}/p1/visuals/new/visual.json", {"name": "new"})
+        del project[f"{PAGES}/p1/visuals/x/visual.json"]
+
+        assert list(project.page_visuals("p1")) == ["new"]
+        assert project.page_json_path("p1") == f"{PAGES}/p1/page.json"
+        assert project.page_visuals("inconnue") == {}
+
+    def test_scan_matches_os_walk(self):
+        """Le parcours parallèle indexe les mêmes chemins, dans l'ordre de os.walk"""
+        expected = []
+        for root, _, files in os.walk(os.path.join(self.test_dir, REPORT)):
+            for file in files:
+                rel_path = os.path.relpath(os.path.join(root, file), self.test_dir)
+                expected.append(rel_path.replace("\\", "/"))
+
+        assert list(PbirProject(self.test_dir, REPORT)) == expected
+        assert list(PbirProject(self.test_dir, REPORT, io_workers=1)) == expected
+
+    def test_prefetch(self):
+        """Les lectures groupées donnent le même contenu que les accès unitaires"""
+        project = PbirProject(self.test_dir, REPORT)
+        paths = list(project.page_visuals("main").values())
+
+        project.prefetch(paths + ["inconnu.json"])
+
+        assert sorted(project._contents) == sorted(paths)
+        for path in paths:
+            with open(os.path.join(self.test_dir, path), "rb") as f:
+                assert project[path] == f.read()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,92 @@
+"""
+Tests unitaires pour le module selectors
+"""
+
+import os
+import tempfile
+import shutil
+import pytest
+from pbir_tools import pbir_duplicate_visuals
+from pbir_tools.selectors import SelectorIndex, compile_selectors
+
+from .utils import REPORT, PAGES, build_report
+
+
+class TestSelectorIndex:
+    """Tests pour l'index de sélection des visuels"""
+
+    METADATA = [
+        ("v1", {"title": "KPI Ventes", "visualType": "card", "parentGroupName": "g1"}),
+        ("v2", {"title": "Titre", "visualType": "textbox", "parentGroupName": "g1"}),
+        ("v3", {"title": "KPI Marge", "visualType": "card"}),
+        ("v4", {"title": " kpi ventes ", "visualType": "lineChart"}),
+    ]
+
+    def _select(self, visual_name):
+        return SelectorIndex(self.METADATA).select(compile_selectors(visual_name))
+
+    def test_exact_title(self):
+        """Un titre exact est comparé sans tenir compte de la casse ni des espaces"""
+        assert self._select("kpi ventes") == ["v1", "v4"]
+        assert self._select("KPI") == []
+
+    def test_literal_title(self):
+        """title: désigne un titre littéral, même avec des caractères de motif ou un préfixe"""
+        metadata = [
+            ("v1", {"title": "Sales*"}),
+            ("v2", {"title": "Sales 2024"}),
+            ("v3", {"title": "type:card"}),
+            ("v4", {"title": "Sales[1]"}),
+        ]
+        index = SelectorIndex(metadata)
+
+        assert index.select(compile_selectors("title:Sales*")) == ["v1"]
+        assert index.select(compile_selectors("Sales*")) == ["v1", "v2", "v4"]
+        assert index.select(compile_selectors("title:type:card")) == ["v3"]
+        assert index.select(compile_selectors("title:Sales[1]")) == ["v4"]
+
+    def test_patterns(self):
+        """Motifs glob, expressions régulières, types et groupes"""
+        assert self._select("KPI*") == ["v1", "v3", "v4"]
+        assert self._select("kpi ?arge") == ["v3"]
+        assert self._select("re:marge$") == ["v3"]
+        assert self._select("type:CARD") == ["v1", "v3"]
+        assert self._select("group:g1") == ["v1", "v2"]
+
+    def test_union_in_page_order(self):
+        """Plusieurs sélecteurs : union, dans l'ordre de la page, sans doublon"""
+        assert self._select(["type:lineChart", "Titre", "*VENTES"]) == ["v1", "v2", "v4"]
+
+    def test_all_visuals(self):
+        """None ou une liste vide sélectionne tous les visuels"""
+        assert self._select(None) == self._select([]) == ["v1", "v2", "v3", "v4"]
+
+    def test_invalid(self):
+        """Types et expressions régulières invalides sont refusés"""
+        with pytest.raises(ValueError):
+            compile_selectors(("KPI",))
+        with pytest.raises(ValueError):
+            compile_selectors("re:(")
+
+
+class TestSelectorsInDuplicateVisuals:
+    """Tests des sélecteurs dans pbir_duplicate_visuals"""
+
+    def setup_method(self):
+        """Créer un rapport de test dans un dossier temporaire"""
+        self.test_dir = tempfile.mkdtemp()
+        build_report(self.test_dir)
+
+    def teardown_method(self):
+        """Nettoyer le dossier temporaire après chaque test"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_group_selector(self):
+        """Un sélecteur de groupe copie les visuels du groupe et le groupe"""
+        changeset = pbir_duplicate_visuals(self.test_dir, REPORT, "main", ["p1"], "group:g1", quiet=True)
+
+        paths = {change.path for change in changeset}
+        assert f"{PAGES}/p1/visuals/v1/visual.json" in paths
+        assert f"{PAGES}/p1/visuals/g1/group.json" in paths
+        assert f"{PAGES}/p1/visuals/v3/visual.json" not in paths
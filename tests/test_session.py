@@ -0,0 +1,95 @@
+"""
+Tests unitaires pour le module session
+"""
+
+import os
+import tempfile
+import shutil
+import pytest
+from pbir_tools import PbirSession, pbir_duplicate_visuals, pbir_duplicate_bookmark
+
+from .utils import REPORT, PAGES, BOOKMARKS, build_report, read_json
+
+
+class TestPbirSession:
+    """Tests pour la file d'opérations PbirSession"""
+
+    def setup_method(self):
+        """Créer un rapport de test dans un dossier temporaire"""
+        self.test_dir = tempfile.mkdtemp()
+        build_report(self.test_dir)
+
+    def teardown_method(self):
+        """Nettoyer le dossier temporaire après chaque test"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def _snapshot(self, root):
+        """Contenu de tous les fichiers du rapport"""
+        snapshot = {}
+        for dirpath, _, files in os.walk(os.path.join(root, REPORT)):
+            for file in files:
+                full_path = os.path.join(dirpath, file)
+                with open(full_path, "rb") as f:
+                    snapshot[os.path.relpath(full_path, root)] = f.read()
+        return snapshot
+
+    def test_session_matches_chained_calls(self):
+        """Une session produit le même résultat que les appels enchaînés"""
+        other_dir = tempfile.mkdtemp()
+        try:
+            build_report(other_dir)
+            pbir_duplicate_visuals(other_dir, REPORT, "main")
+            pbir_duplicate_bookmark(other_dir, REPORT, "main")
+
+            with PbirSession(self.test_dir, REPORT) as session:
+                session.duplicate_visuals("main").duplicate_bookmark("main")
+
+            assert self._snapshot(self.test_dir) == self._snapshot(other_dir)
+        finally:
+            shutil.rmtree(other_dir)
+
+    def test_commit_writes_once(self):
+        """Les opérations ne sont écrites qu'au commit"""
+        session = PbirSession(self.test_dir, REPORT)
+        session.duplicate_visuals("main", ["p1"]).duplicate_bookmark("main", ["p1"])
+
+        assert not os.path.exists(os.path.join(self.test_dir, f"{BOOKMARKS}/bk1_p1.bookmark.json"))
+
+        stats = session.commit()
+
+        assert stats["written"] > 0
+        assert session.operations == []
+        assert read_json(self.test_dir, f"{PAGES}/p1/visuals/v1/visual.json")["name"] == "v1"
+        assert read_json(self.test_dir, f"{BOOKMARKS}/bk1_p1.bookmark.json")["name"] == "bk1_p1"
+
+    def test_resync_is_noop(self):
+        """Une synchronisation des bookmarks déjà faite ne modifie aucun fichier"""
+        PbirSession(self.test_dir, REPORT, quiet=True).duplicate_bookmark("main").commit()
+        before = self._snapshot(self.test_dir)
+
+        stats = PbirSession(self.test_dir, REPORT, quiet=True).duplicate_bookmark("main").commit()
+
+        assert stats == {"written": 0, "skipped": 0, "deleted": 0}
+        assert self._snapshot(self.test_dir) == before
+
+    def test_dry_run_writes_nothing(self):
+        """Une simulation retourne le plan sans rien écrire"""
+        before = self._snapshot(self.test_dir)
+
+        changeset = pbir_duplicate_visuals(self.test_dir, REPORT, "main", ["p1"], quiet=True, dry_run=True)
+        session_plan = PbirSession(self.test_dir, REPORT, quiet=True).duplicate_bookmark("main").plan()
+
+        assert self._snapshot(self.test_dir) == before
+        assert changeset.counts["create"] == 4 and changeset.counts["update"] == 1
+        assert session_plan.counts["create"] == 4
+        assert pbir_duplicate_visuals(self.test_dir, REPORT, "main", ["p1"], quiet=True).counts == changeset.counts
+
+    def test_unknown_operation(self):
+        """Une opération inconnue est refusée"""
+        with pytest.raises(ValueError):
+            PbirSession(self.test_dir, REPORT).add("inconnue")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,165 @@
+"""
+Tests unitaires pour le module storage
+"""
+
+import os
+import tempfile
+import shutil
+import pytest
+from pbir_tools import (
+    pbir_duplicate_visuals, pbir_duplicate_bookmark, pbir_empty_file, PbirSession,
+    DirectoryStorage, MemoryStorage, OverlayStorage,
+)
+from pbir_tools.project import PbirProject
+from pbir_tools.storage import Storage, open_storage
+
+from .utils import REPORT, PAGES, BOOKMARKS, build_report
+
+
+def read_tree(folder):
+    """{chemin relatif "/": contenu} de tous les fichiers d'un dossier"""
+    return {rel_path: DirectoryStorage(folder).read(rel_path) for rel_path in DirectoryStorage(folder).list()}
+
+
+class TestStorage:
+    """Tests pour les stockages dossier, mémoire et superposition"""
+
+    def setup_method(self):
+        """Créer un rapport de test et un dossier de résultats"""
+        self.test_dir = tempfile.mkdtemp()
+        self.other_dir = tempfile.mkdtemp()
+        build_report(self.test_dir)
+
+    def teardown_method(self):
+        """Nettoyer les dossiers temporaires après chaque test"""
+        for path in (self.test_dir, self.other_dir):
+            if os.path.exists(path):
+                shutil.rmtree(path)
+
+    def _run(self, location):
+        pbir_duplicate_visuals(location, REPORT, "main", None, "kpi", quiet=True)
+        pbir_duplicate_bookmark(location, REPORT, "main", quiet=True)
+
+    def test_directory_listing(self):
+        """Un dossier liste tous ses fichiers, ou ceux d'un sous-dossier"""
+        storage = DirectoryStorage(self.test_dir, io_workers=1)
+        paths = storage.list(REPORT)
+
+        assert f"{PAGES}/main/page.json" in paths
+        assert all(path.startswith(f"{REPORT}/") for path in paths)
+        assert sorted(DirectoryStorage(self.test_dir).list(REPORT)) == sorted(paths)
+        assert "Test.SemanticModel/.pbi/cache.abf" in storage.list()
+
+    def test_memory_chain_same_as_folder(self):
+        """Des opérations enchaînées en mémoire donnent le résultat du dossier, sans toucher au disque"""
+        memory = MemoryStorage.copy_of(self.test_dir)
+        before = read_tree(self.test_dir)
+        self._run(memory)
+        assert read_tree(self.test_dir) == before
+
+        self._run(self.test_dir)
+        assert memory.files == read_tree(self.test_dir)
+
+    def test_memory_session_and_empty_file(self):
+        """Un rapport vide créé en mémoire peut être modifié par une session"""
+        memory = MemoryStorage()
+        pbir_empty_file(memory, "Vide", quiet=True)
+        assert "Vide.pbip" in memory.files
+
+        project = PbirProject(memory, "Vide.Report")
+        page = project.page_names()[0]
+        project.set_json("Vide.Report/definition/bookmarks/bk.bookmark.json", {
+            "name": "bk", "explorationState": {"activeSection": page},
+        })
+        assert project.save() == {"written": 1, "skipped": 0, "deleted": 0}
+
+        with PbirSession(memory, "Vide.Report", quiet=True) as session:
+            session.duplicate_bookmark(page)
+        assert "Vide.Report/definition/bookmarks/bk.bookmark.json" in memory.files
+
+    def test_overlay_keeps_base_read_only(self):
+        """La superposition n'écrit que dans la couche supérieure"""
+        before = read_tree(self.test_dir)
+        overlay = OverlayStorage(self.test_dir, self.other_dir)
+        self._run(overlay)
+
+        assert read_tree(self.test_dir) == before
+        written = read_tree(self.other_dir)
+        assert f"{PAGES}/p1/visuals/v1/visual.json" in written
+        assert f"{PAGES}/main/visuals/v1/visual.json" not in written
+
+        self._run(self.test_dir)
+        project = PbirProject(overlay, REPORT)
+        assert {path: project[path] for path in project} == {
+            path: content for path, content in read_tree(self.test_dir).items() if path.startswith(f"{REPORT}/")
+        }
+
+    def test_overlay_deletion_masks_base(self):
+        """Un fichier de la base supprimé via la superposition est masqué, pas supprimé"""
+        overlay = OverlayStorage(self.test_dir)
+        pbir_duplicate_bookmark(self.test_dir, REPORT, "main", quiet=True)
+        os.remove(os.path.join(self.test_dir, f"{BOOKMARKS}/bk2.bookmark.json"))
+
+        pbir_duplicate_bookmark(overlay, REPORT, "main", quiet=True)
+
+        orphan = f"{BOOKMARKS}/bk2_p1.bookmark.json"
+        assert orphan in overlay.deleted
+        assert orphan not in overlay.list(REPORT)
+        assert os.path.exists(os.path.join(self.test_dir, orphan))
+        with pytest.raises(FileNotFoundError):
+            overlay.read(orphan)
+
+    def test_overlay_deletion_persists(self):
+        """Une suppression enregistrée dans une couche sur disque survit à la réouverture"""
+        pbir_duplicate_bookmark(self.test_dir, REPORT, "main", quiet=True)
+        os.remove(os.path.join(self.test_dir, f"{BOOKMARKS}/bk2.bookmark.json"))
+        orphan = f"{BOOKMARKS}/bk2_p1.bookmark.json"
+
+        pbir_duplicate_bookmark(OverlayStorage(self.test_dir, self.other_dir), REPORT, "main", quiet=True)
+
+        reopened = OverlayStorage(self.test_dir, self.other_dir)
+        assert orphan in reopened.deleted
+        assert orphan not in PbirProject(reopened, REPORT)
+        assert OverlayStorage.DELETED_MANIFEST not in reopened.list()
+        assert os.path.exists(os.path.join(self.test_dir, orphan))
+
+        reopened.write(orphan, b"{}")
+        again = OverlayStorage(self.test_dir, self.other_dir)
+        assert again.read(orphan) == b"{}"
+        assert orphan not in again.deleted
+
+    def test_cache_with_memory_storage(self):
+        """Un stockage sans version n'utilise pas le cache, sans changer le résultat"""
+        memory = MemoryStorage.copy_of(self.test_dir)
+        cache_path = os.path.join(self.other_dir, "report.cache")
+        pbir_duplicate_visuals(memory, REPORT, "main", ["p1"], "kpi", quiet=True, cache=cache_path)
+
+        assert f"{PAGES}/p1/visuals/v1/visual.json" in memory.files
+
+    def test_incomplete_storage_rejected(self):
+        """Un stockage qui n'implémente pas toute l'interface ne peut pas être créé"""
+        class ReadOnly(Storage):
+            def list(self, folder=""):
+                return []
+
+            def read(self, rel_path):
+                raise FileNotFoundError(rel_path)
+
+        with pytest.raises(TypeError):
+            ReadOnly()
+
+    def test_open_storage(self):
+        """Un Storage est retourné tel quel, un fichier non zip est refusé"""
+        memory = MemoryStorage()
+        assert open_storage(memory) is memory
+        assert isinstance(open_storage(self.test_dir), DirectoryStorage)
+
+        path = os.path.join(self.other_dir, "notes.txt")
+        with open(path, "wb") as f:
+            f.write(b"texte")
+        with pytest.raises(ValueError):
+            open_storage(path)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,91 @@
+"""
+Tests unitaires pour le module synthetic
+"""
+
+import os
+import tempfile
+import shutil
+import zipfile
+import pytest
+from pbir_tools import codec, pbir_duplicate_visuals, pbir_duplicate_bookmark, MemoryStorage
+from pbir_tools.project import PbirProject
+from pbir_tools.synthetic import build_report, generate_report
+
+PARAMS = {"pages": 4, "visuals": 10, "groups": 2, "bookmarks": 3}
+PAGES = "Synthetic.Report/definition/pages"
+BOOKMARKS = "Synthetic.Report/definition/bookmarks"
+
+
+class TestSynthetic:
+    """Tests pour le générateur de rapports synthétiques"""
+
+    def setup_method(self):
+        """Créer un dossier temporaire pour les tests"""
+        self.test_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Nettoyer le dossier temporaire après chaque test"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_structure(self):
+        """Le rapport a le nombre de pages, visuels, groupes et bookmarks demandé"""
+        project = PbirProject(MemoryStorage(build_report(**PARAMS)), "Synthetic.Report")
+
+        assert project.page_names()[0] == "main"
+        assert len(project.page_names()) == 4
+        assert all(len(project.page_visuals(page)) == 10 for page in project.page_names())
+        assert len(project.bookmark_paths()) == 4  # 3 bookmarks + bookmarks.json
+
+        groups = [path for path in project if path.endswith("/group.json")]
+        assert len(groups) == 2
+        members = [vis_id for path in groups for vis_id in codec.loads(project[path])["visuals"]]
+        assert all(project.metadata(project.page_visuals("main")[v])["parentGroupName"] for v in members)
+
+    def test_bookmark_links(self):
+        """Un visuel de la page source est lié à chaque bookmark"""
+        project = PbirProject(MemoryStorage(build_report(**PARAMS)), "Synthetic.Report")
+        links = [
+            value for path in project.page_visuals("main").values()
+            for value in project.metadata(path)["bookmarkLinks"]
+        ]
+        assert links == ["'Bookmark0000'", "'Bookmark0001'", "'Bookmark0002'"]
+
+    def test_deterministic(self):
+        """Mêmes paramètres, mêmes octets ; la taille croît avec les paramètres"""
+        assert build_report(**PARAMS) == build_report(**PARAMS)
+        assert len(build_report(pages=8, visuals=10)) > len(build_report(pages=4, visuals=10))
+
+        with pytest.raises(ValueError):
+            build_report(pages=0)
+
+    def test_generate_archive(self):
+        """Un chemin .zip inexistant devient une archive, pas un dossier"""
+        path = os.path.join(self.test_dir, "rapport.zip")
+        summary = generate_report(path, **PARAMS)
+
+        assert os.path.isfile(path)
+        with zipfile.ZipFile(path) as archive:
+            assert len(archive.namelist()) == summary["files"]
+        changeset = pbir_duplicate_bookmark(path, "Synthetic.Report", "main", quiet=True)
+        assert changeset.counts["create"] == 9
+
+    def test_generate_and_sync(self):
+        """Le rapport écrit sur disque est traité par les fonctions publiques"""
+        summary = generate_report(self.test_dir, **PARAMS)
+        assert summary["files"] == len(build_report(**PARAMS))
+        assert os.path.exists(os.path.join(self.test_dir, "Synthetic.pbip"))
+
+        pbir_duplicate_visuals(self.test_dir, "Synthetic.Report", "main", quiet=True)
+        changeset = pbir_duplicate_bookmark(self.test_dir, "Synthetic.Report", "main", quiet=True)
+
+        assert changeset.counts["create"] == 9  # 3 bookmarks x 3 pages cibles
+        with open(os.path.join(self.test_dir, PAGES, "page0002/visuals/src00001/visual.json"), "rb") as f:
+            linked = codec.loads(f.read())
+        value = linked["visual"]["visualContainerObjects"]["visualLink"][0]["properties"]["bookmark"]["expr"]["Literal"]["Value"]
+        assert value == "'Bookmark0001_page0002'"
+        assert os.path.exists(os.path.join(self.test_dir, BOOKMARKS, "Bookmark0001_page0002.bookmark.json"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,146 @@
+"""
+Tests unitaires pour le module visuals
+"""
+
+import os
+import tempfile
+import shutil
+import pytest
+from pbir_tools import pbir_duplicate_visuals
+from pbir_tools.events import make_emitter
+from pbir_tools.project import PbirProject
+from pbir_tools.visuals import compute_z_layers, duplicate_visuals
+
+from .utils import REPORT, PAGES, build_report, read_json, write_json, make_visual
+
+
+class TestComputeZLayers:
+    """Tests pour le calcul des z des visuels collés"""
+
+    def test_above_existing_in_source_order(self):
+        """Les visuels collés passent au-dessus de l'existant, dans l'ordre source"""
+        source_order = [("a", {"position": {"z": 1}}), ("b", {"position": {"z": 5}})]
+        target = {"x": {"position": {"z": 10}}}
+
+        z_layers = compute_z_layers(source_order, target)
+
+        assert 10 < z_layers["a"] < z_layers["b"]
+
+    def test_replaced_visual(self):
+        """Le z d'un visuel remplacé ne compte plus une fois collé"""
+        source_order = [("a", {}), ("b", {"position": {"z": 2}})]
+        target = {"a": {"position": {"z": 20}}, "x": {"position": {"z": 3}}}
+
+        assert compute_z_layers(source_order, target) == {"a": 21, "b": 5}
+
+    def test_kept_visuals(self):
+        """Un visuel conservé garde son z sans décaler les visuels créés"""
+        source_order = [("a", {"position": {"z": 1}}), ("b", {"position": {"z": 2}}), ("c", {"position": {"z": 3}})]
+        target = {"a": {"position": {"z": 4}}, "x": {"position": {"z": 10}}}
+
+        z_layers = compute_z_layers(source_order, target, kept={"a"})
+
+        assert z_layers == {"a": 4, "b": 11, "c": 13}
+        assert compute_z_layers(source_order[1:], target) == {"b": 11, "c": 13}
+
+    def test_empty_page(self):
+        """Sur une page vide, le premier visuel collé a z=1"""
+        assert compute_z_layers([("a", {"position": {"z": 7}})], {}) == {"a": 1}
+
+
+class TestPbirDuplicateVisuals:
+    """Tests pour la fonction pbir_duplicate_visuals"""
+
+    def setup_method(self):
+        """Créer un rapport de test dans un dossier temporaire"""
+        self.test_dir = tempfile.mkdtemp()
+        build_report(self.test_dir)
+
+    def teardown_method(self):
+        """Nettoyer le dossier temporaire après chaque test"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_keep_target_z(self):
+        """Avec keep_target_z, les visuels créés se placent juste au-dessus de l'existant"""
+        write_json(self.test_dir, f"{PAGES}/p1/visuals/v2/visual.json", make_visual("v2", "Titre", 5, group="g1"))
+
+        project = PbirProject(self.test_dir, REPORT)
+        duplicate_visuals(project, "main", ["p1"], events=make_emitter(quiet=True), keep_target_z=True)
+        project.save()
+        project.close()
+
+        zs = {v: read_json(self.test_dir, f"{PAGES}/p1/visuals/{v}/visual.json")["position"]["z"] for v in ("v1", "v2", "v3")}
+        assert zs == {"v2": 5, "v1": 11, "v3": 13}
+
+    def test_copy_all_visuals(self):
+        """Tous les visuels et groupes sont copiés sur toutes les pages"""
+        pbir_duplicate_visuals(self.test_dir, REPORT, "main")
+
+        for page in ("p1", "p2"):
+            for vis_id in ("v1", "v2", "v3"):
+                assert os.path.exists(os.path.join(self.test_dir, f"{PAGES}/{page}/visuals/{vis_id}/visual.json"))
+            group = read_json(self.test_dir, f"{PAGES}/{page}/visuals/g1/group.json")
+            assert group["visuals"] == ["v2", "v1"]
+            assert read_json(self.test_dir, f"{PAGES}/{page}/page.json")["visualContainers"] == ["g1"]
+
+    def test_z_order_above_existing(self):
+        """Les visuels collés gardent l'ordre source au-dessus de l'existant"""
+        pbir_duplicate_visuals(self.test_dir, REPORT, "main", ["p1"])
+
+        z = {
+            vis_id: read_json(self.test_dir, f"{PAGES}/p1/visuals/{vis_id}/visual.json")["position"]["z"]
+            for vis_id in ("x", "v1", "v2", "v3")
+        }
+        assert z["x"] < z["v2"] < z["v1"] < z["v3"]
+
+    def test_filter_by_name(self):
+        """Seuls les visuels demandés (titre, casse ignorée) sont copiés"""
+        pbir_duplicate_visuals(self.test_dir, REPORT, "main", ["p1"], "kpi")
+
+        assert os.path.exists(os.path.join(self.test_dir, f"{PAGES}/p1/visuals/v1/visual.json"))
+        assert not os.path.exists(os.path.join(self.test_dir, f"{PAGES}/p1/visuals/v2/visual.json"))
+        assert not os.path.exists(os.path.join(self.test_dir, f"{PAGES}/p2/visuals/v1/visual.json"))
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_parallel_matches_sequential(self, executor):
+        """Le traitement parallèle des pages produit les mêmes fichiers"""
+        other_dir = tempfile.mkdtemp()
+        try:
+            build_report(other_dir)
+            pbir_duplicate_visuals(other_dir, REPORT, "main", quiet=True)
+            pbir_duplicate_visuals(self.test_dir, REPORT, "main", quiet=True, max_workers=2, executor=executor)
+
+            for page in ("p1", "p2"):
+                for vis_id in ("x", "v1", "v2", "v3"):
+                    path = f"{PAGES}/{page}/visuals/{vis_id}/visual.json"
+                    assert read_json(self.test_dir, path) == read_json(other_dir, path)
+        finally:
+            shutil.rmtree(other_dir)
+
+    def test_crlf_preserved(self):
+        """Les fichiers CRLF le restent, et les fichiers créés reprennent le format source"""
+        for root, _, files in os.walk(os.path.join(self.test_dir, REPORT)):
+            for name in files:
+                full_path = os.path.join(root, name)
+                with open(full_path, "rb") as f:
+                    content = f.read()
+                with open(full_path, "wb") as f:
+                    f.write(content.replace(b"\n", b"\r\n") + b"\r\n")
+
+        pbir_duplicate_visuals(self.test_dir, REPORT, "main", quiet=True)
+
+        for path in (f"{PAGES}/p1/page.json", f"{PAGES}/p1/visuals/v1/visual.json", f"{PAGES}/p1/visuals/x/visual.json"):
+            with open(os.path.join(self.test_dir, path), "rb") as f:
+                content = f.read()
+            assert b"\n" not in content.replace(b"\r\n", b"")
+            assert content.endswith(b"}\r\n")
+
+    def test_unknown_target_page(self):
+        """Une page cible inconnue lève une erreur"""
+        with pytest.raises(ValueError):
+            pbir_duplicate_visuals(self.test_dir, REPORT, "main", ["inconnue"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,83 @@
+"""
+Tests unitaires pour le module watch
+"""
+
+import os
+import tempfile
+import shutil
+from pbir_tools import pbir_duplicate_visuals, pbir_duplicate_bookmark
+from pbir_tools.events import EventEmitter
+from pbir_tools.project import PbirProject
+from pbir_tools.watch import pbir_watch, sync_changes, watched_files, changed_files
+
+from .utils import REPORT, PAGES, BOOKMARKS, build_report, make_visual, read_json, write_json
+
+
+class TestWatch:
+    """Tests pour la propagation incrémentale des modifications de la page source"""
+
+    def setup_method(self):
+        """Créer un rapport de test déjà synchronisé"""
+        self.test_dir = tempfile.mkdtemp()
+        build_report(self.test_dir)
+        pbir_duplicate_visuals(self.test_dir, REPORT, "main", quiet=True)
+        pbir_duplicate_bookmark(self.test_dir, REPORT, "main", quiet=True)
+
+    def teardown_method(self):
+        """Nettoyer le dossier temporaire après chaque test"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_changed_files(self):
+        """Seuls les fichiers de la page source et des bookmarks sont surveillés"""
+        before = watched_files(self.test_dir, REPORT, "main")
+        write_json(self.test_dir, f"{PAGES}/main/visuals/v1/visual.json", make_visual("v1", "KPI modifié", 2, group="g1"))
+        write_json(self.test_dir, f"{PAGES}/p1/visuals/x/visual.json", make_visual("x", "Autre", 10))
+
+        after = watched_files(self.test_dir, REPORT, "main")
+
+        assert f"{BOOKMARKS}/bk1.bookmark.json" in after
+        assert changed_files(before, after) == [f"{PAGES}/main/visuals/v1/visual.json"]
+
+    def test_sync_only_changed_visual(self):
+        """Seul le visuel modifié est réécrit (son groupe est recopié), et il garde son z sur les cibles"""
+        z_before = read_json(self.test_dir, f"{PAGES}/p1/visuals/v1/visual.json")["position"]["z"]
+        path = f"{PAGES}/main/visuals/v1/visual.json"
+        write_json(self.test_dir, path, make_visual("v1", "KPI modifié", 2, group="g1"))
+
+        project = PbirProject(self.test_dir, REPORT)
+        summary = sync_changes(project, [path], events=EventEmitter(quiet=True))
+        changes = project.changes()
+        project.save()
+
+        assert summary == {"visuals": 2, "bookmarks": False}
+        assert changes["modified"] == [f"{PAGES}/p1/visuals/v1/visual.json", f"{PAGES}/p2/visuals/v1/visual.json"]
+        vis = read_json(self.test_dir, f"{PAGES}/p1/visuals/v1/visual.json")
+        assert vis["position"]["z"] == z_before
+        assert "KPI modifié" in str(vis)
+
+    def test_linked_visual_resyncs_bookmarks(self):
+        """Un visuel lié à un bookmark garde un lien vers le bookmark de sa page"""
+        path = f"{PAGES}/main/visuals/v3/visual.json"
+        write_json(self.test_dir, path, make_visual("v3", "Bouton modifié", 3, bookmark="bk1"))
+
+        project = PbirProject(self.test_dir, REPORT)
+        summary = sync_changes(project, [path], events=EventEmitter(quiet=True))
+        project.save()
+
+        assert summary["bookmarks"] is True
+        vis = read_json(self.test_dir, f"{PAGES}/p2/visuals/v3/visual.json")
+        assert "'bk1_p2'" in str(vis)
+
+    def test_watch_loop(self):
+        """La boucle de surveillance propage une modification puis s'arrête"""
+        path = f"{PAGES}/main/visuals/v2/visual.json"
+
+        def on_event(event):
+            if event.name == "watch_start":
+                write_json(self.test_dir, path, make_visual("v2", "Titre modifié", 1, group="g1"))
+
+        syncs = pbir_watch(self.test_dir, REPORT, "main", interval=0.01, max_cycles=3, quiet=True, on_event=on_event)
+
+        assert syncs == 1
+        assert "Titre modifié" in str(read_json(self.test_dir, f"{PAGES}/p1/visuals/v2/visual.json"))
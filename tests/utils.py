@@ -0,0 +1,73 @@
+"""
+Outils communs aux tests : construction d'un petit rapport PBIR sur disque
+"""
+
+import os
+import json
+
+REPORT = "Test.Report"
+PAGES = f"{REPORT}/definition/pages"
+BOOKMARKS = f"{REPORT}/definition/bookmarks"
+
+
+def write_json(root, rel_path, data):
+    """Écrit un fichier JSON (indentation 2) sous `root`"""
+    full_path = os.path.join(root, rel_path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    with open(full_path, "wb") as f:
+        f.write(json.dumps(data, indent=2).encode("utf-8"))
+
+
+def read_json(root, rel_path):
+    """Relit un fichier JSON écrit sous `root`"""
+    with open(os.path.join(root, rel_path), "rb") as f:
+        return json.loads(f.read().decode("utf-8"))
+
+
+def make_visual(vis_id, title, z, group=None, bookmark=None):
+    """Construit un visual.json minimal"""
+    vis = {
+        "name": vis_id,
+        "position": {"x": 0, "y": 0, "z": z, "width": 100, "height": 50},
+        "visual": {"visualType": "card"},
+        "visualContainerObjects": {
+            "title": [{"properties": {"text": {"expr": {"Literal": {"Value": f"'{title}'"}}}}}]
+        },
+    }
+    if group:
+        vis["parentGroupName"] = group
+    if bookmark:
+        vis["visual"]["visualContainerObjects"] = {
+            "visualLink": [{"properties": {"bookmark": {"expr": {"Literal": {"Value": f"'{bookmark}'"}}}}}]
+        }
+    return vis
+
+
+def build_report(root):
+    """
+    Construit un rapport avec une page source "main" (2 visuels groupés,
+    1 visuel lié à un bookmark), deux pages cibles et deux bookmarks.
+    """
+    write_json(root, f"{PAGES}/main/page.json",
+               {"name": "main", "displayName": "Main", "visualContainers": ["g1"]})
+    write_json(root, f"{PAGES}/main/visuals/v1/visual.json", make_visual("v1", "KPI", 2, group="g1"))
+    write_json(root, f"{PAGES}/main/visuals/v2/visual.json", make_visual("v2", "Titre", 1, group="g1"))
+    write_json(root, f"{PAGES}/main/visuals/v3/visual.json", make_visual("v3", "Bouton", 3, bookmark="bk1"))
+    write_json(root, f"{PAGES}/main/visuals/g1/group.json", {"name": "g1", "visuals": ["v2", "v1"]})
+
+    for page in ("p1", "p2"):
+        write_json(root, f"{PAGES}/{page}/page.json",
+                   {"name": page, "displayName": page.upper(), "visualContainers": []})
+        write_json(root, f"{PAGES}/{page}/visuals/x/visual.json", make_visual("x", "Existant", 10))
+
+    for bk_id in ("bk1", "bk2"):
+        write_json(root, f"{BOOKMARKS}/{bk_id}.bookmark.json", {
+            "name": bk_id,
+            "displayName": bk_id.upper(),
+            "explorationState": {"activeSection": "main", "sections": {"main": {}}},
+        })
+
+    # Artefacts hors du rapport, jamais lus par les outils
+    os.makedirs(os.path.join(root, "Test.SemanticModel", ".pbi"), exist_ok=True)
+    with open(os.path.join(root, "Test.SemanticModel", ".pbi", "cache.abf"), "wb") as f:
+        f.write(b"\x00\xff" * 16)